@@ -0,0 +1,25 @@
+"""녹화된 영상 일괄 분석
+
+Example:
+    python batch.py sessions/*.mp4 --output analysis --workers 4
+"""
+
+import argparse
+
+from module.batch import run_batch
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline batch analysis of videos.")
+    parser.add_argument("videos", nargs="+", help="recorded video files")
+    parser.add_argument("--output", default="analysis", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="frames per chunk")
+    args = parser.parse_args()
+
+    summaries = run_batch(args.videos, args.output, args.workers, args.chunk_size)
+    for summary in summaries:
+        print(
+            f"{summary['video']}: {summary['frames']} frames "
+            f"({summary['detected']} detected) in {summary['elapsed']:.1f}s "
+            f"-> {summary['output']}"
+        )
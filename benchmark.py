@@ -0,0 +1,164 @@
+"""영상 파일 기반 단계별 지연 시간 측정
+
+Example:
+    python benchmark.py session.mp4 --frames 600
+    python benchmark.py --landmarks
+    python benchmark.py --telemetry
+    python benchmark.py session.mp4 --pose
+    python benchmark.py session.mp4 --preprocess
+    python benchmark.py session.mp4 --startup
+    python benchmark.py session.mp4 --pipeline --busy
+"""
+
+import argparse
+import json
+
+from module.benchmark import (
+    run_benchmark,
+    run_landmark_benchmark,
+    run_pipeline_benchmark,
+    run_pose_benchmark,
+    run_preprocess_benchmark,
+    run_startup_benchmark,
+    run_telemetry_benchmark,
+    format_report,
+)
+
+# Guarded: --pipeline spawns processes that import this file again.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage latency benchmark.")
+    parser.add_argument("videos", nargs="*", help="recorded video files")
+    parser.add_argument("--frames", type=int, default=None, help="max frames per video")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument(
+        "--landmarks", action="store_true", help="compare landmark access methods"
+    )
+    parser.add_argument(
+        "--telemetry",
+        action="store_true",
+        help="measure the per-frame cost of telemetry against the frame budget",
+    )
+    parser.add_argument(
+        "--pose", action="store_true", help="compare head pose methods on the videos"
+    )
+    parser.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="compare preprocessing time and allocations on the videos",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="measure time to window and to first cursor move, using the video as camera",
+    )
+    parser.add_argument(
+        "--no-roi", action="store_true", help="always process the whole frame"
+    )
+    parser.add_argument(
+        "--gate", action="store_true", help="skip Face Mesh on still frames"
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="compare the single-process and multi-process paths on the videos",
+    )
+    parser.add_argument(
+        "--busy",
+        action="store_true",
+        help="with --pipeline, keep a GIL-bound thread busy like the sidebar",
+    )
+    args = parser.parse_args()
+
+    if args.landmarks:
+        result = run_landmark_benchmark()
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"landmark access: legacy {result['legacy_us']:.1f} us/frame, "
+                f"vectorized {result['vectorized_us']:.1f} us/frame "
+                f"({result['saving']:.0%} saved)"
+            )
+
+    if args.telemetry:
+        result = run_telemetry_benchmark()
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"telemetry: {result['per_frame_us']:.1f} us/frame "
+                f"({result['budget_ratio']:.3%} of the frame budget), "
+                f"snapshot {result['snapshot_us']:.0f} us, "
+                f"prometheus {result['prometheus_us']:.0f} us"
+            )
+
+    for video in args.videos:
+        if args.pose:
+            result = run_pose_benchmark(video, args.frames)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print(
+                    f"pose ({result['frames']} frames): "
+                    f"legacy {result['legacy_us']:.1f} us, "
+                    f"pnp cold {result['pnp_cold_us']:.1f} us, "
+                    f"pnp warm {result['pnp_warm_us']:.1f} us, "
+                    f"axes {result['axes_us']:.1f} us per call "
+                    f"(warm/cold max diff {result['warm_cold_max_diff']:.3f} deg)"
+                )
+            continue
+        if args.preprocess:
+            result = run_preprocess_benchmark(video, args.frames or 300)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print(f"preprocess ({result['frames']} frames):")
+                for name in ("legacy", "preallocated", "no_flip"):
+                    print(
+                        f"  {name:<13}{result[name + '_us']:>8.1f} us"
+                        f"{result[name + '_bytes'] / 1024:>10.1f} KiB allocated per frame"
+                    )
+            continue
+        if args.pipeline:
+            result = run_pipeline_benchmark(video, busy=args.busy)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                for name in ("single", "pipeline"):
+                    stat = result[name]
+                    print(
+                        f"{name:<9}{stat['processed']:>6} frames, {stat['fps']:>5.1f} fps, "
+                        f"latency p50 {stat['latency_p50_ms']:.1f} ms, "
+                        f"p95 {stat['latency_p95_ms']:.1f} ms"
+                    )
+                stats = result["pipeline_stats"]
+                print(
+                    f"ring: {stats['written']} written, {stats['processed']} processed, "
+                    f"{stats['skipped']} skipped, {stats['torn']} torn"
+                )
+            continue
+        if args.startup:
+            result = run_startup_benchmark(video)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                for name in ("legacy", "startup"):
+                    marks = sorted(result[name].items(), key=lambda mark: mark[1])
+                    print(
+                        f"{name:<8} "
+                        + ", ".join(
+                            f"{mark} {time * 1000:.0f} ms" for mark, time in marks
+                        )
+                        + (
+                            ""
+                            if "first_move" in result[name]
+                            else " (no cursor move: turn the head in the video)"
+                        )
+                    )
+            continue
+        report = run_benchmark(video, args.frames, not args.no_roi, args.gate)
+        if args.json:
+            print(json.dumps(report))
+        else:
+            print(format_report(report))
+            print()
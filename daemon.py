@@ -0,0 +1,81 @@
+"""사이드바 없이 얼굴 탐지를 실행하는 데몬과 확인용 클라이언트
+
+데몬은 얼굴 각도, 얼굴 탐지 여부, 눈 깜빡임과 얼굴 동작을 Unix 도메인 소켓으로 보내고,
+클라이언트가 보낸 명령(pause, resume, zoom-in, zoom-out, scroll-up, scroll-down)을 받는다.
+
+Example:
+    python daemon.py --camera 0 --rate 30 --size 640x480 --preview
+    python daemon.py --camera session.mp4 --dry-run
+    python daemon.py --watch
+    python daemon.py --send pause
+    python main.py --connect /tmp/facemouse.sock
+"""
+
+import argparse
+import os
+import tempfile
+
+from module.daemon import COMMANDS, run_daemon
+from module.ipc import MSG_EVENT, MSG_FACE, MSG_POSE, EventClient
+
+parser = argparse.ArgumentParser(description="Headless detection daemon.")
+parser.add_argument(
+    "--socket",
+    default=os.path.join(tempfile.gettempdir(), "facemouse.sock"),
+    help="Unix domain socket path",
+)
+parser.add_argument(
+    "--camera", default=None, help="camera index, device path or video file"
+)
+parser.add_argument("--rate", type=float, default=60, help="max frames per second")
+parser.add_argument("--size", default=None, help="camera resolution, e.g. 640x480")
+parser.add_argument("--preview", action="store_true", help="show the preview window")
+parser.add_argument(
+    "--dry-run", action="store_true", help="record input actions instead of sending"
+)
+parser.add_argument(
+    "--watch", action="store_true", help="print events from a running daemon"
+)
+parser.add_argument("--send", choices=COMMANDS, help="send a command to the daemon")
+args = parser.parse_args()
+
+if args.watch or args.send:
+    client = EventClient(args.socket)
+    client.connect()
+    if args.send:
+        client.send_command(args.send)
+    try:
+        while args.watch:
+            for kind, values in client.receive(timeout=1.0):
+                if kind == MSG_POSE:
+                    timestamp, pitch, yaw, roll, directions = values
+                    print(
+                        f"{timestamp:.3f} pose pitch {pitch:+.1f} yaw {yaw:+.1f} "
+                        f"roll {roll:+.1f} directions {directions}"
+                    )
+                elif kind == MSG_EVENT:
+                    print(f"{values[0]:.3f} event {values[1]}")
+                elif kind == MSG_FACE:
+                    print(f"{values[0]:.3f} face {'found' if values[1] else 'lost'}")
+    except (KeyboardInterrupt, ConnectionError):
+        pass
+    finally:
+        client.close()
+else:
+    device = args.camera
+    if device is not None and device.isdigit():
+        device = int(device)
+    mode = None
+    if args.size:
+        width, height = (int(value) for value in args.size.lower().split("x"))
+        mode = {"width": width, "height": height}
+    backend = None
+    if args.dry_run:
+        from module.backend import RecordingBackend
+
+        backend = RecordingBackend(maxlen=1000)
+    stats = run_daemon(args.socket, device, args.rate, mode, args.preview, backend)
+    print(
+        f"served {stats['connected']} clients, sent {stats['sent']} messages "
+        f"({stats['dropped']} dropped), received {stats['commands']} commands"
+    )
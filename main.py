@@ -1,18 +1,46 @@
-import cv2
+import argparse
+from time import perf_counter
 
-from module.function import Process
+START_TIME = perf_counter()
+
+# Only the sidebar is imported here. cv2, mediapipe and the camera are
+# loaded by Startup in the background while the sidebar is shown.
 from module.gui import App
-from module.settings import load_cam_id
 
+# Guarded: --multiprocess workers are spawned and import this file again.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Face mouse control.")
+    parser.add_argument(
+        "--connect",
+        metavar="SOCKET",
+        default=None,
+        help="use a running daemon.py instead of opening the camera",
+    )
+    parser.add_argument(
+        "--multiprocess",
+        action="store_true",
+        help="run camera capture and detection in separate processes",
+    )
+    args = parser.parse_args()
+
+    if args.connect:
+        from module.ipc import EventClient, RemoteProcess
 
-CAM_ID = load_cam_id()
+        remote = RemoteProcess(EventClient(args.connect))
+        app = App(remote.run, remote.suspend, remote.resume)
+        app.wm_attributes("-topmost", 1)
+        app.mainloop()
+        remote.release()
+    else:
+        from module.startup import Startup, load_pipeline
 
-cap = cv2.VideoCapture(CAM_ID)
-process = Process(cap)
+        loader = load_pipeline if args.multiprocess else None
+        startup = Startup(loader, start_time=START_TIME)
+        startup.start()
 
-app = App(process.run)
-app.wm_attributes("-topmost", 1)
-app.mainloop()
+        app = App(startup.run, startup.suspend, startup.resume, startup.render_preview)
+        app.wm_attributes("-topmost", 1)
+        app.after(0, startup.mark, "window")
+        app.mainloop()
 
-cv2.destroyAllWindows()
-cap.release()
+        startup.release()
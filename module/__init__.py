@@ -1,2 +1,30 @@
-__all__ = ["function", "gui", "settings"]
+__all__ = [
+    "backend",
+    "baseline",
+    "batch",
+    "blink",
+    "benchmark",
+    "camera",
+    "capture",
+    "config",
+    "cursor",
+    "daemon",
+    "executor",
+    "filter",
+    "function",
+    "gesture",
+    "gui",
+    "ipc",
+    "motion",
+    "pipeline",
+    "pose",
+    "preview",
+    "ring",
+    "roi",
+    "scheduler",
+    "settings",
+    "startup",
+    "stats",
+    "telemetry",
+]
 __version__ = "0.0.2"
@@ -0,0 +1,359 @@
+"""마우스, 키보드 입력을 보내는 입력 장치(backend).
+
+Controller와 CursorMotion은 InputBackend의 함수만 사용하므로,
+환경에 맞는 구현을 골라 전달할 수 있다.
+
+- XTestBackend: Linux(X11)에서 XTest 확장으로 직접 입력한다. 커서 위치는
+  position()이 query_pointer()로 X 서버에 조회한다.
+- PyAutoGUIBackend: pyautogui를 사용한다. 호출마다 쉬는 시간(PAUSE) 없이 실행한다.
+- RecordingBackend: 입력을 보내지 않고 기록만 한다. 테스트와 벤치마크에 사용한다.
+"""
+
+import os
+import platform
+from collections import deque
+from time import perf_counter
+
+
+class InputBackend(object):
+    """입력 장치의 공통 형식. 동작마다 걸린 시간을 기록한다.
+
+    하위 클래스는 `_move_to`, `_click`, `_double_click`, `_right_click`, `_mouse_down`,
+    `_mouse_up`, `_hotkey`, `_scroll`, `position`, `size`를 구현한다.
+
+    Functions:
+        move_to
+        click
+        double_click
+        right_click
+        mouse_down
+        mouse_up
+        hotkey
+        scroll
+        position
+        size
+        get_latency
+    """
+
+    ACTIONS = (
+        "move_to",
+        "click",
+        "double_click",
+        "right_click",
+        "mouse_down",
+        "mouse_up",
+        "hotkey",
+        "scroll",
+    )
+
+    def __init__(self):
+        # [count, total seconds, max seconds] per action.
+        self.__latency = {action: [0, 0.0, 0.0] for action in self.ACTIONS}
+
+    def _timed(self, action, function, *args):
+        start = perf_counter()
+        function(*args)
+        elapsed = perf_counter() - start
+        stat = self.__latency[action]
+        stat[0] += 1
+        stat[1] += elapsed
+        if elapsed > stat[2]:
+            stat[2] = elapsed
+
+    def move_to(self, x, y):
+        """커서를 (x, y)로 옮긴다."""
+        self._timed("move_to", self._move_to, x, y)
+
+    def click(self):
+        """현재 커서 위치에서 왼쪽 버튼을 클릭한다."""
+        self._timed("click", self._click)
+
+    def double_click(self):
+        """현재 커서 위치에서 왼쪽 버튼을 두 번 클릭한다."""
+        self._timed("double_click", self._double_click)
+
+    def right_click(self):
+        """현재 커서 위치에서 오른쪽 버튼을 클릭한다."""
+        self._timed("right_click", self._right_click)
+
+    def mouse_down(self):
+        """현재 커서 위치에서 왼쪽 버튼을 누른다. (끌기 시작)"""
+        self._timed("mouse_down", self._mouse_down)
+
+    def mouse_up(self):
+        """누른 왼쪽 버튼을 뗀다. (끌기 끝)"""
+        self._timed("mouse_up", self._mouse_up)
+
+    def hotkey(self, *keys):
+        """키를 순서대로 누른 뒤 반대 순서로 뗀다. (예: "ctrl", "+")"""
+        self._timed("hotkey", self._hotkey, *keys)
+
+    def scroll(self, amount):
+        """화면을 스크롤한다. 양수는 위, 음수는 아래."""
+        self._timed("scroll", self._scroll, amount)
+
+    def position(self):
+        """현재 커서 위치 (x, y)를 반환한다."""
+        raise NotImplementedError
+
+    def size(self):
+        """화면 크기 (width, height)를 반환한다."""
+        raise NotImplementedError
+
+    def get_latency(self):
+        """동작별 호출 횟수와 평균, 최대 소요 시간(초)을 반환한다.
+
+        Returns:
+            dict: 동작 이름을 키로 갖는 통계.
+        """
+        return {
+            action: {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "max": maximum,
+            }
+            for action, (count, total, maximum) in self.__latency.items()
+        }
+
+    def _move_to(self, x, y):
+        raise NotImplementedError
+
+    def _click(self):
+        raise NotImplementedError
+
+    def _double_click(self):
+        raise NotImplementedError
+
+    def _right_click(self):
+        raise NotImplementedError
+
+    def _mouse_down(self):
+        raise NotImplementedError
+
+    def _mouse_up(self):
+        raise NotImplementedError
+
+    def _hotkey(self, *keys):
+        raise NotImplementedError
+
+    def _scroll(self, amount):
+        raise NotImplementedError
+
+
+class PyAutoGUIBackend(InputBackend):
+    """pyautogui를 사용하는 입력 장치.
+
+    pyautogui.PAUSE에 의한 호출 후 대기 없이 실행한다.
+    """
+
+    def __init__(self):
+        InputBackend.__init__(self)
+        import pyautogui
+
+        pyautogui.FAILSAFE = False
+        self._pyautogui = pyautogui
+
+    def _move_to(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+    def _click(self):
+        self._pyautogui.click(_pause=False)
+
+    def _double_click(self):
+        self._pyautogui.doubleClick(_pause=False)
+
+    def _right_click(self):
+        self._pyautogui.rightClick(_pause=False)
+
+    def _mouse_down(self):
+        self._pyautogui.mouseDown(_pause=False)
+
+    def _mouse_up(self):
+        self._pyautogui.mouseUp(_pause=False)
+
+    def _hotkey(self, *keys):
+        self._pyautogui.hotkey(*keys, _pause=False)
+
+    def _scroll(self, amount):
+        self._pyautogui.scroll(amount, _pause=False)
+
+    def position(self):
+        return tuple(self._pyautogui.position())
+
+    def size(self):
+        return tuple(self._pyautogui.size())
+
+
+class XTestBackend(InputBackend):
+    """Linux(X11)의 XTest 확장으로 입력을 보내는 입력 장치.
+
+    입력 후에는 응답을 기다리지 않고 요청만 전송(flush)한다.
+    커서 위치는 position을 호출할 때마다 X 서버에 묻는다. (커서 이동을 시작할 때만 호출된다)
+
+    Args:
+        display_name (str): X 디스플레이 이름. None이면 DISPLAY 환경 변수를 사용한다.
+    """
+
+    _KEY_NAMES = {
+        "ctrl": "Control_L",
+        "command": "Super_L",
+        "alt": "Alt_L",
+        "shift": "Shift_L",
+        "+": "plus",
+        "-": "minus",
+    }
+    # Characters typed with shift on a US layout, pressed the same way as pyautogui.
+    _SHIFT_CHARACTERS = set('~!@#$%^&*()_+{}|:"<>?ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+    def __init__(self, display_name=None):
+        InputBackend.__init__(self)
+        # Locks the connection: inputs and pointer queries come from two threads.
+        import Xlib.threaded  # noqa: F401
+        from Xlib import X, XK, display
+        from Xlib.ext import xtest
+
+        self._X = X
+        self._XK = XK
+        self._xtest = xtest
+        self._display = display.Display(display_name)
+        screen = self._display.screen()
+        self._size = (screen.width_in_pixels, screen.height_in_pixels)
+        self._root = screen.root
+
+    def _move_to(self, x, y):
+        self._xtest.fake_input(self._display, self._X.MotionNotify, x=x, y=y)
+        self._display.flush()
+
+    def _button(self, button, count=1, events=None):
+        if events is None:
+            events = (self._X.ButtonPress, self._X.ButtonRelease)
+        for _ in range(count):
+            for event in events:
+                self._xtest.fake_input(self._display, event, button)
+        self._display.flush()
+
+    def _click(self):
+        self._button(1)
+
+    def _double_click(self):
+        self._button(1, 2)
+
+    def _right_click(self):
+        self._button(3)
+
+    def _mouse_down(self):
+        self._button(1, events=(self._X.ButtonPress,))
+
+    def _mouse_up(self):
+        self._button(1, events=(self._X.ButtonRelease,))
+
+    def _keycode(self, key):
+        keysym = self._XK.string_to_keysym(self._KEY_NAMES.get(key, key))
+        return self._display.keysym_to_keycode(keysym)
+
+    def _hotkey(self, *keys):
+        keycodes = []
+        for key in keys:
+            if key in self._SHIFT_CHARACTERS:
+                keycodes.append(self._keycode("shift"))
+            keycodes.append(self._keycode(key))
+        for keycode in keycodes:
+            self._xtest.fake_input(self._display, self._X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            self._xtest.fake_input(self._display, self._X.KeyRelease, keycode)
+        self._display.flush()
+
+    def _scroll(self, amount):
+        # Same as pyautogui on X11: one wheel click per unit.
+        self._button(4 if amount > 0 else 5, abs(int(amount)))
+
+    def position(self):
+        # Queried, not cached, so that manual mouse moves are kept.
+        pointer = self._root.query_pointer()
+        return (pointer.root_x, pointer.root_y)
+
+    def size(self):
+        return self._size
+
+
+class RecordingBackend(InputBackend):
+    """입력을 보내지 않고 기록만 하는 입력 장치.
+
+    Args:
+        size (tuple): 가상 화면 크기.
+        maxlen (int): 보관할 최대 기록 수. None이면 모두 보관한다.
+
+    Example:
+    >>> backend = RecordingBackend()
+    >>> Controller(backend).click()
+    >>> backend.records[-1][0]
+    'click'
+    """
+
+    def __init__(self, size=(1920, 1080), maxlen=None):
+        InputBackend.__init__(self)
+        self._size = size
+        self.__position = (size[0] // 2, size[1] // 2)
+        self.records = deque(maxlen=maxlen)
+
+    def _record(self, action, *args):
+        self.records.append((action, args, perf_counter()))
+
+    def _move_to(self, x, y):
+        self.__position = (x, y)
+        self._record("move_to", x, y)
+
+    def _click(self):
+        self._record("click")
+
+    def _double_click(self):
+        self._record("double_click")
+
+    def _right_click(self):
+        self._record("right_click")
+
+    def _mouse_down(self):
+        self._record("mouse_down")
+
+    def _mouse_up(self):
+        self._record("mouse_up")
+
+    def _hotkey(self, *keys):
+        self._record("hotkey", *keys)
+
+    def _scroll(self, amount):
+        self._record("scroll", amount)
+
+    def position(self):
+        return self.__position
+
+    def size(self):
+        return self._size
+
+
+def load_backend(name=None):
+    """사용할 입력 장치를 만든다.
+
+    Args:
+        name (str): "xtest", "pyautogui", "recording" 중 하나.
+            None이면 X11 환경에서는 XTest를, 그 외에는 pyautogui를 사용한다.
+
+    Returns:
+        InputBackend: 입력 장치.
+    """
+    if name is None:
+        if platform.system() == "Linux" and os.environ.get("DISPLAY"):
+            try:
+                return XTestBackend()
+            except Exception:  # Xlib missing or no XTest: fall back below.
+                pass
+        name = "pyautogui"
+
+    backends = {
+        "xtest": XTestBackend,
+        "pyautogui": PyAutoGUIBackend,
+        "recording": RecordingBackend,
+    }
+    if name not in backends:
+        raise ValueError(f"Unknown input backend: {name}")
+    return backends[name]()
@@ -0,0 +1,184 @@
+import os
+from math import exp, log
+from time import perf_counter
+
+import numpy as np
+
+try:
+    from constant import BASELINE_FILE
+except ImportError:
+    from module.constant import BASELINE_FILE
+
+_DIR = os.path.dirname(os.path.realpath(__file__))
+_BASELINE_FILE = os.path.join(_DIR, BASELINE_FILE)
+
+
+class PoseBaseline(object):
+    """사용자가 화면을 바라볼 때의 얼굴 각도(기준 자세)를 실행 중에 학습한다.
+
+    얼굴이 방향 임계값 안에 있고 최근 평균 각도 근처에 머무는 상태(quiet)가
+    hold_time 이상 이어지면
+    pitch, yaw를 지수 가중 이동 평균(EWMA)으로 반영한다. 자세가 천천히 바뀌어도
+    기준 자세가 따라가므로, 방향은 기준 자세와의 차이로 판단한다.
+    저장하는 값은 기준 각도와 가중치뿐이므로 메모리를 더 쓰지 않는다.
+
+    Args:
+        path (str): 기준 자세를 저장할 파일 경로. None이면 저장하지 않는다.
+        half_life (float): quiet 상태에서 새 자세가 절반만큼 반영되기까지의 시간(초).
+        quiet_range (float): quiet 상태로 볼 최근 평균 각도와의 최대 차이(degree).
+        hold_time (float): quiet 상태가 이어져야 반영을 시작하는 시간(초).
+        max_offset (float): 기준 자세가 0에서 벗어날 수 있는 최대 각도(degree).
+
+    Example:
+    >>> baseline = PoseBaseline()
+    >>> pitch, yaw = baseline.apply(pitch, yaw)
+    >>> baseline.update(raw_pitch, raw_yaw, is_quiet=not directions)
+
+    Functions:
+        apply
+        update
+        lose
+        reset
+        save
+        get_stats
+    """
+
+    def __init__(
+        self,
+        path=_BASELINE_FILE,
+        half_life=30.0,
+        quiet_range=3.0,
+        hold_time=0.5,
+        max_offset=15.0,
+    ):
+        self._path = path
+        self._time_constant = half_life / log(2)
+        self._quiet_range = quiet_range
+        self._recent_time = 0.5  # Time constant of the recent mean (seconds).
+        self._hold_time = hold_time
+        self._max_offset = max_offset
+        self.pitch = 0.0
+        self.yaw = 0.0
+        self.__weight = 0.0
+        self.__recent = None
+        self.__quiet_start = None
+        self.__updates = 0
+        self.__quiet_time = 0.0
+        self.__total_time = 0.0
+        self._load()
+
+    def _load(self):
+        if self._path is None:
+            return
+        try:
+            values = np.load(self._path)
+            pitch, yaw, weight = (float(value) for value in values)
+        except (OSError, EOFError, ValueError, TypeError):
+            return  # No baseline yet: start from the calibrated zero.
+        self.pitch = self._clip(pitch)
+        self.yaw = self._clip(yaw)
+        self.__weight = weight
+
+    def _clip(self, angle):
+        return min(max(angle, -self._max_offset), self._max_offset)
+
+    def apply(self, pitch, yaw):
+        """기준 자세와의 차이를 반환한다.
+
+        Args:
+            pitch (float): 위가 양수인 각도(degree).
+            yaw (float): 오른쪽이 양수인 각도(degree).
+
+        Returns:
+            tuple: 기준 자세를 뺀 (pitch, yaw).
+        """
+        return pitch - self.pitch, yaw - self.yaw
+
+    def update(self, pitch, yaw, is_quiet, now=None):
+        """현재 각도를 받아 quiet 상태라면 기준 자세에 반영한다.
+
+        Args:
+            pitch (float): 위가 양수인 각도(degree). 기준 자세를 빼지 않은 값.
+            yaw (float): 오른쪽이 양수인 각도(degree). 기준 자세를 빼지 않은 값.
+            is_quiet (bool): 방향 임계값 안에 있는지 여부.
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            bool: 기준 자세에 반영했는지 여부.
+        """
+        if now is None:
+            now = perf_counter()
+        recent = self.__recent
+        if recent is None:
+            self.__recent = (pitch, yaw, now)
+            return False
+        dt = now - recent[2]
+        if dt <= 0:
+            return False
+        self.__total_time += dt
+        # A short EWMA tells a still head from frame-to-frame jitter.
+        alpha = 1 - exp(-dt / self._recent_time)
+        recent_pitch = recent[0] + alpha * (pitch - recent[0])
+        recent_yaw = recent[1] + alpha * (yaw - recent[1])
+        self.__recent = (recent_pitch, recent_yaw, now)
+
+        distance = max(abs(pitch - recent_pitch), abs(yaw - recent_yaw))
+        if not is_quiet or distance > self._quiet_range:
+            self.__quiet_start = None
+            return False
+        if self.__quiet_start is None:
+            self.__quiet_start = now
+        if now - self.__quiet_start < self._hold_time:
+            return False
+
+        self.__quiet_time += dt
+        # Time-based EWMA, so the frame rate does not change the half-life.
+        alpha = 1 - exp(-dt / self._time_constant)
+        self.pitch = self._clip(self.pitch + alpha * (pitch - self.pitch))
+        self.yaw = self._clip(self.yaw + alpha * (yaw - self.yaw))
+        self.__weight += dt
+        self.__updates += 1
+        return True
+
+    def reset(self):
+        """학습한 기준 자세를 지운다."""
+        self.pitch = 0.0
+        self.yaw = 0.0
+        self.__weight = 0.0
+        self.__recent = None
+        self.__quiet_start = None
+
+    def lose(self):
+        """얼굴을 놓쳤음을 알린다. 다시 찾은 뒤에는 최근 평균을 새로 계산한다."""
+        self.__recent = None
+        self.__quiet_start = None
+
+    def save(self):
+        """기준 자세를 파일에 저장한다. 다음 실행은 이 값에서 시작한다."""
+        if self._path is None:
+            return
+        temp_path = f"{self._path}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                np.save(
+                    file, np.array([self.pitch, self.yaw, self.__weight], np.float64)
+                )
+            os.replace(temp_path, self._path)
+        except OSError:
+            pass  # Read-only install: learn again next time.
+
+    def get_stats(self):
+        """기준 자세와 학습 통계를 반환한다.
+
+        Returns:
+            dict: 기준 pitch, yaw, 지금까지 반영한 시간(weight, 초),
+            이번 실행에서 반영한 횟수와 quiet 상태였던 시간의 비율.
+        """
+        total = self.__total_time
+        return {
+            "pitch": self.pitch,
+            "yaw": self.yaw,
+            "weight": self.__weight,
+            "updates": self.__updates,
+            "quiet_ratio": self.__quiet_time / total if total else 0.0,
+        }
@@ -0,0 +1,220 @@
+"""녹화된 영상을 일괄 분석해 프레임별 탐지 결과를 .npz 파일로 저장한다.
+
+영상 파일마다 별도 프로세스에서 분석하며, 프로세스마다 Face Mesh 객체를 하나만 만든다.
+Face Mesh는 영상마다 초기화하므로 앞 영상의 추적 상태가 다음 영상에 이어지지 않는다.
+긴 영상도 메모리에 모두 올리지 않도록 일정 프레임 단위(chunk)로 나누어 기록한다.
+"""
+
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import cv2
+import numpy as np
+
+try:
+    from function import Detector
+except ImportError:
+    from module.function import Detector
+
+COLUMNS = {
+    "frame": np.int64,
+    "timestamp": np.float64,
+    "detected": np.bool_,
+    "ear": np.float32,
+    "pitch": np.float32,
+    "yaw": np.float32,
+    "roll": np.float32,
+}
+
+_worker_face_mesh = None  # One Face Mesh per worker process.
+
+
+class ChunkWriter(object):
+    """열(column)별 배열을 chunk 단위로 .npz 파일에 이어서 기록한다.
+
+    각 chunk는 `{column}-{index:05d}` 이름의 배열로 저장되며,
+    load_analysis로 열마다 이어 붙여 읽을 수 있다.
+
+    Functions:
+        append
+        close
+    """
+
+    def __init__(self, path, chunk_size=1024):
+        self._chunk_size = chunk_size
+        self.__zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self.__buffers = {
+            name: np.empty(chunk_size, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        self.__size = 0
+        self.__chunk_index = 0
+
+    def append(self, **values):
+        """한 프레임의 값을 추가한다. chunk가 가득 차면 파일에 기록한다."""
+        for name, buffer in self.__buffers.items():
+            buffer[self.__size] = values[name]
+        self.__size += 1
+        if self.__size == self._chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self.__size == 0:
+            return
+        for name, buffer in self.__buffers.items():
+            with self.__zip.open(f"{name}-{self.__chunk_index:05d}.npy", "w") as f:
+                np.lib.format.write_array(f, buffer[: self.__size])
+        self.__chunk_index += 1
+        self.__size = 0
+
+    def close(self):
+        """남은 값을 기록하고 파일을 닫는다."""
+        self._flush()
+        self.__zip.close()
+
+
+def load_analysis(path):
+    """ChunkWriter로 기록한 파일을 열별 배열로 읽는다.
+
+    Args:
+        path (str): .npz 파일 경로.
+
+    Returns:
+        dict: 열 이름을 키로, 모든 chunk를 이어 붙인 배열을 값으로 갖는 딕셔너리.
+    """
+    with np.load(path) as data:
+        keys = sorted(data.files)
+        return {
+            name: np.concatenate(
+                [data[key] for key in keys if key.rsplit("-", 1)[0] == name]
+                or [np.empty(0, dtype=dtype)]
+            )
+            for name, dtype in COLUMNS.items()
+        }
+
+
+def analyze_video(video_path, output_path, chunk_size=1024):
+    """영상 한 개를 분석해 프레임별 EAR, 얼굴 각도, 탐지 여부, 시각을 기록한다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        output_path (str): 결과를 저장할 .npz 파일 경로.
+        chunk_size (int): 한 번에 기록할 프레임 수.
+
+    Returns:
+        dict: 분석한 프레임 수, 탐지된 프레임 수, 소요 시간.
+    """
+    global _worker_face_mesh
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video: {video_path}")
+    if _worker_face_mesh is not None:
+        # Tracking must not carry the last face of the previous video over.
+        _worker_face_mesh.reset()
+
+    writer = ChunkWriter(output_path, chunk_size)
+    detector = None
+    frame_index = 0
+    detected_count = 0
+    start = perf_counter()
+    try:
+        while True:
+            success, frame = cap.read()
+            if not success:
+                break
+            timestamp = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+            if detector is None:
+                detector = Detector(frame, face_mesh=_worker_face_mesh, use_roi=False)
+                _worker_face_mesh = detector._face_mesh
+
+            _, rgb_frame = detector.convert_frame(frame)
+            is_detected = detector.detect_landmark(rgb_frame)
+            if is_detected:
+                ear = detector.get_both_eyes_ear()
+                pitch, yaw, roll = detector.get_face_angles(filtered=False)
+                detected_count += 1
+            else:
+                ear = pitch = yaw = roll = np.nan
+
+            writer.append(
+                frame=frame_index,
+                timestamp=timestamp,
+                detected=is_detected,
+                ear=ear,
+                pitch=pitch,
+                yaw=yaw,
+                roll=roll,
+            )
+            frame_index += 1
+    finally:
+        writer.close()
+        cap.release()
+
+    return {
+        "video": video_path,
+        "output": output_path,
+        "frames": frame_index,
+        "detected": detected_count,
+        "elapsed": perf_counter() - start,
+    }
+
+
+def _output_names(video_paths):
+    # File name without extension, or the path below the common folder when
+    # names collide (a/session.mp4, b/session.mp4 -> a_session, b_session).
+    stems = [os.path.splitext(os.path.abspath(path))[0] for path in video_paths]
+    names = [os.path.basename(stem) for stem in stems]
+    duplicated = [i for i, name in enumerate(names) if names.count(name) > 1]
+    if duplicated:
+        root = os.path.commonpath([os.path.dirname(stems[i]) for i in duplicated])
+        for i in duplicated:
+            names[i] = os.path.relpath(stems[i], root).replace(os.sep, "_")
+    # The same file listed twice still collides: number them.
+    seen = {}
+    for i, name in enumerate(names):
+        if name in seen:
+            seen[name] += 1
+            names[i] = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+    return [name + ".npz" for name in names]
+
+
+def run_batch(video_paths, output_dir, workers=None, chunk_size=1024):
+    """여러 영상을 프로세스 풀에서 병렬로 분석한다.
+
+    결과 파일 이름은 영상 파일 이름을 따른다. 다른 폴더의 영상끼리 이름이 겹치면
+    공통 폴더 아래의 경로를 이름으로 사용한다. (a/session.mp4 -> a_session.npz)
+
+    Args:
+        video_paths (list): 영상 파일 경로 목록.
+        output_dir (str): 결과 파일을 저장할 폴더.
+        workers (int): 프로세스 수. None이면 CPU 코어 수.
+        chunk_size (int): 한 번에 기록할 프레임 수.
+
+    Returns:
+        list: 영상별 analyze_video 반환값.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    output_paths = [
+        os.path.join(output_dir, name) for name in _output_names(video_paths)
+    ]
+    if workers is None:
+        workers = min(len(video_paths), os.cpu_count() or 1)
+
+    if workers <= 1:
+        return [
+            analyze_video(video, output, chunk_size)
+            for video, output in zip(video_paths, output_paths)
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                analyze_video,
+                video_paths,
+                output_paths,
+                [chunk_size] * len(video_paths),
+            )
+        )
@@ -0,0 +1,656 @@
+"""녹화된 영상으로 프레임 처리 단계별 지연 시간을 측정한다.
+
+카메라나 디스플레이 없이 CPU만 있는 환경에서도 실행할 수 있다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from time import perf_counter, sleep
+
+import cv2
+import numpy as np
+
+try:
+    from backend import RecordingBackend
+    from baseline import PoseBaseline
+    from capture import FrameGrabber
+    from constant import NOMINAL_FRAME_RATE
+    from function import Detector, Controller, Process
+    from motion import MotionGate
+    from pipeline import PacedCapture, PipelineProcess
+    from pose import PoseEngine
+    from telemetry import Telemetry
+except ImportError:
+    from module.backend import RecordingBackend
+    from module.baseline import PoseBaseline
+    from module.capture import FrameGrabber
+    from module.constant import NOMINAL_FRAME_RATE
+    from module.function import Detector, Controller, Process
+    from module.motion import MotionGate
+    from module.pipeline import PacedCapture, PipelineProcess
+    from module.pose import PoseEngine
+    from module.telemetry import Telemetry
+
+STAGES = (
+    "read",
+    "resize/flip",
+    "cvtColor",
+    "gate",
+    "facemesh",
+    "pose",
+    "ear",
+    "gesture",
+    "input",
+)
+
+
+class StageTimer(object):
+    """단계별 소요 시간을 모아 통계를 계산한다.
+
+    Functions:
+        add
+        summary
+    """
+
+    def __init__(self, stages=STAGES):
+        self._stages = stages
+        self.__samples = {stage: [] for stage in stages}
+
+    def add(self, stage, seconds):
+        """단계의 소요 시간을 추가한다.
+
+        Args:
+            stage (str): 단계 이름.
+            seconds (float): 소요 시간(초).
+        """
+        self.__samples[stage].append(seconds)
+
+    def summary(self):
+        """단계별 p50/p95/p99 지연 시간(ms)과 처리량(회/초)을 계산한다.
+
+        Returns:
+            dict: 단계 이름을 키로 갖는 통계.
+        """
+        result = {}
+        for stage in self._stages:
+            samples = np.array(self.__samples[stage], dtype=np.float64)
+            if samples.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000
+            result[stage] = {
+                "count": int(samples.size),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "throughput": float(samples.size / samples.sum()),
+            }
+        return result
+
+
+def run_benchmark(video_path, max_frames=None, use_roi=True, use_gate=False):
+    """영상 파일의 프레임을 탐지 과정 전체에 통과시키며 단계별 시간을 측정한다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        max_frames (int): 측정할 최대 프레임 수. None이면 영상 끝까지.
+        use_roi (bool): 얼굴 주변 영역만 처리할 지 여부.
+        use_gate (bool): 움직임이 없는 프레임의 탐지를 생략할 지 여부.
+
+    Returns:
+        dict: 단계별 통계와 전체 처리 정보.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video: {video_path}")
+
+    timer = StageTimer()
+    controller = Controller(backend=RecordingBackend(maxlen=1000))
+    detector = None
+    gate = MotionGate() if use_gate else None
+    is_detected = False
+    frame_count = 0
+    detected_count = 0
+    start = perf_counter()
+    try:
+        while max_frames is None or frame_count < max_frames:
+            t0 = perf_counter()
+            success, frame = cap.read()
+            t1 = perf_counter()
+            if not success:
+                break
+            timer.add("read", t1 - t0)
+            frame_count += 1
+
+            if detector is None:
+                detector = Detector(frame, use_roi=use_roi)
+
+            t0 = perf_counter()
+            bgr_frame = detector._resize_frame(frame)
+            t1 = perf_counter()
+            rgb_frame = detector._convert_color(bgr_frame)
+            t2 = perf_counter()
+            timer.add("resize/flip", t1 - t0)
+            timer.add("cvtColor", t2 - t1)
+            if gate is not None:
+                should_detect = gate.should_detect(bgr_frame, detector.get_face_box())
+                t3 = perf_counter()
+                timer.add("gate", t3 - t2)
+                t2 = t3
+            else:
+                should_detect = True
+            if should_detect:
+                is_detected = detector.detect_landmark(rgb_frame)
+                timer.add("facemesh", perf_counter() - t2)
+            if not is_detected:
+                continue
+            detected_count += 1
+
+            t0 = perf_counter()
+            directions = detector.get_face_direction()
+            t1 = perf_counter()
+            event = detector.update_eye_event()
+            t2 = perf_counter()
+            events = detector.update_gestures()
+            t3 = perf_counter()
+            controller.move_cursor_by_face(directions)
+            if event is not None:
+                events.append(event)
+            for event in events:
+                controller.handle_gesture(event)
+            t4 = perf_counter()
+            timer.add("pose", t1 - t0)
+            timer.add("ear", t2 - t1)
+            timer.add("gesture", t3 - t2)
+            timer.add("input", t4 - t3)
+    finally:
+        cap.release()
+        controller.release()
+    elapsed = perf_counter() - start
+
+    return {
+        "video": video_path,
+        "frames": frame_count,
+        "detected": detected_count,
+        "elapsed": elapsed,
+        "fps": frame_count / elapsed if elapsed > 0 else 0.0,
+        "stages": timer.summary(),
+        "roi": detector.get_roi_stats() if detector is not None else None,
+        "gate": gate.get_stats() if gate is not None else None,
+        "backend": controller.get_input_latency(),
+        "actions": controller.get_action_stats(),
+    }
+
+
+def _legacy_landmark_access(landmarks, w, h, face_ids, eye_ids):
+    # Per-landmark protobuf access as done before vectorization.
+    def point(id):
+        landmark = landmarks[id]
+        return [int(landmark.x * w), int(landmark.y * h), landmark.z]
+
+    def single_eye_ear(ids):
+        ear_ys = [
+            abs(int(landmarks[a].y * h) - int(landmarks[b].y * h)) for a, b in ids[:2]
+        ]
+        a, b = ids[2]
+        ear_x = abs(int(landmarks[a].x * w) - int(landmarks[b].x * w))
+        return np.sum(ear_ys) / (2 * ear_x)
+
+    face_points = np.array([point(id) for id in face_ids], dtype=np.float64)
+    ear = np.mean([single_eye_ear(ids) for ids in eye_ids])
+    return face_points, ear
+
+
+def _random_landmarks(rng, size=478):
+    from mediapipe.framework.formats import landmark_pb2
+
+    landmarks = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in zip(rng.random(size), rng.random(size), rng.random(size) - 0.5):
+        landmarks.landmark.add(x=x, y=y, z=z * 0.1)
+    return landmarks.landmark
+
+
+def run_landmark_benchmark(iterations=2000, seed=0):
+    """랜드마크 접근 방식(기존 방식, 벡터화 방식)의 프레임당 시간을 비교한다.
+
+    무작위 랜드마크로 두 방식의 결과가 같은지 확인한 후 시간을 측정한다.
+
+    Args:
+        iterations (int): 측정 반복 횟수.
+        seed (int): 무작위 랜드마크 생성 시드.
+
+    Returns:
+        dict: 방식별 프레임당 평균 시간(us)과 절약 비율.
+    """
+    rng = np.random.default_rng(seed)
+    detector = Detector(np.zeros((480, 640, 3), dtype=np.uint8))
+    args = (detector._w, detector._h, detector._face_indexs, detector._eye_indexs)
+    samples = [_random_landmarks(rng) for _ in range(16)]
+
+    for landmarks in samples:
+        face_points, ear = _legacy_landmark_access(landmarks, *args)
+        detector._update_landmarks(landmarks)
+        if not (
+            np.array_equal(face_points, detector._get_face_points())
+            and ear == detector.get_both_eyes_ear()
+        ):
+            raise AssertionError("Vectorized landmark access does not match.")
+
+    def vectorized(landmarks):
+        detector._update_landmarks(landmarks)
+        detector.get_both_eyes_ear()
+        return detector._get_face_points()
+
+    result = {}
+    for name, function in (
+        ("legacy", lambda landmarks: _legacy_landmark_access(landmarks, *args)),
+        ("vectorized", vectorized),
+    ):
+        start = perf_counter()
+        for i in range(iterations):
+            function(samples[i % len(samples)])
+        result[f"{name}_us"] = (perf_counter() - start) / iterations * 1e6
+    result["saving"] = 1 - result["vectorized_us"] / result["legacy_us"]
+    return result
+
+
+def run_telemetry_benchmark(iterations=20000, frame_rate=NOMINAL_FRAME_RATE):
+    """프레임마다 수행하는 Telemetry 기록의 소요 시간을 프레임 예산과 비교한다.
+
+    Process와 Detector가 한 프레임에 수행하는 것과 같은 시각 측정, count, observe,
+    check 호출을 반복한다.
+
+    Args:
+        iterations (int): 측정 반복 횟수.
+        frame_rate (float): 프레임 예산을 정하는 초당 프레임 수.
+
+    Returns:
+        dict: 프레임당 기록 시간(us), 프레임 예산 대비 비율,
+        snapshot과 Prometheus 텍스트를 만드는 시간(us).
+    """
+    telemetry = Telemetry()
+    for name in ("capture", "scheduler", "gate", "actions", "settings"):
+        telemetry.add_collector(name, lambda: {"value": 0, "ratio": 0.5})
+
+    start = perf_counter()
+    for _ in range(iterations):
+        begin = perf_counter()
+        telemetry.count("frames")
+        telemetry.observe("frame_age", 0.004)
+        stage = perf_counter()
+        telemetry.observe("preprocess", perf_counter() - stage)
+        stage = perf_counter()
+        telemetry.observe("facemesh", perf_counter() - stage)
+        telemetry.count("faces_found")
+        stage = perf_counter()
+        telemetry.observe("direction", perf_counter() - stage)
+        telemetry.observe("frame", perf_counter() - begin)
+        telemetry.check()
+    per_frame = (perf_counter() - start) / iterations
+
+    result = {
+        "per_frame_us": per_frame * 1e6,
+        "budget_ratio": per_frame * frame_rate,
+    }
+    for name, function in (
+        ("snapshot", telemetry.snapshot),
+        ("prometheus", telemetry.to_prometheus),
+    ):
+        start = perf_counter()
+        for _ in range(100):
+            function()
+        result[f"{name}_us"] = (perf_counter() - start) / 100 * 1e6
+    return result
+
+
+def _legacy_convert_frame(frame, w, h):
+    # Allocates new images at every step, as done before preallocation.
+    bgr_frame = cv2.flip(cv2.resize(frame, (w, h)), 1)
+    rgb_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
+    return bgr_frame, rgb_frame
+
+
+def run_preprocess_benchmark(video_path, max_frames=300):
+    """전처리 방식별 프레임당 시간과 메모리 할당량을 비교한다.
+
+    기존 방식(매번 새 이미지), 미리 할당한 버퍼를 쓰는 방식, 좌우반전을 생략하는 방식을
+    같은 프레임으로 측정한다. 할당량은 tracemalloc으로 측정한 전처리 중 최대 증가량이다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        max_frames (int): 사용할 최대 프레임 수. None이면 영상 끝까지.
+
+    Returns:
+        dict: 방식별 프레임당 평균 시간(us)과 평균 할당량(byte).
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video: {video_path}")
+
+    frames = []
+    try:
+        while max_frames is None or len(frames) < max_frames:
+            success, frame = cap.read()
+            if not success:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+    if not frames:
+        raise ValueError(f"No frame in video: {video_path}")
+
+    mirrored = Detector(frames[0], use_roi=False)
+    unmirrored = Detector(frames[0], use_roi=False, flip_frame=False)
+    w, h = mirrored._w, mirrored._h
+    # Warm up so that buffers allocated once per resolution are not counted.
+    mirrored.convert_frame(frames[0])
+    unmirrored.convert_frame(frames[0])
+
+    result = {"video": video_path, "frames": len(frames)}
+    for name, function in (
+        ("legacy", lambda frame: _legacy_convert_frame(frame, w, h)),
+        ("preallocated", mirrored.convert_frame),
+        ("no_flip", unmirrored.convert_frame),
+    ):
+        start = perf_counter()
+        for frame in frames:
+            function(frame)
+        result[f"{name}_us"] = (perf_counter() - start) / len(frames) * 1e6
+
+        allocated = 0
+        tracemalloc.start()
+        try:
+            for frame in frames:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                function(frame)
+                allocated += tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+        result[f"{name}_bytes"] = allocated / len(frames)
+    return result
+
+
+def _legacy_face_angles(object_points, w, h):
+    # Cold solvePnP on the landmarks themselves, as done before PoseEngine.
+    cam_matrix = np.array([[w, 0, h / 2], [0, w, h / 2], [0, 0, 1]], dtype=np.int32)
+    dist_matrix = np.zeros((4, 1), dtype=np.float64)
+    image_points = np.ascontiguousarray(object_points[:, :2])
+    _, rotation_vector, _ = cv2.solvePnP(
+        object_points, image_points, cam_matrix, dist_matrix
+    )
+    rotation_matrix, _ = cv2.Rodrigues(rotation_vector)
+    angles, *_ = cv2.RQDecomp3x3(rotation_matrix)
+    return [angle * 360 for angle in angles]
+
+
+def run_pose_benchmark(video_path, max_frames=None, repeat=10):
+    """얼굴 각도 계산 방식별 호출당 시간을 비교한다.
+
+    영상에서 탐지한 얼굴 랜드마크를 모은 뒤, 같은 랜드마크로 기존 방식(cold solvePnP),
+    PoseEngine의 "pnp"(이전 값에서 시작, 매번 처음부터 시작), "axes"를 측정한다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        max_frames (int): 사용할 최대 프레임 수. None이면 영상 끝까지.
+        repeat (int): 랜드마크 전체를 반복해 측정할 횟수.
+
+    Returns:
+        dict: 방식별 호출당 평균 시간(us)과, 이전 값에서 시작한 "pnp"와
+        처음부터 시작한 "pnp"의 최대 각도 차이(degree).
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video: {video_path}")
+
+    detector = None
+    samples = []
+    try:
+        while max_frames is None or len(samples) < max_frames:
+            success, frame = cap.read()
+            if not success:
+                break
+            if detector is None:
+                detector = Detector(frame, use_roi=False)
+            _, rgb_frame = detector.convert_frame(frame)
+            if detector.detect_landmark(rgb_frame):
+                samples.append(detector._get_face_points().copy())
+    finally:
+        cap.release()
+    if not samples:
+        raise ValueError(f"No face detected in video: {video_path}")
+
+    w, h = detector._w, detector._h
+    pose_samples = [points * (1, 1, w) for points in samples]
+    warm = PoseEngine(w, h, "pnp")
+    cold = PoseEngine(w, h, "pnp")
+    axes = PoseEngine(w, h, "axes")
+
+    def cold_pnp(points):
+        cold.reset()
+        return cold.estimate(points)
+
+    # Warm and cold starts should converge to the same pose.
+    max_difference = max(
+        np.abs(warm.estimate(points) - cold_pnp(points)).max()
+        for points in pose_samples
+    )
+
+    result = {"video": video_path, "frames": len(samples)}
+    for name, function, inputs in (
+        ("legacy", lambda points: _legacy_face_angles(points, w, h), samples),
+        ("pnp_cold", cold_pnp, pose_samples),
+        ("pnp_warm", warm.estimate, pose_samples),
+        ("axes", axes.estimate, pose_samples),
+    ):
+        start = perf_counter()
+        for _ in range(repeat):
+            for points in inputs:
+                function(points)
+        result[f"{name}_us"] = (perf_counter() - start) / (repeat * len(inputs)) * 1e6
+    result["warm_cold_max_diff"] = float(max_difference)
+    return result
+
+
+def run_startup_benchmark(video_path, timeout=10.0):
+    """시작 과정을 새 인터프리터에서 실행해 단계별 시간을 비교한다.
+
+    모든 준비 후 사이드바를 띄우던 기존 순서와 Startup의 순서를 각각 측정한다.
+    import 시간이 포함되도록 매번 새 프로세스에서 실행하며, 영상 파일을 카메라로 사용한다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        timeout (float): 첫 커서 이동을 기다릴 최대 시간(초).
+
+    Returns:
+        dict: 순서별(legacy, startup) 단계 이름과 시작부터 걸린 시간(초).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    result = {"video": video_path}
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep the probe of the video file out of the real camera profile.
+        profile_path = os.path.join(directory, "camera.json")
+        for name, legacy in (("legacy", True), ("startup", False)):
+            code = (
+                "import json\n"
+                "from module.startup import measure_startup\n"
+                f"print(json.dumps(measure_startup({video_path!r}, {legacy}, "
+                f"{timeout!r}, {profile_path!r})))"
+            )
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result[name] = json.loads(output.strip().splitlines()[-1])
+    return result
+
+
+class _TimedGrabber(FrameGrabber):
+    # Keeps the capture time of the last consumed frame for end-to-end latency.
+    consumed = None
+
+    def read_with_timestamp(self):
+        frame, timestamp = super().read_with_timestamp()
+        if frame is not None:
+            self.consumed = timestamp
+        return frame, timestamp
+
+
+def _busy_loop(stopped):
+    # Pure Python work holding the GIL, like Tk and the cursor thread.
+    while not stopped.is_set():
+        sum(range(1000))
+
+
+def _measure_runs(process, seconds, get_latency, busy):
+    stopped = threading.Event()
+    if busy:
+        threading.Thread(target=_busy_loop, args=(stopped,), daemon=True).start()
+    latencies = []
+    start = perf_counter()
+    try:
+        while perf_counter() - start < seconds:
+            delay = process.run(None, False, True)
+            latency = get_latency()
+            if latency is not None:
+                latencies.append(latency)
+            sleep(max(delay or 1, 1) / 1000)
+    finally:
+        stopped.set()
+    elapsed = perf_counter() - start
+    latencies = np.array(latencies) * 1000
+    p50, p95 = np.percentile(latencies, [50, 95]) if latencies.size else (0.0, 0.0)
+    return {
+        "processed": int(latencies.size),
+        "fps": latencies.size / elapsed,
+        "latency_p50_ms": float(p50),
+        "latency_p95_ms": float(p95),
+    }
+
+
+def run_pipeline_benchmark(video_path, seconds=10.0, rate=30, busy=False):
+    """한 프로세스에서 처리하는 Process와 여러 프로세스로 나눈 PipelineProcess를 비교한다.
+
+    영상을 rate FPS의 카메라처럼 반복해서 읽으며, 처리한 프레임 수와
+    촬영부터 결과 처리까지의 지연 시간을 측정한다.
+
+    Args:
+        video_path (str): 영상 파일 경로.
+        seconds (float): 방식별 측정 시간(초).
+        rate (float): 카메라로 가정할 초당 프레임 수.
+        busy (bool): 이 프로세스에서 GIL을 점유하는 스레드(UI 부하)를 함께 실행할 지 여부.
+
+    Returns:
+        dict: 방식별(single, pipeline) 처리 FPS와 p50/p95 지연 시간(ms),
+        PipelineProcess의 프로세스 사이 통계(pipeline_stats).
+    """
+    result = {"video": video_path, "rate": rate, "busy": busy}
+
+    cap = cv2.VideoCapture(video_path)
+    success, frame = cap.read()
+    cap.release()
+    if not success:
+        raise RuntimeError(f"Cannot read video: {video_path}")
+    detector = Detector(np.zeros_like(frame))
+    detector.warm_up()
+    grabber = _TimedGrabber(PacedCapture(video_path, rate))
+    grabber.start()
+    process = Process(
+        grabber,
+        backend=RecordingBackend(),
+        detector=detector,
+        baseline=PoseBaseline(path=None),
+    )
+    last = {"timestamp": None}
+
+    def single_latency():
+        timestamp = grabber.consumed
+        if timestamp is None or timestamp == last["timestamp"]:
+            return None
+        last["timestamp"] = timestamp
+        return perf_counter() - timestamp
+
+    try:
+        result["single"] = _measure_runs(process, seconds, single_latency, busy)
+    finally:
+        process.release()
+
+    pipeline = PipelineProcess(video_path, pace=rate, backend=RecordingBackend())
+    last["processed"] = 0
+
+    def pipeline_latency():
+        processed = pipeline.get_pipeline_stats()["processed"]
+        if processed == last["processed"]:
+            return None
+        last["processed"] = processed
+        return pipeline.get_frame_age()
+
+    try:
+        result["pipeline"] = _measure_runs(pipeline, seconds, pipeline_latency, busy)
+        result["pipeline_stats"] = pipeline.get_pipeline_stats()
+    finally:
+        pipeline.release()
+    return result
+
+
+def format_report(report):
+    """측정 결과를 표 형식의 문자열로 만든다.
+
+    Args:
+        report (dict): run_benchmark의 반환값.
+
+    Returns:
+        str: 출력할 문자열.
+    """
+    lines = [
+        f"video: {report['video']}",
+        f"frames: {report['frames']} (detected {report['detected']}), "
+        f"{report['fps']:.1f} fps end-to-end",
+        f"{'stage':<12}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'ops/s':>10}",
+    ]
+    for stage, stat in report["stages"].items():
+        lines.append(
+            f"{stage:<12}{stat['count']:>8}{stat['p50_ms']:>10.3f}"
+            f"{stat['p95_ms']:>10.3f}{stat['p99_ms']:>10.3f}"
+            f"{stat['throughput']:>10.1f}"
+        )
+    roi = report.get("roi")
+    if roi:
+        reacquire = roi["mean_reacquire_time"]
+        lines.append(
+            f"roi: {roi['roi_frames']} cropped / {roi['full_frames']} full frames, "
+            f"{roi['pixel_saving']:.0%} pixels saved, "
+            f"{roi['reacquired']} reacquired"
+            + (f" (mean {reacquire * 1000:.1f} ms)" if reacquire is not None else "")
+        )
+    for action, stat in (report.get("backend") or {}).items():
+        if stat["count"]:
+            lines.append(
+                f"backend {action}: {stat['count']} calls, "
+                f"mean {stat['mean'] * 1e6:.1f} us, max {stat['max'] * 1e6:.1f} us"
+            )
+    actions = report.get("actions")
+    if actions and actions["submitted"]:
+        lines.append(
+            f"actions: {actions['executed']} executed, "
+            f"{actions['coalesced']} coalesced, {actions['dropped']} dropped, "
+            f"max depth {actions['max_depth']}, "
+            f"mean latency {actions['mean_latency'] * 1000:.2f} ms, "
+            f"max {actions['max_latency'] * 1000:.2f} ms"
+        )
+    gate = report.get("gate")
+    if gate:
+        lines.append(
+            f"gate: {gate['skipped']} of {gate['checked']} frames skipped "
+            f"({gate['skip_ratio']:.0%}), {gate['moved']} moved, "
+            f"{gate['forced']} forced, max stale {gate['max_stale'] * 1000:.1f} ms"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,213 @@
+"""프레임 촬영 시각을 기준으로 눈 깜빡임과 한쪽 눈 깜빡임(wink)을 판단한다.
+
+프레임 수가 아니라 시간으로 판단하므로 처리 속도가 바뀌어도 같은 동작에 같은 결과를 낸다.
+"""
+
+BLINK = "blink"
+WINK_LEFT = "wink_left"
+WINK_RIGHT = "wink_right"
+
+
+class EyeState(object):
+    """한쪽 눈이 감겼는지를 이력 현상(hysteresis)을 두고 판단한다.
+
+    EAR이 close_threshold 이하가 되면 감긴 것으로, open_threshold 이상이 되면
+    뜬 것으로 본다. 두 값 사이에서는 이전 상태를 유지한다.
+
+    Functions:
+        update
+        get_closed_time
+    """
+
+    def __init__(self):
+        self.is_closed = False
+        self.closed_since = None
+
+    def update(self, ear, timestamp, close_threshold, open_threshold):
+        """EAR을 받아 상태를 갱신한다.
+
+        Args:
+            ear (float): 눈의 EAR.
+            timestamp (float): 프레임 촬영 시각(초).
+            close_threshold (float): 감긴 것으로 볼 EAR.
+            open_threshold (float): 뜬 것으로 볼 EAR.
+        """
+        if not self.is_closed and ear <= close_threshold:
+            self.is_closed = True
+            self.closed_since = timestamp
+        elif self.is_closed and ear >= open_threshold:
+            self.is_closed = False
+            self.closed_since = None
+
+    def get_closed_time(self, timestamp):
+        """감긴 상태가 이어진 시간을 반환한다.
+
+        Args:
+            timestamp (float): 현재 프레임 촬영 시각(초).
+
+        Returns:
+            float: 감긴 시간(초). 떠 있다면 0.
+        """
+        return timestamp - self.closed_since if self.is_closed else 0.0
+
+
+class BlinkDetector(object):
+    """두 눈의 EAR과 촬영 시각으로 깜빡임(blink), 윙크(wink_left, wink_right)를 찾는다.
+
+    - blink: 두 눈이 함께 blink_time 이상 감겨 있을 때.
+    - wink_left, wink_right: 다른 눈을 뜬 채로 한쪽 눈만 wink_time 이상 감겨 있을 때.
+      (사용자 기준 왼쪽, 오른쪽 눈)
+
+    한 번 감은 동안에는 하나의 동작만 발생하며, 두 눈을 모두 뜬 뒤 refractory가 지나야
+    다음 동작을 판단한다. 프레임이 빠져도 시간으로 판단하므로 감은 시간이 줄지 않으며,
+    max_gap보다 오래 프레임이 없으면(얼굴을 놓친 경우) 상태를 처음부터 다시 판단한다.
+
+    Args:
+        ear_threshold (float): 눈이 감긴 것으로 볼 EAR.
+        blink_time (float): 깜빡임으로 볼 최소 시간(초).
+        wink_time (float): 윙크로 볼 최소 시간(초). None이면 blink_time과 같다.
+        open_ratio (float): 눈을 다시 뜬 것으로 볼 EAR의 ear_threshold 대비 비율.
+        refractory (float): 동작 후 다음 동작을 판단하지 않는 시간(초).
+        max_gap (float): 상태를 유지할 최대 프레임 간격(초).
+
+    Example:
+    >>> detector = BlinkDetector(0.2, blink_time=0.25)
+    >>> detector.update(0.1, 0.1, timestamp=0.0)
+    >>> detector.update(0.1, 0.1, timestamp=0.3)
+    'blink'
+
+    Functions:
+        configure
+        update
+        is_eye_closed
+        reset
+        get_stats
+    """
+
+    def __init__(
+        self,
+        ear_threshold=0.2,
+        blink_time=0.25,
+        wink_time=None,
+        open_ratio=1.15,
+        refractory=0.3,
+        max_gap=0.3,
+    ):
+        self._open_ratio = open_ratio
+        self._refractory = refractory
+        self._max_gap = max_gap
+        self.configure(ear_threshold, blink_time, wink_time)
+        self.__eyes = (EyeState(), EyeState())
+        self.__prev_time = None
+        self.__is_fired = False
+        self.__ready_time = None
+        self.__events = {BLINK: 0, WINK_LEFT: 0, WINK_RIGHT: 0}
+
+    def configure(self, ear_threshold, blink_time, wink_time=None):
+        """판단 기준을 바꾼다. 진행 중인 상태는 유지한다.
+
+        Args:
+            ear_threshold (float): 눈이 감긴 것으로 볼 EAR.
+            blink_time (float): 깜빡임으로 볼 최소 시간(초).
+            wink_time (float): 윙크로 볼 최소 시간(초). None이면 blink_time과 같다.
+        """
+        self._close_threshold = ear_threshold
+        self._open_threshold = ear_threshold * self._open_ratio
+        self._blink_time = blink_time
+        self._wink_time = blink_time if wink_time is None else wink_time
+
+    def update(self, left_ear, right_ear, timestamp):
+        """한 프레임의 EAR을 받아 동작이 일어났는지 판단한다.
+
+        Args:
+            left_ear (float): 사용자 기준 왼쪽 눈의 EAR.
+            right_ear (float): 사용자 기준 오른쪽 눈의 EAR.
+            timestamp (float): 프레임 촬영 시각(초). 이전보다 크지 않으면 무시한다.
+
+        Returns:
+            str: "blink", "wink_left", "wink_right" 중 하나. 동작이 없다면 None.
+        """
+        prev_time = self.__prev_time
+        if prev_time is not None and timestamp <= prev_time:
+            return None  # The same frame again (e.g. skipped by the motion gate).
+        if prev_time is not None and timestamp - prev_time > self._max_gap:
+            self.reset()
+        self.__prev_time = timestamp
+
+        left, right = self.__eyes
+        left.update(left_ear, timestamp, self._close_threshold, self._open_threshold)
+        right.update(right_ear, timestamp, self._close_threshold, self._open_threshold)
+
+        if not (left.is_closed or right.is_closed):
+            if self.__is_fired:
+                # Debounce: wait a little after reopening before the next action.
+                self.__is_fired = False
+                self.__ready_time = timestamp + self._refractory
+            return None
+        if self.__is_fired or (
+            self.__ready_time is not None and timestamp < self.__ready_time
+        ):
+            return None
+
+        event = None
+        if left.is_closed and right.is_closed:
+            # Both closed: timed from when the second eye closed.
+            both_time = timestamp - max(left.closed_since, right.closed_since)
+            if both_time >= self._blink_time:
+                event = BLINK
+        elif left.get_closed_time(timestamp) >= self._wink_time:
+            event = WINK_LEFT
+        elif right.get_closed_time(timestamp) >= self._wink_time:
+            event = WINK_RIGHT
+
+        if event is not None:
+            self.__is_fired = True
+            self.__events[event] += 1
+        return event
+
+    def is_eye_closed(self):
+        """마지막 프레임에서 한쪽 눈이라도 감겨 있었는지 반환한다.
+
+        Returns:
+            bool: 감긴 눈이 있는지 여부.
+        """
+        left, right = self.__eyes
+        return left.is_closed or right.is_closed
+
+    def reset(self):
+        """두 눈의 상태를 지운다."""
+        self.__eyes = (EyeState(), EyeState())
+        self.__prev_time = None
+        self.__is_fired = False
+        self.__ready_time = None
+
+    def get_stats(self):
+        """동작별 발생 횟수를 반환한다.
+
+        Returns:
+            dict: 동작 이름과 횟수.
+        """
+        return dict(self.__events)
+
+
+def detect_events(samples, **kwargs):
+    """촬영 시각이 있는 EAR 기록에서 동작을 찾는다.
+
+    Args:
+        samples: (timestamp, left_ear, right_ear) 목록.
+        **kwargs: BlinkDetector 참고.
+
+    Example:
+    >>> detect_events([(0.0, 0.3, 0.1), (0.1, 0.3, 0.1), (0.3, 0.3, 0.1)])
+    [(0.3, 'wink_right')]
+
+    Returns:
+        list: (timestamp, 동작 이름) 목록.
+    """
+    detector = BlinkDetector(**kwargs)
+    events = []
+    for timestamp, left_ear, right_ear in samples:
+        event = detector.update(left_ear, right_ear, timestamp)
+        if event is not None:
+            events.append((timestamp, event))
+    return events
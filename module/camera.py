@@ -0,0 +1,244 @@
+"""카메라가 지원하는 모드(해상도, FOURCC, FPS)를 확인하고 가장 가벼운 모드로 연다.
+
+선택한 모드(profile)는 settings.npy 옆에 저장해 다음 실행부터는 확인 과정을 생략한다.
+set/get/read를 지원하는 캡처라면 무엇이든 사용할 수 있다. (V4L2 loopback, 영상 파일 등)
+"""
+
+import json
+import os
+from time import perf_counter
+
+import cv2
+
+try:
+    from constant import CAMERA_PROFILE_FILE, FRAME_WIDTH, NOMINAL_FRAME_RATE
+except ImportError:
+    from module.constant import CAMERA_PROFILE_FILE, FRAME_WIDTH, NOMINAL_FRAME_RATE
+
+_DIR = os.path.dirname(os.path.realpath(__file__))
+_PROFILE_FILE = os.path.join(_DIR, CAMERA_PROFILE_FILE)
+
+CAMERA_SIZES = (
+    (320, 240),
+    (424, 240),
+    (480, 360),
+    (640, 360),
+    (640, 480),
+    (800, 600),
+    (960, 540),
+    (1280, 720),
+    (1920, 1080),
+)
+# Uncompressed YUYV is cheaper to convert than decoding MJPG, when the
+# camera can deliver it at the required rate.
+CAMERA_FOURCCS = ("YUYV", "MJPG")
+CAMERA_RATES = (30, 60)
+
+
+def _decode_fourcc(value):
+    value = int(value)
+    return "".join(chr((value >> 8 * i) & 0xFF) for i in range(4)).strip("\0")
+
+
+def get_mode(capture):
+    """캡처의 현재 모드를 반환한다.
+
+    Args:
+        capture (cv2.VideoCapture): 캡처 객체.
+
+    Returns:
+        dict: width, height, fourcc, fps.
+    """
+    return {
+        "width": int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fourcc": _decode_fourcc(capture.get(cv2.CAP_PROP_FOURCC)),
+        "fps": round(capture.get(cv2.CAP_PROP_FPS), 2),
+    }
+
+
+def set_mode(capture, mode):
+    """캡처에 모드를 요청하고 실제로 적용되었는지 확인한다.
+
+    Args:
+        capture (cv2.VideoCapture): 캡처 객체.
+        mode (dict): width, height, fourcc, fps.
+
+    Returns:
+        bool: 요청한 해상도와 FOURCC가 적용되었는지 여부.
+    """
+    if mode.get("fourcc"):
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode["fourcc"]))
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, mode["width"])
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, mode["height"])
+    if mode.get("fps"):
+        capture.set(cv2.CAP_PROP_FPS, mode["fps"])
+    # Keep at most one frame queued in the driver.
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    current = get_mode(capture)
+    return (current["width"], current["height"]) == (
+        mode["width"],
+        mode["height"],
+    ) and (not mode.get("fourcc") or current["fourcc"] == mode["fourcc"])
+
+
+def list_modes(capture, sizes=CAMERA_SIZES, fourccs=CAMERA_FOURCCS, rates=CAMERA_RATES):
+    """캡처가 받아들이는 모드를 모두 찾는다.
+
+    지원하지 않는 값을 요청하면 드라이버가 가까운 모드를 고르므로,
+    요청한 값이 아니라 적용된 값을 중복 없이 모은다.
+
+    Args:
+        capture (cv2.VideoCapture): 캡처 객체.
+        sizes (tuple): 시도할 (width, height) 목록.
+        fourccs (tuple): 시도할 FOURCC 목록.
+        rates (tuple): 시도할 FPS 목록.
+
+    Returns:
+        list: get_mode 형식의 모드 목록.
+    """
+    modes = []
+    for fourcc in fourccs:
+        for width, height in sizes:
+            for fps in rates:
+                set_mode(
+                    capture,
+                    {"width": width, "height": height, "fourcc": fourcc, "fps": fps},
+                )
+                mode = get_mode(capture)
+                if mode not in modes:
+                    modes.append(mode)
+    return modes
+
+
+def _mode_cost(mode):
+    fourcc = mode["fourcc"]
+    rank = CAMERA_FOURCCS.index(fourcc) if fourcc in CAMERA_FOURCCS else 0
+    return mode["width"] * mode["height"], rank
+
+
+def measure_mode(capture, frames=10):
+    """현재 모드로 프레임을 읽어 실제 FPS와 프레임당 읽기 시간을 잰다.
+
+    Args:
+        capture (cv2.VideoCapture): 캡처 객체.
+        frames (int): 읽을 프레임 수.
+
+    Returns:
+        tuple: (초당 프레임 수, 프레임당 평균 읽기 시간(ms)). 읽지 못했다면 (0.0, None).
+    """
+    capture.read()  # The first frame waits for the stream to start.
+    count = 0
+    start = perf_counter()
+    for _ in range(frames):
+        success, _ = capture.read()
+        if not success:
+            break
+        count += 1
+    elapsed = perf_counter() - start
+    if not count:
+        return 0.0, None
+    return count / elapsed, elapsed / count * 1000
+
+
+def probe_camera(capture, min_width=FRAME_WIDTH, rate=NOMINAL_FRAME_RATE):
+    """탐지에 필요한 크기와 FPS를 만족하는 가장 가벼운 모드를 골라 적용한다.
+
+    Args:
+        capture (cv2.VideoCapture): 캡처 객체.
+        min_width (int): 필요한 최소 가로 길이.
+        rate (float): 필요한 FPS.
+
+    Returns:
+        dict: 선택한 모드와 측정한 FPS(measured_fps), 읽기 시간(read_ms).
+    """
+    modes = list_modes(capture)
+    wide = [mode for mode in modes if mode["width"] >= min_width] or [
+        max(modes, key=_mode_cost)
+    ]
+    # Drivers that report no rate (0) are measured like the others.
+    candidates = sorted(
+        (mode for mode in wide if not mode["fps"] or mode["fps"] >= rate),
+        key=_mode_cost,
+    ) or sorted(wide, key=_mode_cost)
+
+    best = None
+    for mode in candidates:
+        if not set_mode(capture, mode):
+            continue
+        measured_fps, read_ms = measure_mode(capture)
+        profile = dict(mode, measured_fps=round(measured_fps, 2), read_ms=read_ms)
+        if best is None or measured_fps > best["measured_fps"]:
+            best = profile
+        if measured_fps >= rate * 0.8:
+            best = profile
+            break
+    if best is None:
+        best = dict(get_mode(capture), measured_fps=0.0, read_ms=None)
+    set_mode(capture, best)
+    return best
+
+
+def load_profile(device_id, path=_PROFILE_FILE):
+    """저장된 모드를 불러온다.
+
+    Args:
+        device_id: 카메라 정보.
+        path (str): 모드 파일 경로.
+
+    Returns:
+        dict: 저장된 모드. 없거나 다른 카메라의 모드라면 None.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            profile = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if profile.get("device") != str(device_id):
+        return None
+    return profile
+
+
+def save_profile(device_id, profile, path=_PROFILE_FILE):
+    """선택한 모드를 저장한다.
+
+    Args:
+        device_id: 카메라 정보.
+        profile (dict): probe_camera가 반환한 모드.
+        path (str): 모드 파일 경로.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(profile, device=str(device_id)), file, indent=2)
+
+
+def open_camera(device_id, reprobe=False, path=_PROFILE_FILE):
+    """카메라를 열고 저장된 모드를 적용한다. 저장된 모드가 없으면 확인 후 저장한다.
+
+    Args:
+        device_id: 카메라 정보 또는 영상 파일 경로.
+        reprobe (bool): 저장된 모드를 무시하고 다시 확인할 지 여부.
+        path (str): 모드 파일 경로.
+
+    Example:
+    >>> capture, profile = open_camera(0)
+    >>> profile["width"], profile["fourcc"]
+    (640, 'YUYV')
+
+    Returns:
+        tuple: (cv2.VideoCapture, 적용한 모드). 카메라를 열지 못했다면 모드는 None.
+    """
+    capture = cv2.VideoCapture(device_id)
+    if not capture.isOpened():
+        return capture, None
+
+    profile = None if reprobe else load_profile(device_id, path)
+    if profile is not None and set_mode(capture, profile):
+        return capture, profile
+
+    # No profile yet, or the camera no longer accepts it.
+    profile = probe_camera(capture)
+    try:
+        save_profile(device_id, profile, path)
+    except OSError:
+        pass  # Read-only install: probe again next time.
+    return capture, profile
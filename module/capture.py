@@ -0,0 +1,177 @@
+import threading
+from time import perf_counter, sleep
+
+
+class FrameGrabber(object):
+    """카메라 프레임을 별도 스레드에서 계속 읽어 가장 최신 프레임만 보관한다.
+
+    드라이버 내부에 프레임이 쌓이지 않도록 쉬지 않고 읽으며,
+    소비되지 않고 덮어쓰인 프레임은 드롭된 프레임으로 기록한다.
+
+    Example:
+    >>> grabber = FrameGrabber(cv2.VideoCapture(0))
+    >>> grabber.start()
+    >>> success, frame = grabber.read()
+    >>> grabber.release()
+
+    Functions:
+        start
+        read
+        pause
+        resume
+        get_frame_age
+        get_next_frame_delay
+        get_stats
+        release
+    """
+
+    def __init__(self, capture):
+        self._cap = capture
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__running = False
+        self.__active = threading.Event()
+        self.__active.set()
+        self.__pause_time = None
+        self.__pause_latency = None
+        self.__frame = None
+        self.__timestamp = None
+        self.__is_new = False
+        self.__frame_age = None
+        # Smoothed time between reads, to predict when the next frame arrives.
+        self.__period = None
+        self.__last_read = None
+        self.__read_count = 0
+        self.__drop_count = 0
+        self.__fail_count = 0
+
+    def start(self):
+        """프레임을 읽는 백그라운드 스레드를 시작한다."""
+        if self.__thread is not None:
+            return
+        self.__running = True
+        self.__thread = threading.Thread(target=self._loop, daemon=True)
+        self.__thread.start()
+
+    def _loop(self):
+        while self.__running:
+            if not self.__active.is_set():
+                if self.__pause_time is not None:
+                    self.__pause_latency = perf_counter() - self.__pause_time
+                    self.__pause_time = None
+                self.__active.wait()
+                continue
+
+            success, frame = self._cap.read()
+            timestamp = perf_counter()
+            if not success:
+                self.__fail_count += 1
+                sleep(0.01)
+                continue
+            with self.__lock:
+                # Checked under the lock: pause() clears the flag before taking
+                # it, so a frame read across a pause is never kept.
+                if not self.__active.is_set():
+                    continue
+                if self.__is_new:
+                    # The previous frame was never consumed.
+                    self.__drop_count += 1
+                if self.__last_read is not None:
+                    # Capped, so a slow first read does not stretch the estimate.
+                    interval = min(timestamp - self.__last_read, 0.1)
+                    if self.__period is None:
+                        self.__period = interval
+                    else:
+                        self.__period += (interval - self.__period) * 0.1
+                self.__last_read = timestamp
+                self.__frame = frame
+                self.__timestamp = timestamp
+                self.__is_new = True
+                self.__read_count += 1
+
+    def read(self):
+        """가장 최신 프레임을 기다리지 않고 가져온다.
+
+        cv2.VideoCapture.read와 같은 형식으로 반환하며,
+        이전 호출 이후 새 프레임이 없다면 실패로 처리한다.
+
+        Returns:
+            bool: 새 프레임 존재 여부.
+            ndarray: 가장 최신 프레임. 새 프레임이 없다면 None.
+        """
+        frame, _ = self.read_with_timestamp()
+        return frame is not None, frame
+
+    def read_with_timestamp(self):
+        """가장 최신 프레임과 촬영 시각을 가져온다.
+
+        Returns:
+            ndarray: 가장 최신 프레임. 새 프레임이 없다면 None.
+            float: 프레임을 읽은 시각 (time.perf_counter 기준).
+        """
+        with self.__lock:
+            if not self.__is_new:
+                return None, None
+            frame = self.__frame
+            timestamp = self.__timestamp
+            self.__is_new = False
+        self.__frame_age = perf_counter() - timestamp
+        return frame, timestamp
+
+    def get_next_frame_delay(self):
+        """다음 프레임을 읽을 것으로 예상되는 시점까지 남은 시간을 반환한다.
+
+        Returns:
+            float: 남은 시간(초). 이미 지났다면 0. 아직 알 수 없다면 None.
+        """
+        with self.__lock:
+            if self.__period is None:
+                return None
+            due = self.__last_read + self.__period
+        return max(due - perf_counter(), 0.0)
+
+    def pause(self):
+        """프레임 읽기를 멈춘다. 보관 중인 프레임은 버린다."""
+        self.__pause_time = perf_counter()
+        self.__active.clear()
+        with self.__lock:
+            self.__frame = None
+            self.__is_new = False
+            self.__last_read = None
+            self.__period = None
+
+    def resume(self):
+        """멈춘 프레임 읽기를 다시 시작한다."""
+        self.__active.set()
+
+    def get_frame_age(self):
+        """마지막으로 가져간 프레임이 소비 시점에 얼마나 오래되었는지 반환한다.
+
+        Returns:
+            float: 프레임 나이(초). 아직 가져간 프레임이 없다면 None.
+        """
+        return self.__frame_age
+
+    def get_stats(self):
+        """캡처 통계를 반환한다.
+
+        Returns:
+            dict: 읽은 프레임, 드롭된 프레임, 읽기 실패 횟수와 최근 프레임 나이,
+            마지막 일시 정지 요청 후 실제로 읽기가 멈추기까지 걸린 시간(초).
+        """
+        return {
+            "read": self.__read_count,
+            "dropped": self.__drop_count,
+            "failed": self.__fail_count,
+            "frame_age": self.__frame_age,
+            "pause_latency": self.__pause_latency,
+        }
+
+    def release(self):
+        """스레드를 멈추고 카메라를 해제한다."""
+        self.__running = False
+        self.__active.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout=1)
+            self.__thread = None
+        self._cap.release()
@@ -0,0 +1,175 @@
+import os
+from time import perf_counter
+
+import numpy as np
+
+try:
+    from constant import SETTING_FILE, DEFAULT_SETTINGS
+except ImportError:
+    from module.constant import SETTING_FILE, DEFAULT_SETTINGS
+
+_DIR = os.path.dirname(os.path.realpath(__file__))
+_SETTING_FILE = os.path.join(_DIR, SETTING_FILE)
+
+
+class Settings(object):
+    """타입이 정해진 설정 값. 만든 뒤에는 값을 바꾸지 않는다.
+
+    바뀐 설정은 version을 올린 새 객체로 만들어 교체한다.
+
+    Args:
+        values: settings.npy와 같은 순서의 값. 모자란 값은 기본값으로 채운다.
+        version (int): 설정을 불러온 횟수.
+
+    Example:
+    >>> settings = Settings([8, 0.2, 10, -12, -5, 12, 15, 600])
+    >>> settings.up_threshold
+    10
+    """
+
+    FIELDS = (
+        ("blink_frame_threshold", int),
+        ("ear_threshold", float),
+        ("up_threshold", int),
+        ("left_threshold", int),
+        ("down_threshold", int),
+        ("right_threshold", int),
+        ("cursor_sensitivity", int),
+        ("scroll_sensitivity", int),
+    )
+
+    def __init__(self, values=DEFAULT_SETTINGS, version=0):
+        values = list(values)
+        if len(values) > len(self.FIELDS):
+            raise ValueError(f"Too many setting values: {len(values)}")
+        values += DEFAULT_SETTINGS[len(values) :]
+        for (name, cast), value in zip(self.FIELDS, values):
+            setattr(self, name, cast(value))
+        self.version = version
+
+    def to_array(self):
+        """settings.npy에 저장하는 형식으로 바꾼다.
+
+        Returns:
+            ndarray: 설정 값 배열.
+        """
+        return np.array(
+            [getattr(self, name) for name, _ in self.FIELDS], dtype=np.float64
+        )
+
+
+class SettingsStore(object):
+    """현재 설정을 보관하고, 설정 파일이 바뀌면 새 설정으로 교체한다.
+
+    Detector와 Controller는 이 객체를 참조로 가지고 사용할 때마다 get()으로 읽는다.
+    check()는 프레임 사이에 호출하며, 파일 수정 시각은 interval마다 한 번만 확인한다.
+    새 설정은 모두 읽고 검사한 뒤 참조 하나를 바꾸는 방식으로 한 번에 적용된다.
+
+    Args:
+        path (str): 설정 파일 경로.
+        interval (float): 파일 수정 시각을 확인하는 최소 간격(초).
+
+    Example:
+    >>> store = SettingsStore()
+    >>> store.get().ear_threshold
+    0.2
+    >>> store.check()  # between frames
+
+    Functions:
+        get
+        check
+        reload
+        save
+        get_stats
+    """
+
+    def __init__(self, path=_SETTING_FILE, interval=1.0):
+        self._path = path
+        self._interval = interval
+        self.__settings = Settings()
+        self.__stamp = None
+        self.__next_check = 0.0
+        self.__loads = 0
+        self.__errors = 0
+        self.reload()
+
+    def get(self):
+        """현재 설정을 반환한다.
+
+        Returns:
+            Settings: 현재 설정.
+        """
+        return self.__settings
+
+    def _get_stamp(self):
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self, now=None):
+        """설정 파일이 바뀌었다면 다시 불러온다. interval보다 자주 확인하지 않는다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            bool: 새 설정을 적용했는지 여부.
+        """
+        if now is None:
+            now = perf_counter()
+        if now < self.__next_check:
+            return False
+        self.__next_check = now + self._interval
+        if self._get_stamp() == self.__stamp:
+            return False
+        return self.reload()
+
+    def reload(self):
+        """설정 파일을 다시 불러온다. 읽을 수 없는 파일이면 현재 설정을 유지한다.
+
+        Returns:
+            bool: 새 설정을 적용했는지 여부.
+        """
+        stamp = self._get_stamp()
+        self.__stamp = stamp
+        if stamp is None:
+            return False
+        try:
+            values = np.load(self._path)
+            settings = Settings(values, self.__settings.version + 1)
+        except (OSError, EOFError, ValueError, TypeError):
+            self.__errors += 1
+            return False
+        self.__settings = settings
+        self.__loads += 1
+        return True
+
+    def save(self, values):
+        """설정을 파일에 저장하고 바로 적용한다.
+
+        읽는 쪽이 쓰는 중인 파일을 보지 않도록 임시 파일에 쓴 뒤 교체한다.
+
+        Args:
+            values: settings.npy와 같은 순서의 값.
+        """
+        settings = Settings(values, self.__settings.version + 1)
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "wb") as file:
+            np.save(file, settings.to_array())
+        os.replace(temp_path, self._path)
+        self.__settings = settings
+        self.__stamp = self._get_stamp()
+
+    def get_stats(self):
+        """설정을 불러온 통계를 반환한다.
+
+        Returns:
+            dict: 현재 설정 version, 파일을 불러온 횟수, 읽지 못한 횟수.
+        """
+        return {
+            "version": self.__settings.version,
+            "loads": self.__loads,
+            "errors": self.__errors,
+        }
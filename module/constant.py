@@ -1,4 +1,6 @@
 SETTING_FILE = "settings.npy"
+CAMERA_PROFILE_FILE = "camera.json"  # Cached camera mode, next to SETTING_FILE.
+BASELINE_FILE = "baseline.npy"  # Learned neutral head pose, next to SETTING_FILE.
 DEFAULT_SETTINGS = [8, 0.2, 10, -12, -5, 12, 15, 600]
 # Blink_Frame_Threshold = 8
 # Eye_Aspect_Ratio_Threshold = 0.2
@@ -9,3 +11,21 @@ DEFAULT_SETTINGS = [8, 0.2, 10, -12, -5, 12, 15, 600]
 # Cursor_Sensitivity = 15
 # Scroll_Sensitivity = 600
 CAM_ID = None
+NOMINAL_FRAME_RATE = 30  # Frame rate that frame-based settings were tuned for.
+FRAME_WIDTH = 480  # Frames are resized to this width before detection.
+# Rolling stats log next to SETTING_FILE, e.g. "telemetry.jsonl" or "telemetry.csv".
+TELEMETRY_FILE = None
+TELEMETRY_PORT = None  # e.g. 9464 to serve http://127.0.0.1:9464/metrics
+PREVIEW_FRAME_RATE = 15  # The preview window is redrawn at most this often.
+PREVIEW_OVERLAY = True  # Draw landmarks, head angles and EAR on the preview.
+# Input action for each facial gesture: "click", "right_click", "drag" (press/release),
+# "scroll_up", "scroll_down", "zoom_in", "zoom_out" or None to turn the gesture off.
+GESTURE_ACTIONS = {
+    "blink": "click",
+    "wink_left": "right_click",
+    "wink_right": "drag",
+    # Off until their thresholds in module/gesture.py are calibrated per user.
+    "mouth_open": None,
+    "brow_raise": None,
+    "nod": None,
+}
@@ -0,0 +1,171 @@
+import threading
+from math import exp, hypot
+from time import perf_counter, sleep
+
+
+class CursorMotion(object):
+    """카메라 프레임과 별개로 일정한 주기(예: 120Hz)로 마우스 커서를 움직인다.
+
+    탐지 과정에서 받은 목표 방향을 초당 픽셀 단위의 속도로 바꾸고,
+    같은 방향을 오래 유지할수록 빨라지도록 가속한다.
+    속도는 부드럽게 목표에 가까워지므로 카메라 프레임 사이에도 커서가 끊기지 않는다.
+
+    Args:
+        backend (InputBackend): 입력 장치.
+        speed (float): 기본 속도(픽셀/초).
+        rate (float): 커서 이동 주기(Hz).
+        max_speed_ratio (float): 가속했을 때 기본 속도 대비 최대 속도 비율.
+        ramp_time (float): 최대 속도에 도달하기까지 걸리는 시간(초).
+        smoothing (float): 속도가 목표에 가까워지는 시간 상수(초).
+        timeout (float): 목표가 갱신되지 않으면 멈추기까지의 시간(초).
+        executor (ActionExecutor): 커서 이동을 맡길 실행기. None이면 이 스레드에서
+            직접 입력 장치를 호출한다.
+
+    Functions:
+        start
+        set_target
+        set_speed
+        stop
+        get_move_count
+        release
+    """
+
+    def __init__(
+        self,
+        backend,
+        speed,
+        rate=120,
+        max_speed_ratio=3.0,
+        ramp_time=1.0,
+        smoothing=0.05,
+        timeout=0.25,
+        executor=None,
+    ):
+        self._backend = backend
+        self._speed = speed
+        self._period = 1 / rate
+        self._max_speed_ratio = max_speed_ratio
+        self._ramp_time = ramp_time
+        self._smoothing = smoothing
+        self._timeout = timeout
+        self._executor = executor
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__running = False
+        self.__wake = threading.Event()
+        self.__target = (0.0, 0.0)
+        self.__target_time = 0.0
+        self.__hold_start = None
+        self.__velocity = [0.0, 0.0]
+        self.__position = None
+        self.__screen = None
+        self.__moves = 0
+
+    def start(self):
+        """커서 이동 스레드를 시작한다."""
+        if self.__thread is not None:
+            return
+        self.__running = True
+        self.__thread = threading.Thread(target=self._loop, daemon=True)
+        self.__thread.start()
+
+    def set_target(self, dx, dy):
+        """커서가 움직일 방향을 정한다.
+
+        Args:
+            dx (float): 가로 방향 (-1: 왼쪽, 1: 오른쪽).
+            dy (float): 세로 방향 (-1: 위, 1: 아래).
+        """
+        now = perf_counter()
+        with self.__lock:
+            if (dx, dy) != self.__target:
+                self.__hold_start = now if (dx or dy) else None
+            self.__target = (dx, dy)
+            self.__target_time = now
+        if dx or dy:
+            self.start()
+            self.__wake.set()
+
+    def set_speed(self, speed):
+        """기본 속도를 바꾼다. 다음 이동 주기부터 적용된다.
+
+        Args:
+            speed (float): 기본 속도(픽셀/초).
+        """
+        self._speed = speed
+
+    def stop(self):
+        """목표 방향을 없애 커서를 멈춘다."""
+        self.set_target(0.0, 0.0)
+
+    def _get_target_velocity(self, now):
+        with self.__lock:
+            dx, dy = self.__target
+            if not (dx or dy) or now - self.__target_time > self._timeout:
+                return 0.0, 0.0
+            hold = now - self.__hold_start
+        norm = hypot(dx, dy)
+        # Ease-in acceleration curve from the base speed up to the maximum.
+        ramp = min(hold / self._ramp_time, 1.0)
+        speed = self._speed * (1 + (self._max_speed_ratio - 1) * ramp * ramp)
+        return dx / norm * speed, dy / norm * speed
+
+    def _loop(self):
+        prev = perf_counter()
+        moved = None
+        while self.__running:
+            sleep(max(prev + self._period - perf_counter(), 0))
+            now = perf_counter()
+            dt = now - prev
+            prev = now
+
+            vx, vy = self._get_target_velocity(now)
+            velocity = self.__velocity
+            if not (vx or vy) and hypot(*velocity) < 1:
+                velocity[0] = velocity[1] = 0.0
+                self.__position = None
+                # Sleep until a new target arrives instead of ticking idle.
+                self.__wake.clear()
+                if self._get_target_velocity(perf_counter()) == (0.0, 0.0):
+                    self.__wake.wait()
+                prev = perf_counter()
+                continue
+            alpha = 1 - exp(-dt / self._smoothing)
+            velocity[0] += (vx - velocity[0]) * alpha
+            velocity[1] += (vy - velocity[1]) * alpha
+
+            if self.__position is None:
+                # Start from the real cursor so that manual moves are kept.
+                self.__position = list(self._backend.position())
+                self.__screen = self._backend.size()
+                moved = None
+            w, h = self.__screen
+            x = min(max(self.__position[0] + velocity[0] * dt, 0), w - 1)
+            y = min(max(self.__position[1] + velocity[1] * dt, 0), h - 1)
+            self.__position[0] = x
+            self.__position[1] = y
+            target = (round(x), round(y))
+            if target != moved:
+                if self._executor is None:
+                    self._backend.move_to(*target)
+                else:
+                    # Queued with clicks so that a click lands where the cursor is.
+                    self._executor.submit(self._backend.move_to, *target, key="move_to")
+                moved = target
+                self.__moves += 1
+
+    def get_move_count(self):
+        """지금까지 커서를 옮긴 횟수를 반환한다.
+
+        Returns:
+            int: 입력 장치에 요청한 커서 이동 횟수.
+        """
+        return self.__moves
+
+    def release(self):
+        """커서 이동 스레드를 멈춘다."""
+        self.__running = False
+        self.__wake.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout=1)
+            self.__thread = None
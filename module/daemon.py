@@ -0,0 +1,148 @@
+"""사이드바 없이 얼굴 탐지를 실행하고, 결과를 Unix 도메인 소켓으로 내보낸다.
+
+사이드바(App)는 module.ipc.RemoteProcess로 연결하는 클라이언트 중 하나가 된다.
+"""
+
+import signal
+import threading
+from time import perf_counter, sleep
+
+try:
+    from ipc import EventServer
+    from startup import load_process
+except ImportError:
+    from module.ipc import EventServer
+    from module.startup import load_process
+
+# Commands accepted from clients. The button commands are passed to Process.run.
+COMMANDS = ("pause", "resume", "zoom-in", "zoom-out", "scroll-up", "scroll-down")
+
+
+class Daemon(object):
+    """Process를 반복 실행하며, 클라이언트가 보낸 명령을 프레임 사이에 처리한다.
+
+    Args:
+        process (Process): EventServer를 publisher로 받은 실행 객체.
+        server (EventServer): 명령을 받을 서버.
+        preview (bool): 미리보기 창을 띄울 지 여부.
+        detect_direction (bool): 얼굴 방향으로 커서를 움직일 지 여부.
+
+    Example:
+    >>> server = EventServer("/tmp/facemouse.sock")
+    >>> server.start()
+    >>> daemon = Daemon(load_process(mark, publisher=server), server)
+    >>> daemon.run()  # until stop() is called from another thread
+
+    Functions:
+        run
+        handle_command
+        stop
+        get_stats
+    """
+
+    def __init__(self, process, server, preview=False, detect_direction=True):
+        self._process = process
+        self._server = server
+        self._preview = preview
+        self._detect_direction = detect_direction
+        self.__stopped = threading.Event()
+        self.__command = None
+        self.__is_paused = False
+        self.__ignored = 0
+
+    def run(self):
+        """stop이 호출될 때까지 탐지와 미리보기를 반복한다."""
+        process = self._process
+        next_render = 0.0
+        while not self.__stopped.is_set():
+            for command in self._server.get_commands():
+                self.handle_command(command)
+            if self.__is_paused:
+                self.__stopped.wait(0.05)
+                continue
+
+            command, self.__command = self.__command, None
+            delay = process.run(command, self._preview, self._detect_direction)
+            if self._preview and perf_counter() >= next_render:
+                next_render = perf_counter() + process.render_preview() / 1000
+            sleep(max(delay or 1, 1) / 1000)
+
+    def handle_command(self, command):
+        """클라이언트가 보낸 명령을 처리한다.
+
+        Args:
+            command (str): COMMANDS 중 하나. 그 외의 명령은 무시한다.
+
+        Returns:
+            bool: 처리 여부.
+        """
+        if command not in COMMANDS:
+            self.__ignored += 1
+            return False
+        if command == "pause":
+            if not self.__is_paused:
+                self.__is_paused = True
+                self._process.suspend()
+        elif command == "resume":
+            if self.__is_paused:
+                self.__is_paused = False
+                self._process.resume()
+        else:
+            self.__command = command
+        return True
+
+    def stop(self):
+        """run 반복을 멈춘다. 다른 스레드나 시그널 처리 함수에서 호출할 수 있다."""
+        self.__stopped.set()
+
+    def get_stats(self):
+        """일시 정지 여부와 무시한 명령 수를 반환한다.
+
+        Returns:
+            dict: 일시 정지 여부(paused)와 무시한 명령 수(ignored_commands).
+        """
+        return {"paused": self.__is_paused, "ignored_commands": self.__ignored}
+
+
+def run_daemon(
+    socket_path,
+    device=None,
+    max_frame_rate=60,
+    mode=None,
+    preview=False,
+    backend=None,
+):
+    """소켓을 열고 Process를 준비해 Daemon을 실행한다. SIGINT, SIGTERM으로 멈춘다.
+
+    Args:
+        socket_path (str): 소켓 파일 경로.
+        device: 카메라 정보 또는 영상 파일 경로. None이면 설정된 카메라를 사용한다.
+        max_frame_rate (float): 목표 초당 처리 프레임 수.
+        mode (dict): 요청할 카메라 모드. load_process 참고.
+        preview (bool): 미리보기 창을 띄울 지 여부.
+        backend (InputBackend): 입력 장치. None이면 환경에 맞는 장치를 사용한다.
+
+    Returns:
+        dict: 종료 시점의 서버 통계. EventServer.get_stats 참고.
+    """
+    server = EventServer(socket_path)
+    server.start()
+    process = None
+    try:
+        process = load_process(
+            lambda name: None,
+            device,
+            backend,
+            mode=mode,
+            max_frame_rate=max_frame_rate,
+            publisher=server,
+        )
+        daemon = Daemon(process, server, preview)
+        for number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(number, lambda *args: daemon.stop())
+        daemon.run()
+    finally:
+        if process is not None:
+            process.release()
+        server.release()
+    return server.get_stats()
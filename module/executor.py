@@ -0,0 +1,166 @@
+import threading
+from collections import deque
+from time import perf_counter
+
+
+class ActionExecutor(object):
+    """입력 동작을 큐에 담아 별도 스레드에서 순서대로 실행한다.
+
+    탐지 과정은 동작을 큐에 넣기만 하므로 클릭, 확대, 스크롤을 기다리지 않는다.
+    같은 key를 가진 동작이 큐의 마지막에 연속으로 쌓이면 마지막 값 하나로 합친다.
+    (예: 커서 이동) 다른 동작의 앞뒤 순서는 바뀌지 않는다.
+
+    Args:
+        maxsize (int): 큐에 담을 수 있는 최대 동작 수. 가득 차면 새 동작은 버린다.
+            버튼 떼기처럼 반드시 실행할 동작(required)은 버리지 않는다.
+
+    Example:
+    >>> executor = ActionExecutor()
+    >>> executor.submit(backend.move_to, 10, 20, key="move_to")
+    >>> executor.submit(backend.click)
+    >>> executor.submit(backend.mouse_up, required=True)
+
+    Functions:
+        start
+        submit
+        wait
+        get_stats
+        release
+    """
+
+    def __init__(self, maxsize=64):
+        self._maxsize = maxsize
+        self.__queue = deque()
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__running = False
+        self.__busy = False
+        self.__submitted = 0
+        self.__executed = 0
+        self.__coalesced = 0
+        self.__dropped = 0
+        self.__failed = 0
+        self.__max_depth = 0
+        self.__latency_sum = 0.0
+        self.__max_latency = 0.0
+
+    def start(self):
+        """동작 실행 스레드를 시작한다."""
+        with self.__condition:
+            if self.__thread is not None:
+                return
+            self.__running = True
+            self.__thread = threading.Thread(target=self._loop, daemon=True)
+            self.__thread.start()
+
+    def submit(self, function, *args, key=None, required=False):
+        """동작을 큐에 넣는다. 실행을 기다리지 않는다.
+
+        Args:
+            function (callable): 실행할 동작.
+            *args: 동작에 전달할 값.
+            key (str): 합칠 수 있는 동작의 이름. 큐의 마지막 동작과 key가 같으면
+                새 값으로 덮어쓴다. None이면 합치지 않는다.
+            required (bool): 큐가 가득 차도 버리지 않을 지 여부. 가득 찼다면
+                가장 오래된 합칠 수 있는 동작(커서 이동 등)을 대신 버리며,
+                그런 동작이 없다면 maxsize를 넘겨 넣는다.
+
+        Returns:
+            bool: 큐에 들어갔는지 여부. 큐가 가득 찼다면 False.
+        """
+        self.start()
+        now = perf_counter()
+        with self.__condition:
+            self.__submitted += 1
+            queue = self.__queue
+            if key is not None and queue and queue[-1][0] == key:
+                # Keep the first submit time so latency covers the whole wait.
+                queue[-1] = (key, function, args, queue[-1][3])
+                self.__coalesced += 1
+                return True
+            if len(queue) >= self._maxsize:
+                if not required:
+                    self.__dropped += 1
+                    return False
+                # A button release must run, or the button stays held.
+                for i, action in enumerate(queue):
+                    if action[0] is not None:
+                        del queue[i]
+                        self.__dropped += 1
+                        break
+            queue.append((key, function, args, now))
+            self.__max_depth = max(self.__max_depth, len(queue))
+            self.__condition.notify()
+        return True
+
+    def wait(self, timeout=None):
+        """큐에 담긴 동작이 모두 실행될 때까지 기다린다.
+
+        Args:
+            timeout (float): 최대 대기 시간(초). None이면 끝날 때까지 기다린다.
+
+        Returns:
+            bool: 모든 동작이 실행되었는지 여부.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: not (self.__queue or self.__busy), timeout
+            )
+
+    def _loop(self):
+        condition = self.__condition
+        while True:
+            with condition:
+                self.__busy = False
+                condition.notify_all()
+                condition.wait_for(lambda: self.__queue or not self.__running)
+                if not self.__running:
+                    return
+                _, function, args, submitted = self.__queue.popleft()
+                self.__busy = True
+            try:
+                function(*args)
+            except Exception:  # An input error must not stop later actions.
+                with condition:
+                    self.__failed += 1
+            latency = perf_counter() - submitted
+            with condition:
+                self.__executed += 1
+                self.__latency_sum += latency
+                self.__max_latency = max(self.__max_latency, latency)
+
+    def get_stats(self):
+        """큐 상태와 동작 지연 통계를 반환한다.
+
+        Returns:
+            dict: 현재/최대 큐 길이, 넣은/실행한/합친/버린/실패한 동작 수,
+            큐에 넣은 시점부터 실행을 마칠 때까지의 평균, 최대 지연(초).
+        """
+        with self.__condition:
+            executed = self.__executed
+            return {
+                "depth": len(self.__queue),
+                "max_depth": self.__max_depth,
+                "submitted": self.__submitted,
+                "executed": executed,
+                "coalesced": self.__coalesced,
+                "dropped": self.__dropped,
+                "failed": self.__failed,
+                "mean_latency": self.__latency_sum / executed if executed else 0.0,
+                "max_latency": self.__max_latency,
+            }
+
+    def release(self, timeout=1):
+        """남은 동작을 실행한 뒤 스레드를 멈춘다.
+
+        Args:
+            timeout (float): 남은 동작을 기다릴 최대 시간(초).
+        """
+        if self.__thread is None:
+            return
+        self.wait(timeout)
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+        self.__thread.join(timeout=timeout)
+        self.__thread = None
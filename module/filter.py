@@ -0,0 +1,92 @@
+from math import pi
+
+import numpy as np
+
+
+class OneEuroFilter(object):
+    """One Euro 필터로 값의 떨림을 줄이고, 추정한 속도로 앞으로의 값을 예측한다.
+
+    느리게 움직일 때는 강하게, 빠르게 움직일 때는 약하게 걸러 지연을 줄인다.
+    배열 전체에 원소별로 적용되며, 프레임마다 이전 값과 속도만 저장한다.
+
+    Args:
+        min_cutoff (float): 멈춰 있을 때의 차단 주파수(Hz). 작을수록 떨림이 줄어든다.
+        beta (float): 속도에 따라 차단 주파수를 높이는 정도. 클수록 지연이 줄어든다.
+        d_cutoff (float): 속도 추정에 사용할 차단 주파수(Hz).
+        reset_time (float): 이 시간(초) 이상 값이 없으면 필터를 초기화한다.
+        max_horizon (float): 예측할 수 있는 최대 시간(초).
+
+    Functions:
+        filter
+        predict
+        reset
+    """
+
+    def __init__(
+        self, min_cutoff=1.0, beta=0.05, d_cutoff=1.0, reset_time=0.5, max_horizon=0.15
+    ):
+        self._min_cutoff = min_cutoff
+        self._beta = beta
+        self._d_cutoff = d_cutoff
+        self._reset_time = reset_time
+        self._max_horizon = max_horizon
+        self.__value = None
+        self.__velocity = None
+        self.__timestamp = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1 / (2 * pi * cutoff)
+        return 1 / (1 + tau / dt)
+
+    def filter(self, value, timestamp):
+        """새 측정값을 반영해 걸러진 값을 반환한다.
+
+        Args:
+            value (ndarray): 측정값.
+            timestamp (float): 측정 시각(초).
+
+        Returns:
+            ndarray: 걸러진 값.
+        """
+        value = np.asarray(value, dtype=np.float64)
+        if self.__value is not None:
+            dt = timestamp - self.__timestamp
+            if dt <= 0:
+                return self.__value
+            if dt <= self._reset_time:
+                velocity = (value - self.__value) / dt
+                self.__velocity += self._alpha(self._d_cutoff, dt) * (
+                    velocity - self.__velocity
+                )
+                cutoff = self._min_cutoff + self._beta * np.abs(self.__velocity)
+                self.__value = self.__value + self._alpha(cutoff, dt) * (
+                    value - self.__value
+                )
+                self.__timestamp = timestamp
+                return self.__value
+
+        self.__value = value.copy()
+        self.__velocity = np.zeros_like(value)
+        self.__timestamp = timestamp
+        return self.__value
+
+    def predict(self, timestamp):
+        """추정한 속도로 주어진 시각의 값을 예측한다.
+
+        Args:
+            timestamp (float): 예측할 시각(초).
+
+        Returns:
+            ndarray: 예측값. 아직 측정값이 없다면 None.
+        """
+        if self.__value is None:
+            return None
+        horizon = min(max(timestamp - self.__timestamp, 0.0), self._max_horizon)
+        return self.__value + self.__velocity * horizon
+
+    def reset(self):
+        """저장된 값과 속도를 지운다."""
+        self.__value = None
+        self.__velocity = None
+        self.__timestamp = None
@@ -1,77 +1,173 @@
-import os
 import platform
-from time import time
+from functools import partial
+from itertools import chain
+from math import ceil
+from operator import attrgetter
+from time import perf_counter
 
 import cv2
 import mediapipe as mp
 import numpy as np
-import pyautogui
 
 try:
-    from constant import SETTING_FILE, DEFAULT_SETTINGS
+    from backend import load_backend
+    from baseline import PoseBaseline
+    from blink import BlinkDetector
+    from config import SettingsStore
+    from constant import (
+        GESTURE_ACTIONS,
+        NOMINAL_FRAME_RATE,
+        FRAME_WIDTH,
+        PREVIEW_FRAME_RATE,
+        PREVIEW_OVERLAY,
+    )
+    from cursor import CursorMotion
+    from executor import ActionExecutor
+    from filter import OneEuroFilter
+    from gesture import GESTURES, NOD, GestureEngine, NodDetector
+    from motion import MotionGate
+    from pose import PoseEngine
+    from preview import PreviewRenderer
+    from roi import FaceROI
+    from scheduler import FrameScheduler
+    from telemetry import Telemetry
 except ImportError:
-    from module.constant import SETTING_FILE, DEFAULT_SETTINGS
-
-_DIR = os.path.dirname(os.path.realpath(__file__))
-_SETTING_FILE = os.path.join(_DIR, SETTING_FILE)
-# pyautogui.FAILSAFE = False
-# pyautogui.PAUSE = 0.03
-
-if os.path.exists(_SETTING_FILE):
-    SETTINGS = np.load(_SETTING_FILE)
-else:
-    SETTINGS = DEFAULT_SETTINGS
-(
-    BLINK_FRAME_THRESHOLD,
-    EAR_THRESHOLD,
-    UP_THRESHOLD,
-    LEFT_THRESHOLD,
-    DOWN_THRESHOLD,
-    RIGHT_THRESHOLD,
-    CURSOR_SENSITIVITY,
-    SCROLL_SENSITIVITY,
-) = SETTINGS
+    from module.backend import load_backend
+    from module.baseline import PoseBaseline
+    from module.blink import BlinkDetector
+    from module.config import SettingsStore
+    from module.constant import (
+        GESTURE_ACTIONS,
+        NOMINAL_FRAME_RATE,
+        FRAME_WIDTH,
+        PREVIEW_FRAME_RATE,
+        PREVIEW_OVERLAY,
+    )
+    from module.cursor import CursorMotion
+    from module.executor import ActionExecutor
+    from module.filter import OneEuroFilter
+    from module.gesture import GESTURES, NOD, GestureEngine, NodDetector
+    from module.motion import MotionGate
+    from module.pose import PoseEngine
+    from module.preview import PreviewRenderer
+    from module.roi import FaceROI
+    from module.scheduler import FrameScheduler
+    from module.telemetry import Telemetry
+
+_get_xyz = attrgetter("x", "y", "z")
 
 
 class Detector(object):
-    """얼굴 방향 인식 및 눈 깜빡임 인식을 수행
+    """얼굴 방향 인식, 눈 깜빡임 인식 및 얼굴 동작(gesture) 인식을 수행
 
     Detecting Model:
         mediapipe - Face Mesh
 
+    Args:
+        frame (image, ndarray): 크기 정보를 얻기 위한 카메라 프레임.
+        face_mesh: 재사용할 Face Mesh 객체. None이면 새로 생성한다.
+        use_roi (bool): 얼굴을 찾은 뒤 얼굴 주변 영역만 처리할 지 여부.
+        pose_method (str): 얼굴 각도 계산 방식. PoseEngine 참고.
+        flip_frame (bool): 이미지를 좌우반전할 지 여부. False이면 원본 이미지로 탐지한 뒤
+            랜드마크 좌표를 좌우반전한다. 반환하는 이미지는 반전되지 않는다.
+        settings (SettingsStore): 설정. None이면 설정 파일을 불러온다.
+        telemetry (Telemetry): 탐지 시간과 횟수를 기록할 객체. None이면 새로 만든다.
+        baseline (PoseBaseline): 방향 판단의 기준 자세. None이면 저장하지 않는
+            기준 자세를 새로 만든다.
+
     Functions:
         convert_frame
         detect_landmark
         get_face_direction
-        update_blink_count
+        get_face_angles
+        get_latency
+        update_eye_event
+        update_gestures
+        get_gesture_stats
+        get_eyes_ear
         get_both_eyes_ear
+        get_face_box
+        get_landmark_pixels
+        warm_up
+        get_roi_stats
+        get_pose_stats
     """
 
-    def __init__(self, frame):
+    def __init__(
+        self,
+        frame,
+        face_mesh=None,
+        use_roi=True,
+        pose_method="axes",
+        flip_frame=True,
+        settings=None,
+        telemetry=None,
+        baseline=None,
+    ):
         self._face_indexs = (1, 33, 61, 199, 263, 291)
+        self._outline_indexs = (10, 152, 234, 454)
         self._eye_indexs = (
             ((160, 144), (158, 153), (33, 133)),
             ((385, 380), (387, 373), (362, 263)),
         )
+        # Left/right counterparts, used when landmarks are mirrored instead of the image.
+        self._mirror_indexs = dict(
+            [(33, 263), (133, 362), (160, 387), (158, 385), (144, 373), (153, 380)]
+            + [(61, 291), (234, 454), (105, 334)]
+        )
+        self._mirror_indexs.update({b: a for a, b in self._mirror_indexs.items()})
+        self._flip_frame = flip_frame
         w, h = self._set_frame_size(frame)
         self._w = w
         self._h = h
-        self._cam_matrix = self._init_camera_matrix(w, h)
-        self._dist_matrix = self._init_distortion_matrix()
-        self._face_mesh = self._init_face_mesh()
-        self._blink_frame_thre = int(BLINK_FRAME_THRESHOLD)
-        self._ear_thre = EAR_THRESHOLD
-        self._up_thre = int(UP_THRESHOLD)
-        self._left_thre = int(LEFT_THRESHOLD)
-        self._down_thre = int(DOWN_THRESHOLD)
-        self._right_thre = int(RIGHT_THRESHOLD)
-        self.__prev_y_angle = 0
-        self.__prev_x_angle = 0
-        self.__landmarks = None
-        self.__blink_counter = 0
+        self._init_landmark_index()
+        self._pose_engine = PoseEngine(w, h, pose_method)
+        if face_mesh is None:
+            face_mesh = self._init_face_mesh()
+        self._face_mesh = face_mesh
+        self._roi = None
+        if use_roi:
+            # Crops get their own Face Mesh, since its tracking state is kept
+            # in normalized coordinates of the previous input image.
+            self._roi = FaceROI(w, h)
+            self._roi_face_mesh = self._init_face_mesh()
+        # Thresholds are read from the store on use, so saved settings apply live.
+        self._settings = SettingsStore() if settings is None else settings
+        self._telemetry = Telemetry() if telemetry is None else telemetry
+        self._baseline = PoseBaseline(path=None) if baseline is None else baseline
+        # Key landmarks and angles are smoothed, and angles are predicted
+        # forward by the capture-to-output latency.
+        self._point_filter = OneEuroFilter(min_cutoff=1.0, beta=0.05)
+        self._angle_filter = OneEuroFilter(min_cutoff=1.5, beta=0.01)
+        self.__face_points = None
+        self.__timestamp = None
+        self.__angles_timestamp = None
+        self.__latency = None
+        self.__points = np.zeros((len(self._landmark_ids), 3), dtype=np.float32)
+        self.__flat_points = self.__points.reshape(-1)
+        self.__pixels = np.zeros((len(self._landmark_ids), 3), dtype=np.float64)
+        self.__scale = np.zeros(3, dtype=np.float64)
+        self.__offset = np.zeros(3, dtype=np.float64)
+        self._set_crop_transform(None)
+        self.__pose_points = np.zeros((len(self._face_indexs), 3), dtype=np.float64)
+        self.__bgr_frame = None
+        self.__crop = None
+        # Preprocessing outputs are written into buffers reused across frames.
+        self.__buffers = {}
+        # Blinks and winks are timed by frame timestamps, not frame counts.
+        self._blink = BlinkDetector()
+        self._event_counters = {
+            "blink": "blinks",
+            "wink_left": "winks_left",
+            "wink_right": "winks_right",
+        }
+        self.__blink_version = None
+        # All ratio gestures are evaluated together on the landmark array.
+        self._gestures = GestureEngine(self._active_gestures, self._landmark_ids)
+        self._nod = NodDetector() if GESTURE_ACTIONS.get(NOD) is not None else None
 
     def _set_frame_size(self, image):
-        expected_w = 480
+        expected_w = FRAME_WIDTH
         img_h, img_w, _ = image.shape
 
         if img_w <= expected_w:
@@ -80,19 +176,6 @@ class Detector(object):
             img_h = int(expected_w * img_h / img_w)
             return expected_w, img_h
 
-    def _init_camera_matrix(self, img_w, img_h):
-        return np.array(
-            [
-                [img_w, 0, img_h / 2],
-                [0, img_w, img_h / 2],
-                [0, 0, 1],
-            ],
-            dtype=np.int32,
-        )
-
-    def _init_distortion_matrix(self):
-        return np.zeros((4, 1), dtype=np.float64)
-
     def _init_face_mesh(self):
         return mp.solutions.face_mesh.FaceMesh(
             refine_landmarks=True,
@@ -100,11 +183,50 @@ class Detector(object):
             max_num_faces=1,
         )
 
-    def _rescale_x(self, x):
-        return int(x * self._w)
-
-    def _rescale_y(self, y):
-        return int(y * self._h)
+    def _init_landmark_index(self):
+        # Only the landmarks used by the detector are copied out of the
+        # mediapipe result, once per frame, into a single array.
+        eye_ids = [id for eye in self._eye_indexs for pair in eye for id in pair]
+        # Gestures without an action are neither read nor evaluated.
+        self._active_gestures = tuple(
+            gesture
+            for gesture in GESTURES
+            if GESTURE_ACTIONS.get(gesture.name) is not None
+        )
+        gesture_ids = [
+            id
+            for gesture in self._active_gestures
+            for pair in gesture.numerator + gesture.denominator
+            for id in pair
+        ]
+        self._landmark_ids = tuple(
+            dict.fromkeys(
+                self._face_indexs
+                + tuple(eye_ids)
+                + self._outline_indexs
+                + tuple(gesture_ids)
+            )
+        )
+        row = {id: i for i, id in enumerate(self._landmark_ids)}
+
+        # Landmarks to read from the mediapipe result for each row.
+        self._read_ids = self._landmark_ids
+        if not self._flip_frame:
+            self._read_ids = tuple(
+                self._mirror_indexs.get(id, id) for id in self._landmark_ids
+            )
+
+        self._face_rows = np.array([row[id] for id in self._face_indexs])
+        # Shape (eye, pair) for vertical pairs and (eye, end) for the corners.
+        self._eye_upper_rows = np.array(
+            [[row[pair[0]] for pair in eye[:2]] for eye in self._eye_indexs]
+        )
+        self._eye_lower_rows = np.array(
+            [[row[pair[1]] for pair in eye[:2]] for eye in self._eye_indexs]
+        )
+        self._eye_corner_rows = np.array(
+            [[row[id] for id in eye[2]] for eye in self._eye_indexs]
+        )
 
     def convert_frame(self, frame):
         """입력된 프레임(이미지)의 전처리를 수행한다.
@@ -115,30 +237,129 @@ class Detector(object):
         Returns:
             ndarray: 원본 이미지에서 좌우반전, 크기 조정을 수행한 이미지.
             ndarray: 얼굴 탐지에 사용할 수 있는 이미지.
+
+            두 이미지 모두 다음 호출에서 덮어쓰므로, 보관하려면 복사해야 한다.
         """
-        bgr_frame = cv2.flip(cv2.resize(frame, (self._w, self._h)), 1)
-        rgb_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
-        rgb_frame.flags.writeable = False
+        bgr_frame = self._resize_frame(frame)
+        rgb_frame = self._convert_color(bgr_frame)
         return bgr_frame, rgb_frame
 
-    def detect_landmark(self, frame):
+    def _get_buffer(self, name, shape):
+        buffer = self.__buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self.__buffers[name] = buffer
+        buffer.flags.writeable = True
+        return buffer
+
+    def _resize_frame(self, frame):
+        shape = (self._h, self._w, 3)
+        if frame.shape != shape:
+            frame = cv2.resize(
+                frame, (self._w, self._h), dst=self._get_buffer("resized", shape)
+            )
+        if not self._flip_frame:
+            return frame
+        return cv2.flip(frame, 1, dst=self._get_buffer("flipped", shape))
+
+    def _convert_color(self, bgr_frame):
+        # Once a face is locked, only the region around it is converted.
+        self.__bgr_frame = bgr_frame
+        self.__crop = None if self._roi is None else self._roi.get_box()
+        if self.__crop is None:
+            name = "rgb"
+        else:
+            x0, y0, x1, y1 = self.get_face_box()
+            bgr_frame = bgr_frame[y0:y1, x0:x1]
+            name = "rgb_crop"
+        rgb_frame = cv2.cvtColor(
+            bgr_frame, cv2.COLOR_BGR2RGB, dst=self._get_buffer(name, bgr_frame.shape)
+        )
+        rgb_frame.flags.writeable = False
+        return rgb_frame
+
+    def detect_landmark(self, frame, timestamp=None):
         """mediapipe Face Mesh를 활용해 랜드마크를 탐지한다.
 
         Args:
             frame (image, ndarray): RGB 상태의 이미지.
+            timestamp (float): 프레임 촬영 시각 (time.perf_counter 기준).
+                None이면 탐지한 시각을 사용한다.
 
         Returns:
             bool: 랜드마크 탐지 성공 여부.
         """
-        results = self._face_mesh.process(frame)
-        landmarks = results.multi_face_landmarks
+        start = perf_counter()
+        landmarks = self._process_face_mesh(frame, self.__crop)
+        if not landmarks and self.__crop is not None:
+            # The face left the region: search the whole frame right away.
+            self._roi.lose()
+            frame = self._convert_color(self.__bgr_frame)
+            landmarks = self._process_face_mesh(frame, None)
+            self._telemetry.count("roi_fallbacks")
+        self._telemetry.observe("facemesh", perf_counter() - start)
+        self._telemetry.count("faces_found" if landmarks else "faces_lost")
+
         if landmarks:
-            self.__landmarks = landmarks[0].landmark
+            self._set_crop_transform(self.__crop)
+            self._update_landmarks(landmarks[0].landmark)
+            self.__timestamp = perf_counter() if timestamp is None else timestamp
+            self.__face_points = self._point_filter.filter(
+                self._get_face_points(), self.__timestamp
+            )
+            if self._roi is not None:
+                self._roi.update(self.__pixels[:, :2])
+        else:
+            self._pose_engine.reset()
+            self._baseline.lose()
+            if self._roi is not None:
+                self._roi.lose()
         return bool(landmarks)
 
+    def _process_face_mesh(self, frame, crop):
+        if self._roi is not None:
+            self._roi.add_processed(frame.shape, crop is not None)
+        face_mesh = self._face_mesh if crop is None else self._roi_face_mesh
+        results = face_mesh.process(frame)
+        return results.multi_face_landmarks
+
+    def _set_crop_transform(self, crop):
+        # Maps crop-normalized landmarks back to full-frame pixels.
+        if crop is None:
+            self.__scale[:] = (self._w, self._h, 1)
+            self.__offset[:] = 0
+        else:
+            x0, y0, x1, y1 = crop
+            self.__scale[:] = (x1 - x0, y1 - y0, (x1 - x0) / self._w)
+            self.__offset[:] = (x0, y0, 0)
+        if not self._flip_frame:
+            # Mirror x as part of the transform: (1 - x) * s + o = -s * x + (s + o).
+            self.__offset[0] += self.__scale[0]
+            self.__scale[0] = -self.__scale[0]
+
+    def _update_landmarks(self, landmarks):
+        # Only the needed ids, read in one pass without Python bytecode per
+        # landmark: map and attrgetter run in C and fromiter fills the array.
+        self.__flat_points[:] = np.fromiter(
+            chain.from_iterable(
+                map(_get_xyz, map(landmarks.__getitem__, self._read_ids))
+            ),
+            np.float32,
+            self.__flat_points.size,
+        )
+        # Pixel coordinates are truncated to integers like int(x * w).
+        np.multiply(self.__points, self.__scale, out=self.__pixels)
+        np.add(self.__pixels, self.__offset, out=self.__pixels)
+        np.trunc(self.__pixels[:, :2], out=self.__pixels[:, :2])
+
     def get_face_direction(self):
         """얼굴 방향을 계산해 방향 정보를 리스트로 반환한다.
 
+        방향은 학습한 기준 자세(PoseBaseline)와의 차이로 판단하며,
+        방향이 없는 동안의 각도로 기준 자세를 갱신한다. 기준 자세는 프레임 촬영 시각으로
+        갱신하므로, 같은 랜드마크로 다시 호출하면 (예: 움직임이 없어 탐지를 생략한 프레임)
+        갱신하지 않는다.
+
         Returns:
             list: 방향 정보가 담긴 리스트.
 
@@ -150,79 +371,209 @@ class Detector(object):
             - 2: 왼쪽 (Left)
             - 3: 오른쪽 (Right)
         """
-        pitch, yaw, roll = self._get_face_angles()
+        raw_pitch, raw_yaw, roll = self.get_face_angles()
+        pitch, yaw = self._baseline.apply(raw_pitch, raw_yaw)
+        settings = self._settings.get()
         directions = []
-        if self._is_up(pitch) and self._moved_vertically(pitch):
+        if self._is_up(pitch, settings):
             directions.append(0)
-        elif self._is_down(pitch) and self._moved_vertically(pitch):
+        elif self._is_down(pitch, settings):
             directions.append(1)
-        if self._is_left(yaw) and self._moved_horizontally(yaw):
+        if self._is_left(yaw, settings):
             directions.append(2)
-        elif self._is_right(yaw) and self._moved_horizontally(yaw):
+        elif self._is_right(yaw, settings):
             directions.append(3)
+        # Frame time, so repeated landmarks do not advance the quiet time or EWMA.
+        self._baseline.update(
+            raw_pitch, raw_yaw, is_quiet=not directions, now=self.__timestamp
+        )
+        return directions
 
-        self.__prev_x_angle = pitch
-        self.__prev_y_angle = yaw
+    def _is_up(self, x, settings):
+        return x > settings.up_threshold
 
-        return directions
+    def _is_down(self, x, settings):
+        return x < settings.down_threshold
 
-    def _moved_vertically(self, x):
-        if int(x) ^ int(self.__prev_x_angle) <= 0:
-            return True
-        else:
-            return abs(x) >= abs(self.__prev_x_angle) - 3
+    def _is_left(self, y, settings):
+        return y < settings.left_threshold
 
-    def _moved_horizontally(self, y):
-        if int(y) ^ int(self.__prev_y_angle) <= 0:
-            return True
-        else:
-            return abs(y) >= abs(self.__prev_y_angle) - 3
+    def _is_right(self, y, settings):
+        return y > settings.right_threshold
 
-    def _is_up(self, x):
-        return x > self._up_thre
+    def get_face_angles(self, filtered=True):
+        """탐지한 랜드마크로 얼굴의 회전 각도를 계산한다.
 
-    def _is_down(self, x):
-        return x < self._down_thre
+        Args:
+            filtered (bool): True이면 걸러진 각도를 촬영 후 지난 시간만큼
+                앞으로 예측해 현재 각도를 반환한다. False이면 마지막 프레임의 각도.
 
-    def _is_left(self, y):
-        return y < self._left_thre
+        Returns:
+            list: pitch(위가 양수), yaw(오른쪽이 양수), roll 순서의 회전 각도(degree).
+        """
+        if not filtered:
+            return self._solve_face_angles(self._get_face_points())
 
-    def _is_right(self, y):
-        return y > self._right_thre
+        if self.__angles_timestamp != self.__timestamp:
+            # Filter once per new set of landmarks.
+            angles = self._solve_face_angles(self.__face_points)
+            self._angle_filter.filter(angles, self.__timestamp)
+            self.__angles_timestamp = self.__timestamp
+        now = perf_counter()
+        self.__latency = now - self.__timestamp
+        return list(self._angle_filter.predict(now))
 
-    def _get_face_angles(self):
-        object_points = np.array(
-            [self._get_face_points(id) for id in self._face_indexs], dtype=np.float64
-        )
-        image_points = np.array(object_points[:, :2], dtype=np.float64)
+    def get_latency(self):
+        """마지막으로 예측한 각도의 촬영 후 지연 시간을 반환한다.
 
-        _, rotation_vector, _ = cv2.solvePnP(
-            object_points, image_points, self._cam_matrix, self._dist_matrix
-        )
-        rotation_matrix, _ = cv2.Rodrigues(rotation_vector)
-        angles, *_ = cv2.RQDecomp3x3(rotation_matrix)
-        angles = [angle * 360 for angle in angles]
-        return angles
+        Returns:
+            float: 촬영부터 각도 계산까지 걸린 시간(초). 계산한 적이 없다면 None.
+        """
+        return self.__latency
+
+    def _solve_face_angles(self, points):
+        # Landmark depth is normalized by the frame width; scale it like x.
+        pose_points = self.__pose_points
+        pose_points[:] = points
+        pose_points[:, 2] *= self._w
+        return list(self._pose_engine.estimate(pose_points))
 
-    def _get_face_points(self, id):
-        landmark = self.__landmarks[id]
-        return [self._rescale_x(landmark.x), self._rescale_y(landmark.y), landmark.z]
+    def get_face_box(self):
+        """현재 얼굴 주변 영역을 반환한다.
+
+        Returns:
+            tuple: convert_frame이 반환한 이미지 기준 (x0, y0, x1, y1) 픽셀 좌표.
+            얼굴을 찾지 못했거나 영역 처리를 사용하지 않으면 None.
+        """
+        box = None if self._roi is None else self._roi.get_box()
+        if box is None or self._flip_frame:
+            return box
+        # The region is tracked in mirrored coordinates.
+        x0, y0, x1, y1 = box
+        return self._w - x1, y0, self._w - x0, y1
 
-    def update_blink_count(self):
-        """눈 깜빡임을 탐지해 눈 깜빡임 정보를 업데이트한다.
+    def get_landmark_pixels(self):
+        """마지막으로 탐지한 랜드마크의 픽셀 좌표를 반환한다.
 
         Returns:
-            bool: 임계값(프레임) 이상의 눈 깜빡임 여부.
-        """
-        ear = self.get_both_eyes_ear()
-        if ear <= self._ear_thre:
-            if self.__blink_counter >= self._blink_frame_thre:
-                self.__blink_counter = 0
-                return True
-            self.__blink_counter += 1
+            ndarray: convert_frame이 반환한 이미지 기준 (N, 2) 픽셀 좌표.
+            다음 탐지에서 덮어쓰므로, 보관하려면 복사해야 한다.
+        """
+        pixels = self.__pixels[:, :2]
+        if self._flip_frame:
+            return pixels
+        # Landmarks are kept in mirrored coordinates.
+        mirrored = pixels.copy()
+        np.subtract(self._w, mirrored[:, 0], out=mirrored[:, 0])
+        return mirrored
+
+    def warm_up(self):
+        """빈 이미지로 Face Mesh를 한 번 실행해, 첫 프레임의 초기화 지연을 없앤다.
+
+        얼굴이 없는 이미지이므로 추적 상태는 남지 않는다.
+        """
+        rgb_frame = np.zeros((self._h, self._w, 3), dtype=np.uint8)
+        rgb_frame.flags.writeable = False
+        self._face_mesh.process(rgb_frame)
+        if self._roi is not None:
+            self._roi_face_mesh.process(rgb_frame)
+
+    def get_roi_stats(self):
+        """얼굴 주변 영역 처리 통계를 반환한다.
+
+        Returns:
+            dict: FaceROI.get_stats 참고. 영역 처리를 사용하지 않으면 None.
+        """
+        return None if self._roi is None else self._roi.get_stats()
+
+    def get_pose_stats(self):
+        """얼굴 각도 계산 통계를 반환한다.
+
+        Returns:
+            dict: PoseEngine.get_stats 참고.
+        """
+        return self._pose_engine.get_stats()
+
+    def _get_face_points(self):
+        return self.__pixels[self._face_rows]
+
+    def update_eye_event(self):
+        """마지막으로 탐지한 랜드마크로 눈 깜빡임과 윙크를 판단한다.
+
+        같은 랜드마크로 다시 호출하면 판단하지 않는다.
+
+        Returns:
+            str: "blink", "wink_left", "wink_right" 중 하나. 동작이 없다면 None.
+            *module.blink.BlinkDetector 참고.
+        """
+        settings = self._settings.get()
+        if settings.version != self.__blink_version:
+            self.__blink_version = settings.version
+            # The frame threshold was tuned at the nominal frame rate.
+            self._blink.configure(
+                settings.ear_threshold,
+                settings.blink_frame_threshold / NOMINAL_FRAME_RATE,
+            )
+        left, right = self.get_eyes_ear()
+        event = self._blink.update(left, right, self.__timestamp)
+        if event is not None:
+            self._telemetry.count(self._event_counters[event])
+        return event
+
+    def update_gestures(self):
+        """마지막으로 탐지한 랜드마크로 입 벌리기, 눈썹 올리기, 고개 끄덕임을 판단한다.
+
+        같은 랜드마크로 다시 호출하면 판단하지 않는다. 눈이 감겨 있는 동안에는
+        비율 동작을 판단하지 않으므로 update_eye_event 다음에 호출한다.
+        constant.GESTURE_ACTIONS에 동작이 없는(None) 동작은 판단하지 않는다.
+
+        Returns:
+            list: 이번 프레임에 발생한 동작 이름. 없으면 빈 리스트.
+            *module.gesture 참고.
+        """
+        if not self._active_gestures and self._nod is None:
+            return []
+        start = perf_counter()
+        timestamp = self.__timestamp
+        if not self._active_gestures:
+            events = []
+        elif self._blink.is_eye_closed():
+            # A held blink or wink must not also start a face gesture.
+            self._gestures.reset()
+            events = []
         else:
-            self.__blink_counter = 0
-        return False
+            events = self._gestures.update(self.__pixels, timestamp)
+        if self._nod is not None and self._nod.update(
+            self.get_face_angles()[0], timestamp
+        ):
+            events.append(NOD)
+        for event in events:
+            self._telemetry.count(f"gesture_{event}")
+        self._telemetry.observe("gesture", perf_counter() - start)
+        return events
+
+    def get_gesture_stats(self):
+        """동작별 발생 횟수와 마지막 비율을 반환한다.
+
+        Returns:
+            dict: GestureEngine.get_stats, NodDetector.get_stats 값과
+            동작별 마지막 비율(ratios).
+        """
+        stats = self._gestures.get_stats()
+        if self._nod is not None:
+            stats.update(self._nod.get_stats())
+        stats["ratios"] = self._gestures.get_ratios()
+        return stats
+
+    def get_eyes_ear(self):
+        """양쪽 눈의 EAR(Eye Aspect Ratio)을 각각 반환한다.
+
+        Returns:
+            tuple: 사용자 기준 (왼쪽 눈, 오른쪽 눈)의 EAR.
+        """
+        # Rows follow the mirrored image, where the first eye is the user's left.
+        left, right = self._get_eyes_ear().tolist()
+        return left, right
 
     def get_both_eyes_ear(self):
         """양쪽 눈의 EAR(Eye Aspect Ratio)을 반환한다.
@@ -230,45 +581,54 @@ class Detector(object):
         Returns:
             float: 양쪽 눈의 EAR 평균.
         """
-        ears = [
-            self._get_single_eye_ear(single_eye_ids)
-            for single_eye_ids in self._eye_indexs
-        ]
-        mean_ear = np.mean(ears)
-        return mean_ear
+        ears = self._get_eyes_ear()
+        return (ears[0] + ears[1]) / 2
 
-    def _get_single_eye_ear(self, eye_landmark_ids):
-        ear_ys = [self._get_y_dist(ids) for ids in eye_landmark_ids[:2]]
-        ear_x = self._get_x_dist(eye_landmark_ids[2])
-        ear = np.sum(ear_ys) / (2 * ear_x)
-        return ear
-
-    def _get_x_dist(self, landmark_ids):
-        landmarks = [self._rescale_x(self.__landmarks[id].x) for id in landmark_ids]
-        return abs(landmarks[0] - landmarks[1])
-
-    def _get_y_dist(self, landmark_ids):
-        landmarks = [self._rescale_y(self.__landmarks[id].y) for id in landmark_ids]
-        return abs(landmarks[0] - landmarks[1])
+    def _get_eyes_ear(self):
+        x = self.__pixels[:, 0]
+        y = self.__pixels[:, 1]
+        vertical = np.abs(y[self._eye_upper_rows] - y[self._eye_lower_rows]).sum(axis=1)
+        corners = x[self._eye_corner_rows]
+        horizontal = np.abs(corners[:, 0] - corners[:, 1])
+        return vertical / (2 * horizontal)
 
 
 class Controller(object):
     """입력장치를 활용한 동작 수행.
 
+    Args:
+        backend (InputBackend): 입력 장치. None이면 환경에 맞는 장치를 사용한다.
+        settings (SettingsStore): 설정. None이면 설정 파일을 불러온다.
+        telemetry (Telemetry): 입력 동작 횟수를 기록할 객체. None이면 새로 만든다.
+
     Functions:
         move_cursor_by_face
+        stop_cursor
         click
+        right_click
+        toggle_drag
+        end_drag
+        scroll
+        zoom
+        handle_gesture
         add_command
         count_btn_command
         has_command
+        get_screen_size
+        get_move_count
+        get_input_latency
+        get_action_stats
+        release
     """
 
-    def __init__(self):
+    def __init__(self, backend=None, settings=None, telemetry=None):
+        self._backend = load_backend() if backend is None else backend
+        self._telemetry = Telemetry() if telemetry is None else telemetry
         self.__cursor_ = (
-            self._cursor_up,
-            self._cursor_down,
-            self._cursor_left,
-            self._cursor_right,
+            (0, -1),  # Up
+            (0, 1),  # Down
+            (-1, 0),  # Left
+            (1, 0),  # Right
         )
         self.__btn_command_ = {
             "zoom-in": self._zoom_in,
@@ -276,66 +636,148 @@ class Controller(object):
             "scroll-up": self._scroll_up,
             "scroll-down": self._scroll_down,
         }
-        self._dist = int(CURSOR_SENSITIVITY)
-        self._scroll_height = int(SCROLL_SENSITIVITY)
-        self._ctrl_key = "ctrl"
-
-        if platform.system() == "Darwin":  # for MacOS
-            self._scroll_height = int(SCROLL_SENSITIVITY / 50)
-            self._ctrl_key = "command"
-
+        self._settings = SettingsStore() if settings is None else settings
+        self._is_mac = platform.system() == "Darwin"
+        self._ctrl_key = "command" if self._is_mac else "ctrl"
+        self.__settings_version = None
+
+        actions = {
+            "click": self.click,
+            "right_click": self.right_click,
+            "drag": self.toggle_drag,
+            "scroll_up": partial(self.scroll, 1),
+            "scroll_down": partial(self.scroll, -1),
+            "zoom_in": partial(self.zoom, 1),
+            "zoom_out": partial(self.zoom, -1),
+        }
+        self.__gesture_actions = {
+            gesture: actions[action]
+            for gesture, action in GESTURE_ACTIONS.items()
+            if action is not None
+        }
+        self.__is_dragging = False
         self.__command = None
         self.__command_counter = 0
+        # Clicks and commands run on the executor thread, not in the detection loop.
+        self.__executor = ActionExecutor()
+        self.__cursor_motion = CursorMotion(self._backend, 0, executor=self.__executor)
+        self._apply_settings()
+
+    def _apply_settings(self):
+        # Cheap version check, so the store can swap settings between frames.
+        settings = self._settings.get()
+        if settings.version == self.__settings_version:
+            return
+        self.__settings_version = settings.version
+        # Cursor sensitivity was tuned as pixels per camera frame.
+        self._speed = settings.cursor_sensitivity * NOMINAL_FRAME_RATE
+        self._scroll_height = settings.scroll_sensitivity
+        if self._is_mac:
+            self._scroll_height = int(settings.scroll_sensitivity / 50)
+        self.__cursor_motion.set_speed(self._speed)
+
+    def move_cursor_by_face(self, directions):
+        """방향 정보를 받아 마우스 커서의 이동 방향을 정한다.
+
+        커서는 CursorMotion 스레드가 카메라 프레임과 별개로 움직인다.
 
-    def _cursor_up(self, x, y):
-        return x, y - self._dist
+        Args:
+            directions: 방향 정보가 담긴 리스트. 비어 있으면 커서를 멈춘다.
+        """
+        self._apply_settings()
+        dx = dy = 0
+        for direction in directions:
+            x, y = self.__cursor_[direction]
+            dx += x
+            dy += y
+        self.__cursor_motion.set_target(dx, dy)
 
-    def _cursor_down(self, x, y):
-        return x, y + self._dist
+    def stop_cursor(self):
+        """커서 이동을 멈춘다."""
+        self.__cursor_motion.stop()
 
-    def _cursor_left(self, x, y):
-        return x - self._dist, y
+    def click(self):
+        """마우스 커서에서 클릭을 수행한다. 실행을 기다리지 않는다."""
+        self.__executor.submit(self._backend.click)
+        self._telemetry.count("clicks")
 
-    def _cursor_right(self, x, y):
-        return x + self._dist, y
+    def right_click(self):
+        """마우스 커서에서 오른쪽 클릭을 수행한다. 실행을 기다리지 않는다."""
+        self.__executor.submit(self._backend.right_click)
+        self._telemetry.count("right_clicks")
 
-    def move_cursor_by_face(self, directions):
-        """방향 정보를 받아 마우스 커서를 이동한다.
+    def toggle_drag(self):
+        """왼쪽 버튼을 누르고 있지 않다면 누르고, 누르고 있다면 뗀다.
+
+        누르고 있는 동안 커서를 움직이면 끌기(drag)가 된다.
+        """
+        if self.__is_dragging:
+            self.end_drag()
+            return
+        if not self.__executor.submit(self._backend.mouse_down):
+            return  # Dropped: the button was not pressed.
+        self.__is_dragging = True
+        self._telemetry.count("drags")
+
+    def end_drag(self):
+        """누르고 있는 왼쪽 버튼을 뗀다."""
+        if self.__is_dragging:
+            self.__executor.submit(self._backend.mouse_up, required=True)
+            self.__is_dragging = False
+
+    def scroll(self, direction):
+        """커서 아래의 창을 스크롤한다. 실행을 기다리지 않는다.
 
         Args:
-            directions: 방향 정보가 담긴 리스트.
+            direction (int): 1이면 위로, -1이면 아래로 스크롤한다.
         """
-        cursor = pyautogui.position()
-        for direction in directions:
-            cursor = self.__cursor_[direction](*cursor)
-        pyautogui.moveTo(*cursor)
+        self._apply_settings()
+        self.__executor.submit(self._backend.scroll, direction * self._scroll_height)
+        self._telemetry.count("scrolls")
 
-    def click(self):
-        """마우스 커서에서 클릭을 수행한다."""
-        pyautogui.click()
+    def zoom(self, direction):
+        """커서 아래의 창을 확대하거나 축소한다. 실행을 기다리지 않는다.
+
+        Args:
+            direction (int): 1이면 확대, -1이면 축소한다.
+        """
+        key = "+" if direction > 0 else "-"
+        self.__executor.submit(self._backend.hotkey, self._ctrl_key, key)
+        self._telemetry.count("zooms")
+
+    def handle_gesture(self, event):
+        """얼굴 동작에 연결된 입력 동작을 수행한다.
+
+        Args:
+            event (str): Detector.update_eye_event, update_gestures가 반환한 동작.
+            *constant.GESTURE_ACTIONS 참고.
+        """
+        action = self.__gesture_actions.get(event)
+        if action is not None:
+            action()
 
     def _with_focus(function):
         def focus(self):
-            pyautogui.doubleClick()
+            self._backend.double_click()
             function(self)
 
         return focus
 
     @_with_focus
     def _zoom_in(self):
-        pyautogui.hotkey(self._ctrl_key, "+")
+        self._backend.hotkey(self._ctrl_key, "+")
 
     @_with_focus
     def _zoom_out(self):
-        pyautogui.hotkey(self._ctrl_key, "-")
+        self._backend.hotkey(self._ctrl_key, "-")
 
     @_with_focus
     def _scroll_up(self):
-        pyautogui.scroll(self._scroll_height)
+        self._backend.scroll(self._scroll_height)
 
     @_with_focus
     def _scroll_down(self):
-        pyautogui.scroll(-self._scroll_height)
+        self._backend.scroll(-self._scroll_height)
 
     def add_command(self, command):
         """객체의 __command 값을 추가한다.
@@ -349,7 +791,9 @@ class Controller(object):
     def count_btn_command(self):
         """객체의 __command가 특정 프레임 후에 실행될 수 있도록 카운트한다."""
         if self.__command_counter > 30:
-            self.__command()
+            self._apply_settings()
+            self.__executor.submit(self.__command)
+            self._telemetry.count("commands")
             self.__command = None
             self.__command_counter = 0
         else:
@@ -363,21 +807,127 @@ class Controller(object):
         """
         return self.__command is not None
 
+    def get_screen_size(self):
+        """화면 크기를 반환한다.
+
+        Returns:
+            tuple: (width, height)
+        """
+        return self._backend.size()
+
+    def get_move_count(self):
+        """얼굴 방향으로 커서를 옮긴 횟수를 반환한다.
+
+        Returns:
+            int: CursorMotion.get_move_count 참고.
+        """
+        return self.__cursor_motion.get_move_count()
+
+    def get_input_latency(self):
+        """입력 동작별 소요 시간을 반환한다.
+
+        Returns:
+            dict: InputBackend.get_latency 참고.
+        """
+        return self._backend.get_latency()
+
+    def get_action_stats(self):
+        """입력 동작 큐의 길이와 지연 통계를 반환한다.
+
+        Returns:
+            dict: ActionExecutor.get_stats 참고.
+        """
+        return self.__executor.get_stats()
+
+    def release(self):
+        """커서 이동 스레드와 동작 실행 스레드를 멈춘다. 누르고 있는 버튼은 뗀다."""
+        self.__cursor_motion.release()
+        self.end_drag()
+        self.__executor.release()
+
 
 class Process(object):
     """프로그램의 실행 객체
 
-    Function: run
+    Args:
+        grabber (FrameGrabber): 최신 프레임을 제공하는 객체.
+        max_frame_rate (float): 목표 초당 처리 프레임 수.
+        backend (InputBackend): 입력 장치. None이면 환경에 맞는 장치를 사용한다.
+        detector (Detector): 미리 만들어 둔 Detector. None이면 첫 프레임으로 만든다.
+        settings (SettingsStore): Detector, Controller가 함께 읽는 설정.
+            None이면 설정 파일을 불러온다. 파일이 바뀌면 프레임 사이에 다시 불러온다.
+        telemetry (Telemetry): 단계별 소요 시간과 횟수를 기록할 객체.
+            None이면 기록만 하고 파일이나 HTTP로 내보내지 않는다.
+        baseline (PoseBaseline): 방향 판단의 기준 자세. None이면 저장된 기준 자세를
+            불러오며, release에서 저장한다.
+        publisher (EventServer): 얼굴 각도, 얼굴 탐지 여부와 동작을 보낼 객체.
+            None이면 보내지 않는다.
+
+    Example:
+    >>> grabber = FrameGrabber(cv2.VideoCapture(0))
+    >>> grabber.start()
+    >>> process = Process(grabber)
+
+    Functions:
+        run
+        suspend
+        resume
+        release
+        has_face
+        get_move_count
+        get_frame_age
+        get_gate_stats
+        get_action_stats
+        get_settings_stats
+        get_telemetry
+        render_preview
+        get_preview_stats
+        get_suspend_stats
+        get_scheduler_stats
     """
 
-    def __init__(self, capture):
-        self._cap = capture
-        self._max_frame_rate = 60
-        self.__controller = Controller()
-        self.__detector = None
-        self.__prev_time = 0
-        self.__prev_allow_showing_frame = False
-        self.__is_cv_inited = False
+    def __init__(
+        self,
+        grabber,
+        max_frame_rate=60,
+        backend=None,
+        detector=None,
+        settings=None,
+        telemetry=None,
+        baseline=None,
+        publisher=None,
+    ):
+        self._grabber = grabber
+        self.__publisher = publisher
+        self.__settings = SettingsStore() if settings is None else settings
+        self.__telemetry = Telemetry() if telemetry is None else telemetry
+        self.__baseline = PoseBaseline() if baseline is None else baseline
+        self.__scheduler = FrameScheduler(max_frame_rate)
+        self.__controller = Controller(backend, self.__settings, self.__telemetry)
+        self.__detector = detector
+        self.__gate = MotionGate()
+        self.__is_detected = False
+        self.__was_detected = False
+        self.__preview = PreviewRenderer(
+            PREVIEW_FRAME_RATE, PREVIEW_OVERLAY, on_open=self._move_frame_window
+        )
+        self.__resume_time = None
+        self.__resume_latency = None
+        # Stats owned by other objects are read only when a snapshot is taken.
+        for name, function in (
+            ("capture", grabber.get_stats),
+            ("scheduler", self.__scheduler.get_stats),
+            ("gate", self.__gate.get_stats),
+            ("actions", self.__controller.get_action_stats),
+            ("settings", self.__settings.get_stats),
+            ("detection", self._get_detection_stats),
+            ("preview", self.__preview.get_stats),
+            ("baseline", self.__baseline.get_stats),
+            ("gestures", self._get_gesture_stats),
+        ):
+            self.__telemetry.add_collector(name, function)
+        if publisher is not None:
+            self.__telemetry.add_collector("ipc", publisher.get_stats)
 
     def run(self, command, allow_showing_frame, allow_detecting_direction):
         """프로그램을 수행한다.
@@ -386,49 +936,245 @@ class Process(object):
             command (str): tkinter 버튼으로부터 입력된 명령 정보.
             allow_showing_frame (bool): 화면에 실시간 프레임을 보여줄 지 여부.
             allow_detecting_direction (bool): 얼굴 방향 계산 수행 여부.
-        """
-        success, frame = self._cap.read()
-        current_time = time() - self.__prev_time
-
-        if not success or (current_time < 1 / self._max_frame_rate):
-            # Limit the frame rate to prevent overhead
-            # when it exceeds the maximum.
-            return
-
-        self.__prev_time = time()
-        if self.__detector is None:
-            self.__detector = Detector(frame)
-
-        frame, rgb_frame = self.__detector.convert_frame(frame)
-        is_detected = self.__detector.detect_landmark(rgb_frame)
 
+        Returns:
+            int: 다음 처리 시점까지 남은 시간(ms).
+        """
         if command:
+            # Kept even if no frame is processed on this call.
             self.__controller.add_command(command)
+        if not self.__scheduler.is_due():
+            # Not yet time for the next frame: skip before touching the camera.
+            return self.__scheduler.get_delay_ms()
+
+        start = perf_counter()
+        frame, timestamp = self._grabber.read_with_timestamp()
+        if frame is None:
+            # No new frame yet: sleep until the camera's next one is due, then
+            # check every 2 ms, without using up the tick.
+            delay = self._grabber.get_next_frame_delay()
+            return 2 if delay is None else max(ceil(delay * 1000), 2)
+
+        self.__scheduler.begin(ready=timestamp)
+        self.__telemetry.count("frames")
+        if timestamp is not None:
+            self.__telemetry.observe("frame_age", start - timestamp)
+        self._process_frame(
+            frame, timestamp, allow_showing_frame, allow_detecting_direction
+        )
+        self.__telemetry.observe("frame", perf_counter() - start)
+        # Between frames: a changed settings file is swapped in as a whole.
+        self.__settings.check()
+        self.__telemetry.check()
+        return self.__scheduler.get_delay_ms()
+
+    def _process_frame(
+        self, frame, timestamp, allow_showing_frame, allow_detecting_direction
+    ):
+        if self.__detector is None:
+            self.__detector = Detector(
+                frame,
+                settings=self.__settings,
+                telemetry=self.__telemetry,
+                baseline=self.__baseline,
+            )
+        telemetry = self.__telemetry
+
+        start = perf_counter()
+        frame, rgb_frame = self.__detector.convert_frame(frame)
+        telemetry.observe("preprocess", perf_counter() - start)
+        if self.__gate.should_detect(frame, self.__detector.get_face_box()):
+            self.__is_detected = self.__detector.detect_landmark(rgb_frame, timestamp)
+        # Otherwise nothing moved: the last landmarks are reused.
+        is_detected = self.__is_detected
+        publisher = self.__publisher
+        if publisher is not None and timestamp is None:
+            timestamp = perf_counter()  # Captures without a read time.
+        if publisher is not None and is_detected != self.__was_detected:
+            publisher.publish_face(timestamp, is_detected)
+        self.__was_detected = is_detected
+
+        start = perf_counter()
+        if is_detected and allow_detecting_direction:
+            directions = self.__detector.get_face_direction()
+            self.__controller.move_cursor_by_face(directions)
+            if publisher is not None:
+                angles = self.__detector.get_face_angles()
+                publisher.publish_pose(timestamp, angles, directions)
+        else:
+            self.__controller.stop_cursor()
+        telemetry.observe("direction", perf_counter() - start)
 
         if is_detected:
-            if allow_detecting_direction:
-                directions = self.__detector.get_face_direction()
-                if directions:
-                    self.__controller.move_cursor_by_face(directions)
-
-            is_blinked = self.__detector.update_blink_count()
-            if is_blinked:
-                self.__controller.click()
+            event = self.__detector.update_eye_event()
+            events = self.__detector.update_gestures()
+            if event is not None:
+                events.append(event)
+            for event in events:
+                self.__controller.handle_gesture(event)
+                if publisher is not None:
+                    publisher.publish_event(timestamp, event)
 
             if self.__controller.has_command():
                 self.__controller.count_btn_command()
 
-        if allow_showing_frame:
-            cv2.imshow("Frame", frame)
-            cv2.setWindowProperty("Frame", cv2.WND_PROP_TOPMOST, 1)
-            if not self.__prev_allow_showing_frame or not self.__is_cv_inited:
-                # (Handling transition from pause) or (Initial position)
-                self._move_frame_window()
-                self.__is_cv_inited = True
-        self.__prev_allow_showing_frame = allow_showing_frame
-
-    def _move_frame_window(self):
-        full_w, full_h = pyautogui.size()
+            if self.__resume_time is not None:
+                self.__resume_latency = perf_counter() - self.__resume_time
+                self.__resume_time = None
+
+        if not allow_showing_frame:
+            self.__preview.hide()
+        elif self.__preview.is_due():
+            # Only copied here; the window is drawn by render_preview.
+            detector = self.__detector
+            if is_detected:
+                self.__preview.submit(
+                    frame,
+                    detector.get_landmark_pixels(),
+                    detector.get_face_box(),
+                    detector.get_face_angles(),
+                    detector.get_both_eyes_ear(),
+                )
+            else:
+                self.__preview.submit(frame)
+
+    def suspend(self):
+        """카메라 읽기와 얼굴 탐지를 멈춘다.
+
+        Detector는 그대로 유지해 다시 시작할 때 바로 탐지할 수 있도록 한다.
+        """
+        self._grabber.pause()
+        self.__controller.stop_cursor()
+        self.__controller.end_drag()
+        self.__preview.hide()
+        cv2.destroyAllWindows()
+        self.__resume_time = None
+        if self.__publisher is not None and self.__was_detected:
+            self.__publisher.publish_face(perf_counter(), False)
+        self.__was_detected = False
+
+    def resume(self):
+        """멈춘 카메라 읽기와 얼굴 탐지를 다시 시작한다."""
+        self.__is_detected = False
+        self.__gate.reset()
+        self.__resume_time = perf_counter()
+        self._grabber.resume()
+
+    def release(self):
+        """카메라, 입력 스레드와 프레임 창을 해제하고 기준 자세와 마지막 통계를 저장한다."""
+        self.__controller.release()
+        self._grabber.release()
+        cv2.destroyAllWindows()
+        self.__baseline.save()
+        self.__telemetry.release()
+
+    def has_face(self):
+        """마지막으로 처리한 프레임에서 얼굴을 찾았는지 반환한다.
+
+        Returns:
+            bool: 얼굴 탐지 여부.
+        """
+        return self.__is_detected
+
+    def get_move_count(self):
+        """얼굴 방향으로 커서를 옮긴 횟수를 반환한다.
+
+        Returns:
+            int: Controller.get_move_count 참고.
+        """
+        return self.__controller.get_move_count()
+
+    def get_scheduler_stats(self):
+        """프레임 처리 시점 통계를 반환한다.
+
+        Returns:
+            dict: FrameScheduler.get_stats 참고.
+        """
+        return self.__scheduler.get_stats()
+
+    def get_suspend_stats(self):
+        """일시 정지, 재시작에 걸린 시간을 반환한다.
+
+        Returns:
+            dict: 일시 정지 요청 후 카메라 읽기가 멈추기까지 걸린 시간(초)과
+            재시작 요청 후 얼굴을 다시 탐지하기까지 걸린 시간(초).
+        """
+        return {
+            "pause_latency": self._grabber.get_stats()["pause_latency"],
+            "resume_latency": self.__resume_latency,
+        }
+
+    def get_frame_age(self):
+        """처리한 프레임이 촬영된 후 처리되기까지 걸린 시간을 반환한다.
+
+        Returns:
+            float: 프레임 나이(초). 아직 처리한 프레임이 없다면 None.
+        """
+        return self._grabber.get_frame_age()
+
+    def get_gate_stats(self):
+        """움직임이 없어 Face Mesh 탐지를 생략한 통계를 반환한다.
+
+        Returns:
+            dict: MotionGate.get_stats 참고.
+        """
+        return self.__gate.get_stats()
+
+    def get_action_stats(self):
+        """입력 동작 큐의 길이와 지연 통계를 반환한다.
+
+        Returns:
+            dict: ActionExecutor.get_stats 참고.
+        """
+        return self.__controller.get_action_stats()
+
+    def get_settings_stats(self):
+        """현재 설정과 설정 파일을 불러온 통계를 반환한다.
+
+        Returns:
+            dict: SettingsStore.get_stats 참고.
+        """
+        return self.__settings.get_stats()
+
+    def get_telemetry(self):
+        """단계별 소요 시간, 횟수와 각 객체의 통계를 반환한다.
+
+        Returns:
+            dict: Telemetry.snapshot 참고.
+        """
+        return self.__telemetry.snapshot()
+
+    def _get_detection_stats(self):
+        found = self.__telemetry.get_counter("faces_found")
+        tried = found + self.__telemetry.get_counter("faces_lost")
+        return {
+            "hit_rate": found / tried if tried else 0.0,
+            "is_detected": self.__is_detected,
+        }
+
+    def _get_gesture_stats(self):
+        if self.__detector is None:
+            return {}
+        return self.__detector.get_gesture_stats()
+
+    def render_preview(self):
+        """미리보기 창을 그린다. 탐지와 별개로 App의 after 반복에서 호출한다.
+
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms).
+        """
+        return self.__preview.render()
+
+    def get_preview_stats(self):
+        """미리보기 통계를 반환한다.
+
+        Returns:
+            dict: PreviewRenderer.get_stats 참고.
+        """
+        return self.__preview.get_stats()
+
+    def _move_frame_window(self, window):
+        full_w, full_h = self.__controller.get_screen_size()
         x = full_w - self.__detector._w - 10
         y = full_h - self.__detector._h - 10
-        cv2.moveWindow("Frame", x, y)
+        cv2.moveWindow(window, x, y)
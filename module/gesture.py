@@ -0,0 +1,278 @@
+"""얼굴 랜드마크로 입 벌리기, 눈썹 올리기, 고개 끄덕임 등의 동작(gesture)을 판단한다.
+
+거리 비율로 정의한 동작은 표(GESTURES)에 선언하며, 프레임마다 모든 동작의 값을
+한 번의 NumPy 연산으로 계산한다. 동작을 추가해도 프레임마다 도는 Python 반복은 늘지 않는다.
+"""
+
+from collections import namedtuple
+from math import exp
+
+import numpy as np
+
+MOUTH_OPEN = "mouth_open"
+BROW_RAISE = "brow_raise"
+NOD = "nod"
+
+# A ratio gesture is active while sum(numerator distances) / sum(denominator
+# distances) is above on_ratio, until it falls below off_ratio. It fires once
+# it has been held for hold seconds, then every repeat seconds (None: once).
+# Landmark pairs are ((id, id), ...) of mediapipe Face Mesh ids.
+Gesture = namedtuple(
+    "Gesture",
+    ["name", "numerator", "denominator", "on_ratio", "off_ratio", "hold", "repeat"],
+)
+
+GESTURES = (
+    # Inner lip gap over mouth width.
+    Gesture(MOUTH_OPEN, ((13, 14),), ((61, 291),), 0.5, 0.4, 0.3, 0.3),
+    # Brow to inner eye corner over the distance between the outer eye corners.
+    # Both ends are fixed to the skull, so closing the eyes does not move it.
+    Gesture(BROW_RAISE, ((105, 133), (334, 362)), ((33, 263),), 0.87, 0.83, 0.3, 0.3),
+)
+
+
+class GestureEngine(object):
+    """표에 선언한 동작을 프레임마다 한 번의 벡터 연산으로 판단한다.
+
+    모든 동작에 쓰이는 랜드마크 쌍의 거리를 한 번에 구한 뒤, (동작, 쌍) 가중치 행렬을
+    곱해 동작별 비율을 얻는다. 이력 현상(hysteresis), 유지 시간, 반복 간격도
+    동작별 배열로 한 번에 판단하므로 동작이 일어난 프레임에서만 Python 반복이 돈다.
+
+    Args:
+        gestures (tuple): Gesture 목록.
+        landmark_ids (tuple): 입력 배열의 행 순서대로 나열한 랜드마크 id.
+            None이면 landmark_ids 속성의 순서를 그대로 사용한다.
+        max_gap (float): 상태를 유지할 최대 프레임 간격(초).
+
+    Example:
+    >>> engine = GestureEngine(GESTURES)
+    >>> ids = engine.landmark_ids  # rows of the points passed to update
+    >>> engine.update(points, timestamp)
+    ['mouth_open']
+
+    Functions:
+        update
+        get_ratios
+        reset
+        get_stats
+    """
+
+    def __init__(self, gestures=GESTURES, landmark_ids=None, max_gap=0.3):
+        self._names = tuple(gesture.name for gesture in gestures)
+        pairs = []
+        for gesture in gestures:
+            for pair in gesture.numerator + gesture.denominator:
+                if pair not in pairs:
+                    pairs.append(pair)
+        if landmark_ids is None:
+            landmark_ids = tuple(dict.fromkeys(id for pair in pairs for id in pair))
+        self.landmark_ids = tuple(landmark_ids)
+        row = {id: i for i, id in enumerate(self.landmark_ids)}
+        self._rows_a = np.array([row[a] for a, b in pairs], dtype=np.intp)
+        self._rows_b = np.array([row[b] for a, b in pairs], dtype=np.intp)
+
+        # ratios = (numerator @ distances) / (denominator @ distances)
+        column = {pair: i for i, pair in enumerate(pairs)}
+        self._numerator = np.zeros((len(gestures), len(pairs)))
+        self._denominator = np.zeros((len(gestures), len(pairs)))
+        for i, gesture in enumerate(gestures):
+            for pair in gesture.numerator:
+                self._numerator[i, column[pair]] += 1
+            for pair in gesture.denominator:
+                self._denominator[i, column[pair]] += 1
+
+        self._on_ratios = np.array([gesture.on_ratio for gesture in gestures])
+        self._off_ratios = np.array([gesture.off_ratio for gesture in gestures])
+        self._holds = np.array([gesture.hold for gesture in gestures])
+        self._repeats = np.array(
+            [
+                np.inf if gesture.repeat is None else gesture.repeat
+                for gesture in gestures
+            ]
+        )
+        self._max_gap = max_gap
+        self.__ratios = np.zeros(len(gestures))
+        self.__is_active = np.zeros(len(gestures), dtype=bool)
+        self.__next_fire = np.zeros(len(gestures))
+        self.__prev_time = None
+        self.__events = dict.fromkeys(self._names, 0)
+        self.__frames = 0
+
+    def update(self, points, timestamp):
+        """한 프레임의 랜드마크로 동작을 판단한다.
+
+        Args:
+            points (ndarray): (N, 2) 이상의 랜드마크 좌표. 행은 landmark_ids 순서.
+            timestamp (float): 프레임 촬영 시각(초). 이전보다 크지 않으면 무시한다.
+
+        Returns:
+            list: 이번 프레임에 발생한 동작 이름. 없으면 빈 리스트.
+        """
+        prev_time = self.__prev_time
+        if prev_time is not None and timestamp <= prev_time:
+            return []
+        if prev_time is not None and timestamp - prev_time > self._max_gap:
+            self.reset()
+        self.__prev_time = timestamp
+        self.__frames += 1
+
+        vectors = points[self._rows_a, :2] - points[self._rows_b, :2]
+        distances = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        denominators = self._denominator @ distances
+        np.divide(
+            self._numerator @ distances,
+            denominators,
+            out=self.__ratios,
+            where=denominators > 0,
+        )
+        ratios = self.__ratios
+
+        was_active = self.__is_active
+        is_active = np.where(
+            was_active, ratios > self._off_ratios, ratios > self._on_ratios
+        )
+        started = is_active & ~was_active
+        # A gesture first fires after being held, then every repeat seconds.
+        next_fire = np.where(started, timestamp + self._holds, self.__next_fire)
+        fired = is_active & (timestamp >= next_fire)
+        self.__next_fire = np.where(fired, timestamp + self._repeats, next_fire)
+        self.__is_active = is_active
+
+        if not fired.any():
+            return []
+        events = [self._names[i] for i in np.flatnonzero(fired)]
+        for name in events:
+            self.__events[name] += 1
+        return events
+
+    def get_ratios(self):
+        """마지막으로 계산한 동작별 비율을 반환한다. (기준 값 조정용)
+
+        Returns:
+            dict: 동작 이름과 비율.
+        """
+        return dict(zip(self._names, self.__ratios.tolist()))
+
+    def reset(self):
+        """진행 중인 동작을 지운다."""
+        self.__is_active[:] = False
+        self.__next_fire[:] = 0
+        self.__prev_time = None
+
+    def get_stats(self):
+        """판단한 프레임 수와 동작별 발생 횟수를 반환한다.
+
+        Returns:
+            dict: frames와 동작 이름별 횟수.
+        """
+        stats = {"frames": self.__frames}
+        stats.update(self.__events)
+        return stats
+
+
+class NodDetector(object):
+    """pitch의 각속도로 고개 끄덕임(아래로 숙였다가 돌아옴)을 판단한다.
+
+    각속도가 -speed보다 빠르게 숙이기 시작한 뒤 amplitude 이상 내려갔다가,
+    max_time 안에 내려간 각도의 return_ratio 이상 다시 올라오면 끄덕임으로 본다.
+    천천히 고개를 숙이는 커서 이동은 각속도가 낮아 끄덕임이 되지 않는다.
+
+    Args:
+        speed (float): 끄덕임으로 볼 최소 각속도(degree/s).
+        amplitude (float): 끄덕임으로 볼 최소 각도(degree).
+        max_time (float): 숙이기 시작해서 돌아오기까지의 최대 시간(초).
+        return_ratio (float): 돌아온 것으로 볼 내려간 각도 대비 비율.
+        refractory (float): 끄덕임 후 다음 끄덕임을 판단하지 않는 시간(초).
+        smoothing (float): 각속도를 평활하는 시간 상수(초).
+        max_gap (float): 상태를 유지할 최대 프레임 간격(초).
+
+    Example:
+    >>> nod = NodDetector()
+    >>> nod.update(pitch, timestamp)
+    True
+
+    Functions:
+        update
+        reset
+        get_stats
+    """
+
+    def __init__(
+        self,
+        speed=40.0,
+        amplitude=8.0,
+        max_time=0.8,
+        return_ratio=0.6,
+        refractory=0.5,
+        smoothing=0.05,
+        max_gap=0.3,
+    ):
+        self._speed = speed
+        self._amplitude = amplitude
+        self._max_time = max_time
+        self._return_ratio = return_ratio
+        self._refractory = refractory
+        self._smoothing = smoothing
+        self._max_gap = max_gap
+        self.__nods = 0
+        self.reset()
+
+    def update(self, pitch, timestamp):
+        """한 프레임의 pitch를 받아 끄덕임이 끝났는지 판단한다.
+
+        Args:
+            pitch (float): 위가 양수인 각도(degree).
+            timestamp (float): 프레임 촬영 시각(초). 이전보다 크지 않으면 무시한다.
+
+        Returns:
+            bool: 이번 프레임에 끄덕임이 끝났는지 여부.
+        """
+        prev = self.__prev
+        if prev is not None and timestamp <= prev[1]:
+            return False
+        if prev is not None and timestamp - prev[1] > self._max_gap:
+            self.reset()
+            prev = None
+        self.__prev = (pitch, timestamp)
+        if prev is None:
+            return False
+        dt = timestamp - prev[1]
+        # Time-based EWMA, so jitter of single frames does not start a nod.
+        alpha = 1 - exp(-dt / self._smoothing)
+        self.__velocity += alpha * ((pitch - prev[0]) / dt - self.__velocity)
+        velocity = self.__velocity
+
+        if self.__start is not None and timestamp - self.__start[1] > self._max_time:
+            self.__start = None  # Too slow: a look down, not a nod.
+        if self.__start is None:
+            if velocity < -self._speed and timestamp >= self.__ready_time:
+                self.__start = prev
+                self.__lowest = pitch
+            return False
+
+        self.__lowest = min(self.__lowest, pitch)
+        drop = self.__start[0] - self.__lowest
+        if drop < self._amplitude or velocity <= 0:
+            return False
+        if pitch - self.__lowest < drop * self._return_ratio:
+            return False
+        self.__start = None
+        self.__ready_time = timestamp + self._refractory
+        self.__nods += 1
+        return True
+
+    def reset(self):
+        """진행 중인 끄덕임을 지운다."""
+        self.__prev = None
+        self.__velocity = 0.0
+        self.__start = None
+        self.__lowest = None
+        self.__ready_time = float("-inf")
+
+    def get_stats(self):
+        """끄덕임 횟수와 현재 각속도를 반환한다.
+
+        Returns:
+            dict: nod 횟수와 평활한 pitch 각속도(degree/s).
+        """
+        return {NOD: self.__nods, "pitch_velocity": self.__velocity}
@@ -3,25 +3,29 @@ import platform
 from tkinter import Tk, Button
 from PIL import ImageTk, Image
 
-import cv2
-import pyautogui
-
 _DIR = os.path.dirname(os.path.realpath(__file__))
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0.03
 
 
 class App(Tk):
     """사이드바 객체.
 
+    Args:
+        function: 반복해서 실행할 함수. 다음 실행까지 기다릴 시간(ms)을 반환할 수 있다.
+        on_pause: 일시 정지 버튼을 눌렀을 때 실행할 함수.
+        on_resume: 일시 정지를 해제했을 때 실행할 함수.
+        renderer: function과 별개로 반복해서 실행할 미리보기 함수.
+            다음 실행까지 기다릴 시간(ms)을 반환할 수 있다.
+
     Example:
-    >>> process = Process(cap)
-    >>> app = App(process.run)
+    >>> process = Process(grabber)
+    >>> app = App(
+    ...     process.run, process.suspend, process.resume, process.render_preview
+    ... )
     >>> app.wm_attributes("-topmost", 1)
     >>> app.mainloop()
     """
 
-    def __init__(self, function):
+    def __init__(self, function, on_pause=None, on_resume=None, renderer=None):
         Tk.__init__(self)
         Tk.resizable(self, 0, 0)
         Tk.configure(self, bg="white")
@@ -30,6 +34,12 @@ class App(Tk):
         self._btn_command = None
         self.__window_width = None  # Keep consistent width for paused state.
         self.__process = function
+        self.__on_pause = on_pause
+        self.__on_resume = on_resume
+        self.__renderer = renderer
+        self.__after_id = None
+        self.__render_id = None
+        self.__is_paused = False
 
         self.__eye = self._img("eye.png")
         self.__eye_slash = self._img("eye-slash.png")
@@ -91,7 +101,6 @@ class App(Tk):
         self.__btn_scrolldown.image = self.__arrow_down
 
         self._show()
-        self.after(1, self._repeat_process)
 
     def _img(self, *paths):
         path = os.path.join(_DIR, "src", "gui", *paths)
@@ -100,12 +109,19 @@ class App(Tk):
         return ImageTk.PhotoImage(Image.open(path))
 
     def _repeat_process(self):
-        self.__process(
+        delay = self.__process(
             self._btn_command, self._allow_showing_frame, self._allow_detecting_face
         )
         if self._btn_command is not None:
             self._btn_command = None
-        return self.after(1, self._repeat_process)
+        # Wait until the process asks to be called again (at least 1 ms).
+        self.__after_id = self.after(max(delay or 1, 1), self._repeat_process)
+        return self.__after_id
+
+    def _repeat_render(self):
+        delay = self.__renderer()
+        self.__render_id = self.after(max(delay or 1, 1), self._repeat_render)
+        return self.__render_id
 
     def _hide(self):
         self.__btn_hide.grid_forget()
@@ -117,9 +133,18 @@ class App(Tk):
         self.__btn_show.grid(padx=8, pady=8)
         self._resize_window_to_fit_content()
 
-        cv2.destroyAllWindows()
         self._allow_showing_frame = False
         self._allow_detecting_face = False
+        # Stop polling entirely while paused.
+        if self.__after_id is not None:
+            self.after_cancel(self.__after_id)
+            self.__after_id = None
+        if self.__render_id is not None:
+            self.after_cancel(self.__render_id)
+            self.__render_id = None
+        self.__is_paused = True
+        if self.__on_pause is not None:
+            self.__on_pause()
 
     def _show(self):
         self.__btn_show.grid_forget()
@@ -142,6 +167,13 @@ class App(Tk):
 
         self._allow_showing_frame = True
         self._allow_detecting_face = True
+        if self.__is_paused and self.__on_resume is not None:
+            self.__on_resume()
+        self.__is_paused = False
+        if self.__after_id is None:
+            self.__after_id = self.after(1, self._repeat_process)
+        if self.__renderer is not None and self.__render_id is None:
+            self.__render_id = self.after(1, self._repeat_render)
 
     def _resize_window_to_fit_content(self):
         self.update_idletasks()
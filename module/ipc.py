@@ -0,0 +1,570 @@
+"""Unix 도메인 소켓으로 얼굴 각도와 동작을 보내고, 명령(일시 정지, 확대, 스크롤)을 받는다.
+
+메시지는 [종류(1 byte), 길이(2 bytes)] 머리말 뒤에 고정 형식(struct)의 본문이 오는
+작은 이진 형식이며, 숫자는 little-endian이다.
+
+- POSE: 촬영 시각(double), pitch, yaw, roll(float), 방향 비트(byte).
+  방향 비트는 Detector.get_face_direction의 방향 번호 n마다 1 << n.
+- EVENT: 촬영 시각(double), 동작 이름(UTF-8). blink, wink_left, mouth_open, nod 등.
+- FACE: 촬영 시각(double), 얼굴 탐지 여부(bool). 바뀔 때만 보낸다.
+- COMMAND: 명령 이름(UTF-8). 클라이언트가 보낸다.
+
+시각은 time.perf_counter 기준이며, 같은 컴퓨터의 다른 프로세스와 비교할 수 있다.
+이 모듈은 표준 라이브러리만 import한다.
+"""
+
+import os
+import selectors
+import socket
+import stat
+import struct
+import threading
+from collections import deque
+from time import perf_counter
+
+MSG_POSE = 1
+MSG_EVENT = 2
+MSG_FACE = 3
+MSG_COMMAND = 4
+
+HEADER = struct.Struct("<BH")
+_POSE = struct.Struct("<dfffB")
+_TIME = struct.Struct("<d")
+_FACE = struct.Struct("<d?")
+
+
+def pack_message(kind, payload):
+    """머리말을 붙여 메시지를 만든다.
+
+    Args:
+        kind (int): 메시지 종류. MSG_* 참고.
+        payload (bytes): 본문.
+
+    Returns:
+        bytes: 보낼 메시지.
+    """
+    return HEADER.pack(kind, len(payload)) + payload
+
+
+def encode_pose(timestamp, angles, directions):
+    """POSE 메시지를 만든다.
+
+    Args:
+        timestamp (float): 프레임 촬영 시각(초).
+        angles (list): pitch, yaw, roll (degree).
+        directions (list): Detector.get_face_direction이 반환한 방향 정보.
+
+    Returns:
+        bytes: 보낼 메시지.
+    """
+    bits = 0
+    for direction in directions:
+        bits |= 1 << direction
+    return pack_message(MSG_POSE, _POSE.pack(timestamp, *angles[:3], bits))
+
+
+def encode_event(timestamp, name):
+    """EVENT 메시지를 만든다.
+
+    Args:
+        timestamp (float): 프레임 촬영 시각(초).
+        name (str): 동작 이름.
+
+    Returns:
+        bytes: 보낼 메시지.
+    """
+    return pack_message(MSG_EVENT, _TIME.pack(timestamp) + name.encode("utf-8"))
+
+
+def encode_face(timestamp, is_detected):
+    """FACE 메시지를 만든다.
+
+    Args:
+        timestamp (float): 프레임 촬영 시각(초).
+        is_detected (bool): 얼굴 탐지 여부.
+
+    Returns:
+        bytes: 보낼 메시지.
+    """
+    return pack_message(MSG_FACE, _FACE.pack(timestamp, is_detected))
+
+
+def encode_command(name):
+    """COMMAND 메시지를 만든다.
+
+    Args:
+        name (str): 명령 이름.
+
+    Returns:
+        bytes: 보낼 메시지.
+    """
+    return pack_message(MSG_COMMAND, name.encode("utf-8"))
+
+
+class MessageDecoder(object):
+    """받은 바이트를 모아 완성된 메시지로 나눈다. 모르는 종류의 메시지는 건너뛴다.
+
+    Example:
+    >>> decoder = MessageDecoder()
+    >>> decoder.feed(encode_event(1.5, "blink"))
+    [(2, (1.5, 'blink'))]
+
+    Functions:
+        feed
+    """
+
+    def __init__(self):
+        self.__buffer = bytearray()
+
+    def feed(self, data):
+        """받은 바이트를 추가하고 완성된 메시지를 반환한다.
+
+        Args:
+            data (bytes): 받은 바이트.
+
+        Returns:
+            list: (종류, 값) 목록.
+
+            - POSE: (timestamp, pitch, yaw, roll, 방향 정보 리스트)
+            - EVENT: (timestamp, 동작 이름)
+            - FACE: (timestamp, 얼굴 탐지 여부)
+            - COMMAND: (명령 이름,)
+        """
+        buffer = self.__buffer
+        buffer += data
+        messages = []
+        offset = 0
+        while len(buffer) - offset >= HEADER.size:
+            kind, length = HEADER.unpack_from(buffer, offset)
+            end = offset + HEADER.size + length
+            if end > len(buffer):
+                break
+            payload = bytes(buffer[offset + HEADER.size : end])
+            offset = end
+            values = _decode(kind, payload)
+            if values is not None:
+                messages.append((kind, values))
+        del buffer[:offset]
+        return messages
+
+
+def _decode(kind, payload):
+    try:
+        if kind == MSG_POSE:
+            timestamp, pitch, yaw, roll, bits = _POSE.unpack(payload)
+            directions = [n for n in range(4) if bits & 1 << n]
+            return timestamp, pitch, yaw, roll, directions
+        if kind == MSG_EVENT:
+            size = _TIME.size
+            return _TIME.unpack(payload[:size])[0], payload[size:].decode("utf-8")
+        if kind == MSG_FACE:
+            return _FACE.unpack(payload)
+        if kind == MSG_COMMAND:
+            return (payload.decode("utf-8"),)
+    except (struct.error, UnicodeDecodeError):
+        pass  # A malformed message is dropped, the stream stays in sync.
+    return None
+
+
+class EventServer(object):
+    """Unix 도메인 소켓으로 여러 클라이언트에게 메시지를 보내고 명령을 받는다.
+
+    보내기(publish)는 탐지 스레드에서 블록되지 않는 send로 바로 수행한다.
+    느린 클라이언트에 보내지 못한 바이트는 소켓이 쓰기 가능해질 때 연결 스레드가 보내며,
+    그 크기가 max_pending을 넘으면 새 메시지를 버린다.
+    연결 수락과 명령 수신은 별도 스레드가 수행하며, 받은 명령은 get_commands로 꺼낸다.
+
+    Args:
+        path (str): 소켓 파일 경로. 이전 실행이 남긴 소켓 파일은 지운다.
+        max_pending (int): 클라이언트마다 보관할 보내지 못한 바이트의 최대 크기.
+
+    Example:
+    >>> server = EventServer("/tmp/facemouse.sock")
+    >>> server.start()
+    >>> server.publish_event(timestamp, "blink")
+    >>> for command in server.get_commands():
+    ...     print(command)
+    >>> server.release()
+
+    Functions:
+        start
+        publish
+        publish_pose
+        publish_event
+        publish_face
+        get_commands
+        get_stats
+        release
+    """
+
+    def __init__(self, path, max_pending=1 << 16):
+        self._path = path
+        self._max_pending = max_pending
+        self.__lock = threading.Lock()
+        self.__clients = {}
+        self.__writing = set()
+        self.__commands = deque()
+        self.__listener = None
+        self.__selector = None
+        self.__thread = None
+        self.__running = False
+        self.__connected = 0
+        self.__sent = 0
+        self.__dropped = 0
+        self.__received = 0
+
+    def start(self):
+        """소켓을 열고 연결을 받는 스레드를 시작한다."""
+        if self.__thread is not None:
+            return
+        self._remove_stale_socket()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self._path)
+        listener.listen()
+        listener.setblocking(False)
+        self.__listener = listener
+        self.__selector = selectors.DefaultSelector()
+        self.__selector.register(listener, selectors.EVENT_READ)
+        self.__running = True
+        self.__thread = threading.Thread(target=self._loop, daemon=True)
+        self.__thread.start()
+
+    def _remove_stale_socket(self):
+        try:
+            if stat.S_ISSOCK(os.stat(self._path).st_mode):
+                os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    def _loop(self):
+        selector = self.__selector
+        while self.__running:
+            for key, events in selector.select(timeout=0.2):
+                if key.fileobj is self.__listener:
+                    self._accept()
+                    continue
+                if events & selectors.EVENT_WRITE:
+                    self._send_pending(key.fileobj)
+                if events & selectors.EVENT_READ:
+                    self._receive(key.fileobj, key.data)
+
+    def _accept(self):
+        try:
+            client, _ = self.__listener.accept()
+        except OSError:
+            return
+        client.setblocking(False)
+        with self.__lock:
+            self.__clients[client] = bytearray()
+            self.__connected += 1
+        self.__selector.register(client, selectors.EVENT_READ, MessageDecoder())
+
+    def _receive(self, client, decoder):
+        try:
+            data = client.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(client)
+            return
+        for kind, values in decoder.feed(data):
+            if kind == MSG_COMMAND:
+                self.__commands.append(values[0])
+                self.__received += 1
+
+    def _send_pending(self, client):
+        # The backlog is sent here too, so it is not held until the next publish.
+        with self.__lock:
+            pending = self.__clients.get(client)
+            if pending is not None:
+                self._flush(client, pending)
+                self._watch_write(client, pending)
+
+    def _watch_write(self, client, pending):
+        # Called with the lock held: wait for writability only with a backlog.
+        is_writing = client in self.__writing
+        if bool(pending) == is_writing:
+            return
+        events = selectors.EVENT_READ
+        if pending:
+            events |= selectors.EVENT_WRITE
+        try:
+            decoder = self.__selector.get_key(client).data
+            self.__selector.modify(client, events, decoder)
+        except (KeyError, ValueError):
+            return  # Already closed.
+        if pending:
+            self.__writing.add(client)
+        else:
+            self.__writing.discard(client)
+
+    def _close(self, client):
+        with self.__lock:
+            self.__clients.pop(client, None)
+            self.__writing.discard(client)
+        try:
+            self.__selector.unregister(client)
+        except (KeyError, ValueError):
+            pass
+        client.close()
+
+    def publish(self, message):
+        """모든 클라이언트에게 메시지를 보낸다. 블록되지 않는다.
+
+        Args:
+            message (bytes): encode_* 함수로 만든 메시지.
+        """
+        with self.__lock:
+            for client, pending in self.__clients.items():
+                if pending and not self._flush(client, pending):
+                    continue
+                if len(pending) + len(message) > self._max_pending:
+                    self.__dropped += 1  # Slow reader: drop rather than wait.
+                    continue
+                pending += message
+                self._flush(client, pending)
+                self._watch_write(client, pending)
+            self.__sent += 1
+
+    def _flush(self, client, pending):
+        try:
+            sent = client.send(pending)
+        except BlockingIOError:
+            return True
+        except OSError:
+            pending.clear()  # Closed: the receive thread removes it.
+            return False
+        del pending[:sent]
+        return True
+
+    def publish_pose(self, timestamp, angles, directions):
+        """얼굴 각도와 방향을 보낸다. encode_pose 참고."""
+        self.publish(encode_pose(timestamp, angles, directions))
+
+    def publish_event(self, timestamp, name):
+        """동작을 보낸다. encode_event 참고."""
+        self.publish(encode_event(timestamp, name))
+
+    def publish_face(self, timestamp, is_detected):
+        """얼굴 탐지 여부를 보낸다. encode_face 참고."""
+        self.publish(encode_face(timestamp, is_detected))
+
+    def get_commands(self):
+        """받은 명령을 꺼낸다.
+
+        Returns:
+            list: 받은 순서대로 명령 이름.
+        """
+        commands = []
+        while self.__commands:
+            commands.append(self.__commands.popleft())
+        return commands
+
+    def get_stats(self):
+        """연결과 메시지 통계를 반환한다.
+
+        Returns:
+            dict: 현재 클라이언트 수, 지금까지 연결된 수, 보낸 메시지 수,
+            버린 메시지 수와 받은 명령 수.
+        """
+        return {
+            "clients": len(self.__clients),
+            "connected": self.__connected,
+            "sent": self.__sent,
+            "dropped": self.__dropped,
+            "commands": self.__received,
+        }
+
+    def release(self):
+        """스레드를 멈추고 연결과 소켓 파일을 닫는다."""
+        if self.__thread is None:
+            return
+        self.__running = False
+        self.__thread.join(timeout=1)
+        self.__thread = None
+        with self.__lock:
+            clients = list(self.__clients)
+            self.__clients.clear()
+            self.__writing.clear()
+        for client in clients:
+            client.close()
+        self.__selector.close()
+        self.__listener.close()
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+
+class EventClient(object):
+    """EventServer에 연결해 메시지를 받고 명령을 보낸다.
+
+    Args:
+        path (str): 소켓 파일 경로.
+
+    Example:
+    >>> client = EventClient("/tmp/facemouse.sock")
+    >>> client.connect()
+    >>> client.send_command("pause")
+    >>> client.receive(timeout=1.0)
+    [(3, (12.5, True)), (1, (12.5, 1.2, -3.4, 0.5, []))]
+    >>> client.close()
+
+    Functions:
+        connect
+        send_command
+        receive
+        close
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self.__socket = None
+        self.__decoder = MessageDecoder()
+
+    def connect(self):
+        """서버에 연결한다. 서버가 없다면 OSError가 발생한다."""
+        if self.__socket is None:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                client.connect(self._path)
+            except OSError:
+                client.close()
+                raise
+            self.__socket = client
+            self.__decoder = MessageDecoder()  # Drop a partial message of the last one.
+
+    def send_command(self, name):
+        """명령을 보낸다.
+
+        Args:
+            name (str): 명령 이름. module.daemon.COMMANDS 참고.
+        """
+        self.__socket.sendall(encode_command(name))
+
+    def receive(self, timeout=0.0):
+        """받은 메시지를 반환한다.
+
+        Args:
+            timeout (float): 메시지가 없을 때 기다릴 최대 시간(초). 0이면 기다리지 않는다.
+
+        Returns:
+            list: (종류, 값) 목록. MessageDecoder.feed 참고.
+            서버가 연결을 끊었다면 ConnectionError가 발생한다.
+        """
+        client = self.__socket
+        messages = []
+        end = perf_counter() + timeout
+        while True:
+            client.settimeout(max(end - perf_counter(), 0) if not messages else 0)
+            try:
+                data = client.recv(65536)
+            except (BlockingIOError, socket.timeout):
+                return messages
+            if not data:
+                raise ConnectionError("The event server closed the connection.")
+            messages += self.__decoder.feed(data)
+
+    def close(self):
+        """연결을 닫는다."""
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+
+
+class RemoteProcess(object):
+    """데몬에 연결한 EventClient를 App이 사용하는 Process처럼 다룬다.
+
+    사이드바 버튼의 명령과 일시 정지는 데몬에 보내고, 받은 메시지로 얼굴 탐지 여부를 갱신한다.
+    데몬이 아직 없거나 종료되면 얼굴이 없는 것으로 보고, retry_delay마다 다시 연결한다.
+
+    Args:
+        client (EventClient): 연결할 클라이언트.
+        poll_delay (int): 메시지를 확인하는 간격(ms).
+        retry_delay (int): 연결되지 않았을 때 다시 연결하는 간격(ms).
+
+    Example:
+    >>> remote = RemoteProcess(EventClient("/tmp/facemouse.sock"))
+    >>> app = App(remote.run, remote.suspend, remote.resume)
+
+    Functions:
+        run
+        suspend
+        resume
+        has_face
+        is_connected
+        release
+    """
+
+    def __init__(self, client, poll_delay=50, retry_delay=1000):
+        self._client = client
+        self._poll_delay = poll_delay
+        self._retry_delay = retry_delay
+        self.__is_detected = False
+        self.__is_connected = False
+
+    def _call(self, function, *args):
+        # Called from Tk after callbacks, which stop repeating if they raise.
+        try:
+            self._client.connect()
+            result = function(*args)
+        except OSError:  # Includes ConnectionError from receive.
+            self._client.close()
+            self.__is_connected = False
+            self.__is_detected = False
+            return None
+        self.__is_connected = True
+        return result
+
+    def run(self, command, allow_showing_frame, allow_detecting_direction):
+        """명령이 있으면 데몬에 보내고, 그동안 받은 메시지를 처리한다.
+
+        연결되지 않았다면 명령은 버린다.
+
+        Args:
+            Process.run 참고. 미리보기와 방향 계산은 데몬의 설정을 따른다.
+
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms).
+        """
+        if command:
+            self._call(self._client.send_command, command)
+        messages = self._call(self._client.receive)
+        if messages is None:
+            return self._retry_delay
+        for kind, values in messages:
+            if kind == MSG_FACE:
+                self.__is_detected = values[1]
+            elif kind == MSG_POSE:
+                self.__is_detected = True  # Poses are only sent with a face.
+        return self._poll_delay
+
+    def suspend(self):
+        """데몬의 카메라 읽기와 얼굴 탐지를 멈춘다."""
+        self._call(self._client.send_command, "pause")
+
+    def resume(self):
+        """데몬의 카메라 읽기와 얼굴 탐지를 다시 시작한다."""
+        self._call(self._client.send_command, "resume")
+
+    def has_face(self):
+        """데몬이 마지막으로 알린 얼굴 탐지 여부를 반환한다.
+
+        Returns:
+            bool: 얼굴 탐지 여부. 연결되지 않았다면 False.
+        """
+        return self.__is_detected
+
+    def is_connected(self):
+        """마지막 호출에서 데몬과 연결되어 있었는지 반환한다.
+
+        Returns:
+            bool: 연결 여부.
+        """
+        return self.__is_connected
+
+    def release(self):
+        """연결을 닫는다. 데몬은 계속 실행된다."""
+        self._client.close()
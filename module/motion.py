@@ -0,0 +1,109 @@
+from time import perf_counter
+
+import cv2
+
+
+class MotionGate(object):
+    """움직임이 없는 프레임에서 Face Mesh 탐지를 생략할 지 결정한다.
+
+    얼굴 영역을 작은 흑백 이미지로 줄여 이전 탐지 때의 이미지와 비교하고,
+    변한 픽셀이 거의 없다면 마지막 랜드마크를 그대로 사용하도록 한다.
+    눈 깜빡임을 놓치지 않도록 일정 시간 이상 탐지를 생략하지 않는다.
+
+    Args:
+        pixel_threshold (int): 변한 픽셀로 판단할 밝기 차이.
+        motion_ratio (float): 움직임으로 판단할 변한 픽셀의 비율.
+        max_skip_time (float): 탐지를 생략할 수 있는 최대 시간(초).
+        size (tuple): 비교에 사용할 이미지 크기.
+
+    Functions:
+        should_detect
+        reset
+        get_stats
+    """
+
+    def __init__(
+        self, pixel_threshold=15, motion_ratio=0.01, max_skip_time=0.1, size=(48, 48)
+    ):
+        self._pixel_threshold = pixel_threshold
+        self._motion_ratio = motion_ratio
+        self._max_skip_time = max_skip_time
+        self._size = size
+        self.__prev = None
+        self.__prev_box = None
+        self.__last_detect_time = None
+        self.__checked = 0
+        self.__moved = 0
+        self.__forced = 0
+        self.__skipped = 0
+        self.__max_stale = 0.0
+
+    def should_detect(self, frame, box):
+        """프레임에서 Face Mesh 탐지가 필요한지 판단한다.
+
+        Args:
+            frame (image, ndarray): 전처리를 마친 BGR 이미지.
+            box (tuple): 얼굴 영역 (x0, y0, x1, y1). 얼굴을 찾지 못했다면 None.
+
+        Returns:
+            bool: 탐지 수행 여부. False라면 마지막 랜드마크를 재사용한다.
+        """
+        now = perf_counter()
+        self.__checked += 1
+        if box is None or box != self.__prev_box:
+            # Not locked or the region has moved: nothing to compare against.
+            self.__prev = None if box is None else self._shrink(frame, box)
+            self.__prev_box = box
+            self.__last_detect_time = now
+            return True
+
+        small = self._shrink(frame, box)
+        changed = cv2.countNonZero(
+            cv2.threshold(
+                cv2.absdiff(small, self.__prev),
+                self._pixel_threshold,
+                255,
+                cv2.THRESH_BINARY,
+            )[1]
+        )
+        if changed > self._motion_ratio * small.size:
+            self.__moved += 1
+        elif now - self.__last_detect_time >= self._max_skip_time:
+            # Still run now and then so that a blink is never missed.
+            self.__forced += 1
+        else:
+            self.__skipped += 1
+            self.__max_stale = max(self.__max_stale, now - self.__last_detect_time)
+            return False
+
+        self.__prev = small
+        self.__last_detect_time = now
+        return True
+
+    def reset(self):
+        """비교할 이전 이미지를 비워 다음 프레임에서 반드시 탐지하도록 한다."""
+        self.__prev = None
+        self.__prev_box = None
+
+    def _shrink(self, frame, box):
+        x0, y0, x1, y1 = box
+        small = cv2.resize(
+            frame[y0:y1, x0:x1], self._size, interpolation=cv2.INTER_AREA
+        )
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def get_stats(self):
+        """탐지 생략 통계를 반환한다.
+
+        Returns:
+            dict: 판단 횟수, 움직임/주기적 탐지 횟수, 생략 횟수와 비율,
+            재사용한 랜드마크의 최대 지연(초).
+        """
+        return {
+            "checked": self.__checked,
+            "moved": self.__moved,
+            "forced": self.__forced,
+            "skipped": self.__skipped,
+            "skip_ratio": self.__skipped / self.__checked if self.__checked else 0.0,
+            "max_stale": self.__max_stale,
+        }
@@ -0,0 +1,535 @@
+"""카메라 읽기와 얼굴 탐지를 별도 프로세스에서 수행하는 실행 객체.
+
+- 읽기 프로세스: 카메라 프레임을 공유 메모리 링 버퍼(FrameRing)의 칸에 바로 디코딩한다.
+- 탐지 프로세스: 링 버퍼의 가장 최근 프레임으로 Detector를 실행하고,
+  방향, 각도, 동작과 랜드마크 같은 작은 결과만 파이프로 보낸다.
+- 이 프로세스(Tk): 결과로 커서와 입력 동작을 처리하고 미리보기를 그린다.
+
+프레임의 픽셀은 pickle하거나 프로세스 사이에서 복사하지 않는다.
+"""
+
+import multiprocessing
+from functools import partial
+from time import perf_counter, sleep
+
+import cv2
+import numpy as np
+
+try:
+    from baseline import PoseBaseline
+    from camera import open_camera, set_mode
+    from config import SettingsStore
+    from constant import FRAME_WIDTH, PREVIEW_FRAME_RATE, PREVIEW_OVERLAY
+    from function import Controller, Detector
+    from motion import MotionGate
+    from preview import PreviewRenderer
+    from ring import FrameRing
+    from scheduler import FrameScheduler
+    from telemetry import Telemetry
+except ImportError:
+    from module.baseline import PoseBaseline
+    from module.camera import open_camera, set_mode
+    from module.config import SettingsStore
+    from module.constant import FRAME_WIDTH, PREVIEW_FRAME_RATE, PREVIEW_OVERLAY
+    from module.function import Controller, Detector
+    from module.motion import MotionGate
+    from module.preview import PreviewRenderer
+    from module.ring import FrameRing
+    from module.scheduler import FrameScheduler
+    from module.telemetry import Telemetry
+
+
+class PacedCapture(object):
+    """영상 파일을 카메라처럼 일정한 FPS로 반복해서 읽는다. (벤치마크, 테스트용)
+
+    Args:
+        path (str): 영상 파일 경로.
+        rate (float): 초당 프레임 수.
+
+    Functions:
+        isOpened
+        read
+        release
+    """
+
+    def __init__(self, path, rate=30):
+        self._cap = cv2.VideoCapture(path)
+        self._period = 1 / rate
+        self.__next_time = perf_counter()
+
+    def isOpened(self):
+        """영상 파일을 열었는지 반환한다."""
+        return self._cap.isOpened()
+
+    def read(self, image=None):
+        """다음 프레임 시각까지 기다린 뒤 프레임을 읽는다. cv2.VideoCapture.read 참고."""
+        delay = self.__next_time - perf_counter()
+        if delay > 0:
+            sleep(delay)
+        self.__next_time = max(self.__next_time + self._period, perf_counter())
+        success, frame = self._cap.read(image)
+        if not success:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self._cap.read(image)
+        return success, frame
+
+    def release(self):
+        """영상 파일을 닫는다."""
+        self._cap.release()
+
+
+def _capture_worker(device, mode, pace, conn, active, stopped, ready):
+    # Decodes straight into ring slots; only the frame shape crosses the pipe.
+    if pace is not None:
+        capture = PacedCapture(device, pace)
+    else:
+        capture, profile = open_camera(device)
+        if mode is not None and profile is not None:
+            set_mode(capture, mode)
+    success, frame = capture.read() if capture.isOpened() else (False, None)
+    if not success:
+        conn.send(None)
+        capture.release()
+        return
+    conn.send(frame.shape)
+    ring = FrameRing(frame.shape, name=conn.recv())
+    try:
+        while not stopped.is_set():
+            if not active.is_set():
+                active.wait(0.1)
+                continue
+            view = ring.begin_write()
+            success, frame = capture.read(view)
+            timestamp = perf_counter()
+            if not success:
+                sleep(0.01)
+                continue
+            if frame is not view and not np.shares_memory(frame, view):
+                # The driver returned a new array, e.g. after changing the frame size.
+                if frame.shape == view.shape:
+                    np.copyto(view, frame)
+                else:
+                    cv2.resize(frame, (view.shape[1], view.shape[0]), dst=view)
+            ring.end_write(timestamp)
+            ready.set()
+    finally:
+        capture.release()
+        ring.close()
+
+
+# Seconds between the stats the detection process sends for telemetry.
+_STATS_INTERVAL = 1.0
+
+
+def _collect_worker_stats(telemetry, detector, baseline, gate, is_detected):
+    # Same collector names as Process, so logs and metrics keep their keys.
+    found = telemetry.get_counter("faces_found")
+    tried = found + telemetry.get_counter("faces_lost")
+    snapshot = telemetry.snapshot()
+    return {
+        "detection": {
+            "hit_rate": found / tried if tried else 0.0,
+            "is_detected": is_detected,
+        },
+        "gate": gate.get_stats(),
+        "baseline": baseline.get_stats(),
+        "gestures": detector.get_gesture_stats(),
+        "detector": {
+            "counters": snapshot["counters"],
+            "stages": snapshot["stages"],
+        },
+    }
+
+
+def _inference_worker(name, shape, max_frame_rate, conn, stopped, ready):
+    # Runs Detector on the newest ring frame and sends back only small results,
+    # and every _STATS_INTERVAL a dict of its stats.
+    ring = FrameRing(shape, name=name)
+    settings = SettingsStore()
+    baseline = PoseBaseline()
+    telemetry = Telemetry()
+    detector = Detector(
+        np.zeros(shape, np.uint8),
+        settings=settings,
+        telemetry=telemetry,
+        baseline=baseline,
+    )
+    detector.warm_up()
+    gate = MotionGate()
+    scheduler = FrameScheduler(max_frame_rate)
+    conn.send("ready")
+    next_stats = perf_counter() + _STATS_INTERVAL
+    last_id = 0
+    torn = 0
+    is_detected = False
+    try:
+        while not stopped.is_set():
+            if not scheduler.is_due():
+                sleep(scheduler.get_delay_ms() / 1000)
+                continue
+            if not ready.wait(0.1):
+                continue
+            ready.clear()
+            latest = ring.read_latest(last_id)
+            if latest is None:
+                continue
+            frame_id, view, timestamp = latest
+            last_id = frame_id
+            scheduler.begin(ready=timestamp)
+            start = perf_counter()
+            frame, rgb_frame = detector.convert_frame(view)
+            if not ring.is_valid(frame_id):
+                torn += 1  # Overwritten while being converted.
+                continue
+            if gate.should_detect(frame, detector.get_face_box()):
+                is_detected = detector.detect_landmark(rgb_frame, timestamp)
+
+            result = None
+            if is_detected:
+                event = detector.update_eye_event()
+                events = detector.update_gestures()
+                if event is not None:
+                    events.append(event)
+                result = (
+                    detector.get_face_direction(),
+                    detector.get_face_angles(),
+                    events,
+                    detector.get_both_eyes_ear(),
+                    detector.get_landmark_pixels().astype(np.int32),
+                    detector.get_face_box(),
+                )
+            end = perf_counter()
+            conn.send((frame_id, timestamp, end - start, end, torn, result))
+            if end >= next_stats:
+                next_stats = end + _STATS_INTERVAL
+                conn.send(
+                    _collect_worker_stats(
+                        telemetry, detector, baseline, gate, is_detected
+                    )
+                )
+            settings.check()
+    finally:
+        baseline.save()
+        ring.close()
+
+
+class PipelineProcess(object):
+    """카메라 읽기와 얼굴 탐지를 별도 프로세스에서 수행하는 실행 객체. Process와 같이 사용한다.
+
+    Args:
+        device: 카메라 정보 또는 영상 파일 경로.
+        max_frame_rate (float): 목표 초당 처리 프레임 수.
+        backend (InputBackend): 입력 장치. None이면 환경에 맞는 장치를 사용한다.
+        mode (dict): 요청할 카메라 모드. (width, height, fourcc, fps)
+        pace (float): 영상 파일을 이 FPS로 반복해서 읽는다. None이면 카메라로 연다.
+        settings (SettingsStore): Controller가 읽는 설정. None이면 설정 파일을 불러온다.
+            탐지 프로세스는 같은 설정 파일을 따로 불러온다.
+        telemetry (Telemetry): 결과 지연과 횟수를 기록할 객체.
+        timeout (float): 프로세스 준비를 기다릴 최대 시간(초).
+
+    Example:
+    >>> process = PipelineProcess(0)
+    >>> app = App(
+    ...     process.run, process.suspend, process.resume, process.render_preview
+    ... )
+
+    Functions:
+        run
+        suspend
+        resume
+        release
+        has_face
+        get_move_count
+        get_frame_age
+        get_pipeline_stats
+        get_telemetry
+        render_preview
+    """
+
+    def __init__(
+        self,
+        device,
+        max_frame_rate=60,
+        backend=None,
+        mode=None,
+        pace=None,
+        settings=None,
+        telemetry=None,
+        timeout=30.0,
+    ):
+        # Spawned, not forked: camera and mediapipe threads do not survive fork.
+        context = multiprocessing.get_context("spawn")
+        self.__settings = SettingsStore() if settings is None else settings
+        self.__telemetry = Telemetry() if telemetry is None else telemetry
+        self.__active = context.Event()
+        self.__active.set()
+        self.__stopped = context.Event()
+        self.__ready = context.Event()
+        self.__ring = None
+        self.__workers = []
+        self.__controller = None
+
+        capture_conn, child_conn = context.Pipe()
+        self._start(
+            context,
+            _capture_worker,
+            device,
+            mode,
+            pace,
+            child_conn,
+            self.__active,
+            self.__stopped,
+            self.__ready,
+        )
+        shape = capture_conn.recv() if capture_conn.poll(timeout) else None
+        if shape is None:
+            self.release()
+            raise RuntimeError(f"Cannot open camera: {device}")
+        self.__ring = FrameRing(shape)
+        capture_conn.send(self.__ring.name)
+
+        self.__results, child_conn = context.Pipe(duplex=False)
+        self._start(
+            context,
+            _inference_worker,
+            self.__ring.name,
+            shape,
+            max_frame_rate,
+            child_conn,
+            self.__stopped,
+            self.__ready,
+        )
+        if not self.__results.poll(timeout):
+            self.release()
+            raise RuntimeError("The detection process did not start.")
+        self.__results.recv()
+
+        self.__controller = Controller(backend, self.__settings, self.__telemetry)
+        # Same size as Detector.convert_frame, for the preview.
+        h, w = shape[:2]
+        self._size = (w, h) if w <= FRAME_WIDTH else (FRAME_WIDTH, h * FRAME_WIDTH // w)
+        self.__preview_buffer = None
+        self.__preview = PreviewRenderer(
+            PREVIEW_FRAME_RATE, PREVIEW_OVERLAY, on_open=self._move_frame_window
+        )
+        self.__result = None
+        self.__frame_age = None
+        # Result period and capture-to-send time, measured in the workers so
+        # that polling late does not feed back into them.
+        self.__interval = 1 / max_frame_rate
+        self.__mean_age = 0.0
+        self.__last_timestamp = None
+        self.__suspend_time = None
+        self.__processed = 0
+        self.__torn = 0
+        self.__inference_time = 0.0
+        self.__worker_stats = {}
+        self.__telemetry.add_collector("pipeline", self.get_pipeline_stats)
+        self.__telemetry.add_collector("actions", self.__controller.get_action_stats)
+        # Stats of the detection process, as last sent by it.
+        for name in ("detection", "gate", "baseline", "gestures", "detector"):
+            self.__telemetry.add_collector(name, partial(self._get_worker_stats, name))
+
+    def _start(self, context, target, *args):
+        worker = context.Process(target=target, args=args, daemon=True)
+        worker.start()
+        self.__workers.append(worker)
+
+    def run(self, command, allow_showing_frame, allow_detecting_direction):
+        """탐지 프로세스가 보낸 결과를 처리한다.
+
+        Args:
+            Process.run 참고.
+
+        Returns:
+            int: 다음 결과가 도착할 것으로 예상되는 시점까지 남은 시간(ms).
+        """
+        if command:
+            self.__controller.add_command(command)
+        results = self.__results
+        if not results.poll():
+            return self._get_delay()
+        telemetry = self.__telemetry
+        controller = self.__controller
+        while results.poll():
+            message = results.recv()
+            if isinstance(message, dict):
+                self.__worker_stats = message
+                continue
+            frame_id, timestamp, inference_time, sent, torn, result = message
+            now = perf_counter()
+            if self.__suspend_time is not None and timestamp < self.__suspend_time:
+                continue  # Captured before suspend: its events must not click now.
+            self.__frame_age = now - timestamp
+            self._update_interval(timestamp, sent - timestamp)
+            self.__processed += 1
+            self.__torn = torn
+            self.__inference_time += inference_time
+            telemetry.count("frames")
+            telemetry.observe("inference", inference_time)
+            telemetry.observe("result_age", now - timestamp)
+            self.__result = result
+            if result is None:
+                continue
+            # Every event is handled, even when only the newest pose is used.
+            for event in result[2]:
+                controller.handle_gesture(event)
+            if controller.has_command():
+                controller.count_btn_command()
+
+        result = self.__result
+        if result is not None and allow_detecting_direction:
+            controller.move_cursor_by_face(result[0])
+        else:
+            controller.stop_cursor()
+
+        if not allow_showing_frame:
+            self.__preview.hide()
+        elif self.__preview.is_due():
+            self._submit_preview(result)
+        self.__settings.check()
+        telemetry.check()
+        return self._get_delay()
+
+    def _update_interval(self, timestamp, age):
+        if self.__last_timestamp is None:
+            self.__mean_age = age
+        else:
+            # Capped, so a pause or a lost face does not stretch the polling period.
+            interval = min(timestamp - self.__last_timestamp, 0.1)
+            self.__interval += (interval - self.__interval) * 0.1
+            self.__mean_age += (age - self.__mean_age) * 0.1
+        self.__last_timestamp = timestamp
+
+    def _get_delay(self):
+        # Sleep until the next result is due, then poll briefly until it arrives,
+        # instead of waking the Tk process every millisecond.
+        if self.__last_timestamp is None:
+            return 5
+        due = self.__last_timestamp + self.__interval + self.__mean_age
+        return max(round((due - perf_counter()) * 1000), 2)
+
+    def _submit_preview(self, result):
+        latest = self.__ring.read_latest()
+        if latest is None:
+            return
+        frame_id, view, _ = latest
+        if self.__preview_buffer is None:
+            w, h = self._size
+            self.__preview_buffer = np.empty((h, w, 3), np.uint8)
+        frame = self.__preview_buffer
+        cv2.resize(view, self._size, dst=frame)
+        cv2.flip(frame, 1, dst=frame)
+        if not self.__ring.is_valid(frame_id):
+            return
+        if result is None:
+            self.__preview.submit(frame)
+        else:
+            directions, angles, events, ear, points, box = result
+            self.__preview.submit(frame, points, box, angles, ear)
+
+    def render_preview(self):
+        """미리보기 창을 그린다. App의 after 반복에서 호출한다.
+
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms).
+        """
+        return self.__preview.render()
+
+    def _move_frame_window(self, window):
+        full_w, full_h = self.__controller.get_screen_size()
+        w, h = self._size
+        cv2.moveWindow(window, full_w - w - 10, full_h - h - 10)
+
+    def suspend(self):
+        """카메라 읽기와 얼굴 탐지를 멈춘다. 프로세스는 유지한다.
+
+        이미 도착했거나 처리 중인 결과의 동작은 재시작 후에도 수행하지 않는다.
+        """
+        self.__active.clear()
+        self.__suspend_time = perf_counter()
+        while self.__results.poll():
+            self.__results.recv()
+        self.__last_timestamp = None
+        self.__controller.stop_cursor()
+        self.__controller.end_drag()
+        self.__preview.hide()
+        cv2.destroyAllWindows()
+        self.__result = None
+
+    def resume(self):
+        """멈춘 카메라 읽기와 얼굴 탐지를 다시 시작한다."""
+        self.__active.set()
+
+    def release(self):
+        """프로세스를 멈추고 공유 메모리와 입력 스레드를 해제한다."""
+        self.__stopped.set()
+        self.__active.set()  # Wake a paused capture process.
+        for worker in self.__workers:
+            worker.join(timeout=3)
+            if worker.is_alive():
+                worker.terminate()
+        self.__workers = []
+        if self.__controller is not None:
+            self.__controller.release()
+            self.__telemetry.release()
+        cv2.destroyAllWindows()
+        if self.__ring is not None:
+            self.__ring.close()
+            self.__ring.unlink()
+            self.__ring = None
+
+    def has_face(self):
+        """마지막으로 받은 결과에서 얼굴을 찾았는지 반환한다.
+
+        Returns:
+            bool: 얼굴 탐지 여부.
+        """
+        return self.__result is not None
+
+    def get_move_count(self):
+        """얼굴 방향으로 커서를 옮긴 횟수를 반환한다.
+
+        Returns:
+            int: Controller.get_move_count 참고.
+        """
+        return self.__controller.get_move_count()
+
+    def get_frame_age(self):
+        """마지막으로 받은 결과의 프레임이 촬영된 후 이 프로세스에 도착하기까지 걸린 시간.
+
+        Returns:
+            float: 촬영부터 결과 도착까지의 시간(초). 아직 받은 결과가 없다면 None.
+        """
+        return self.__frame_age
+
+    def get_pipeline_stats(self):
+        """프로세스 사이의 프레임, 결과 통계를 반환한다.
+
+        Returns:
+            dict: 링 버퍼에 기록한 프레임 수(written), 처리한 프레임 수(processed),
+            처리하는 동안 덮어쓰여 버린 프레임 수(torn), 처리하지 않고 건너뛴
+            프레임 수(skipped)와 평균 탐지 시간(mean_inference_time, 초).
+        """
+        written = 0 if self.__ring is None else self.__ring.get_written()
+        processed = self.__processed
+        return {
+            "written": written,
+            "processed": processed,
+            "torn": self.__torn,
+            "skipped": max(written - processed - self.__torn, 0),
+            "mean_inference_time": (
+                self.__inference_time / processed if processed else 0.0
+            ),
+        }
+
+    def _get_worker_stats(self, name):
+        return self.__worker_stats.get(name, {})
+
+    def get_telemetry(self):
+        """결과 지연, 횟수와 각 객체의 통계를 반환한다.
+
+        Returns:
+            dict: Telemetry.snapshot 참고.
+        """
+        return self.__telemetry.snapshot()
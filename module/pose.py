@@ -0,0 +1,185 @@
+from math import atan2, asin, degrees, hypot
+from time import perf_counter
+
+import cv2
+import numpy as np
+
+
+class PoseEngine(object):
+    """고정된 3D 얼굴 모델로 머리의 회전 각도(degree)를 계산한다.
+
+    모델 좌표는 Detector._face_indexs 순서(1, 33, 61, 199, 263, 291)의
+    좌우반전한 이미지 기준 좌표이다. x는 오른쪽, y는 아래, z는 카메라에서 멀어지는 방향이며
+    단위는 mm에 가깝다.
+
+    - "pnp": 이전 프레임의 rvec, tvec에서 시작하는 solvePnP(useExtrinsicGuess).
+      이전 값이 없으면 SQPnP로 처음부터 계산한다.
+    - "axes": 3D 랜드마크로 눈과 턱이 이루는 축을 직접 구한다. solvePnP보다 빠르다.
+
+    Args:
+        frame_w (int): 이미지의 가로 길이.
+        frame_h (int): 이미지의 세로 길이.
+        method (str): "pnp" 또는 "axes".
+
+    Example:
+    >>> engine = PoseEngine(480, 360, "pnp")
+    >>> pitch, yaw, roll = engine.estimate(points)
+
+    Functions:
+        estimate
+        reset
+        get_stats
+    """
+
+    MODEL_POINTS = np.array(
+        [
+            (0.0, 0.0, 0.0),  # 1: nose tip
+            (-45.0, -41.0, 39.0),  # 33: left eye outer corner (image)
+            (-32.0, 15.0, 45.0),  # 61: left mouth corner
+            (0.0, 59.0, 36.0),  # 199: chin
+            (45.0, -41.0, 39.0),  # 263: right eye outer corner
+            (32.0, 15.0, 45.0),  # 291: right mouth corner
+        ],
+        dtype=np.float64,
+    )
+    # Rows of MODEL_POINTS used by the "axes" method.
+    _LEFT_EYE, _CHIN, _RIGHT_EYE = 1, 3, 4
+
+    def __init__(self, frame_w, frame_h, method="axes"):
+        if method not in ("pnp", "axes"):
+            raise ValueError(f"Unknown pose method: {method}")
+        self._method = method
+        self._cam_matrix = np.array(
+            [
+                [frame_w, 0, frame_w / 2],
+                [0, frame_w, frame_h / 2],
+                [0, 0, 1],
+            ],
+            dtype=np.float64,
+        )
+        self._dist_matrix = np.zeros((4, 1), dtype=np.float64)
+        self._model_axes = self._get_axes(self.MODEL_POINTS)
+        self.__rvec = None
+        self.__tvec = None
+        self.__calls = 0
+        self.__time_sum = 0.0
+        self.__max_time = 0.0
+
+    def estimate(self, points):
+        """랜드마크 좌표로 머리의 회전 각도를 계산한다.
+
+        Args:
+            points (ndarray): (6, 3) 픽셀 좌표. 세 번째 열(깊이)은 x와 같은 단위이며
+                "axes"에서만 사용한다.
+
+        Returns:
+            ndarray: pitch(위가 양수), yaw(오른쪽이 양수), roll 순서의 각도(degree).
+        """
+        start = perf_counter()
+        if self._method == "pnp":
+            rotation_matrix = self._solve_pnp(points)
+        else:
+            rotation_matrix = self._rotate_axes(self._get_axes(points))
+        angles = self._to_angles(rotation_matrix)
+
+        elapsed = perf_counter() - start
+        self.__calls += 1
+        self.__time_sum += elapsed
+        self.__max_time = max(self.__max_time, elapsed)
+        return angles
+
+    def _solve_pnp(self, points):
+        image_points = np.ascontiguousarray(points[:, :2], dtype=np.float64)
+        if self.__rvec is None:
+            _, rvec, tvec = cv2.solvePnP(
+                self.MODEL_POINTS,
+                image_points,
+                self._cam_matrix,
+                self._dist_matrix,
+                flags=cv2.SOLVEPNP_SQPNP,
+            )
+        else:
+            _, rvec, tvec = cv2.solvePnP(
+                self.MODEL_POINTS,
+                image_points,
+                self._cam_matrix,
+                self._dist_matrix,
+                self.__rvec,
+                self.__tvec,
+                useExtrinsicGuess=True,
+                flags=cv2.SOLVEPNP_ITERATIVE,
+            )
+        if tvec[2, 0] > 0:
+            self.__rvec, self.__tvec = rvec, tvec
+        else:
+            # Converged behind the camera: start cold on the next frame.
+            self.reset()
+        rotation_matrix, _ = cv2.Rodrigues(rvec)
+        # Measure against the ray to the face, so that a face looking straight
+        # at the camera reads as zero anywhere in the frame.
+        return self._get_view_axes(tvec[:, 0]).T @ rotation_matrix
+
+    @staticmethod
+    def _get_view_axes(tvec):
+        z = tvec / np.linalg.norm(tvec)
+        x = np.array((z[2], 0.0, -z[0])) / hypot(z[2], z[0])
+        return np.column_stack((x, np.cross(z, x), z))
+
+    @classmethod
+    def _get_axes(cls, points):
+        # Eye line (x), eyes to chin (y) and their normal (z) as unit vectors.
+        # Plain floats, since numpy call overhead dominates on three points.
+        (lx, ly, lz), (cx, cy, cz), (rx, ry, rz) = (
+            points[row].tolist() for row in (cls._LEFT_EYE, cls._CHIN, cls._RIGHT_EYE)
+        )
+        x = (rx - lx, ry - ly, rz - lz)
+        norm = hypot(*x)
+        x = (x[0] / norm, x[1] / norm, x[2] / norm)
+        y = (cx - (lx + rx) / 2, cy - (ly + ry) / 2, cz - (lz + rz) / 2)
+        dot = y[0] * x[0] + y[1] * x[1] + y[2] * x[2]
+        y = (y[0] - dot * x[0], y[1] - dot * x[1], y[2] - dot * x[2])
+        norm = hypot(*y)
+        y = (y[0] / norm, y[1] / norm, y[2] / norm)
+        z = (
+            x[1] * y[2] - x[2] * y[1],
+            x[2] * y[0] - x[0] * y[2],
+            x[0] * y[1] - x[1] * y[0],
+        )
+        return x, y, z
+
+    def _rotate_axes(self, axes):
+        # Rotation taking the model axes onto the face axes.
+        model = self._model_axes
+        return [
+            [sum(axes[k][i] * model[k][j] for k in range(3)) for j in range(3)]
+            for i in range(3)
+        ]
+
+    @staticmethod
+    def _to_angles(rotation_matrix):
+        # Euler angles of R = Rx @ Ry @ Rz, without cv2.RQDecomp3x3.
+        # The image y axis points down, so looking up is a negative x rotation.
+        r = rotation_matrix
+        pitch = atan2(-r[1][2], r[2][2])
+        yaw = asin(min(max(r[0][2], -1.0), 1.0))
+        roll = atan2(-r[0][1], r[0][0])
+        return np.array([-degrees(pitch), -degrees(yaw), degrees(roll)])
+
+    def reset(self):
+        """이전 프레임의 회전, 이동 값을 지워 다음 계산을 처음부터 시작한다."""
+        self.__rvec = None
+        self.__tvec = None
+
+    def get_stats(self):
+        """각도 계산 통계를 반환한다.
+
+        Returns:
+            dict: 계산 횟수, 평균, 최대 소요 시간(초).
+        """
+        calls = self.__calls
+        return {
+            "method": self._method,
+            "calls": calls,
+            "mean_time": self.__time_sum / calls if calls else 0.0,
+            "max_time": self.__max_time,
+        }
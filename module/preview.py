@@ -0,0 +1,168 @@
+from time import perf_counter
+
+import cv2
+import numpy as np
+
+
+class PreviewRenderer(object):
+    """탐지와 별개로 낮은 주기로 미리보기 창을 그린다.
+
+    탐지 과정에서는 submit으로 프레임을 미리 할당한 버퍼에 복사만 하고,
+    창을 그리는 render는 App의 별도 after 반복에서 호출한다.
+    그리기 전에 새 프레임이 들어오면 이전 프레임은 그리지 않고 건너뛴다.
+
+    Args:
+        rate (float): 미리보기 주기(Hz).
+        overlay (bool): 랜드마크, 얼굴 각도와 EAR을 함께 그릴 지 여부.
+        window (str): 창 이름.
+        on_open (callable): 창을 새로 띄운 뒤 창 이름을 받아 호출할 함수. (창 위치 조정 등)
+
+    Example:
+    >>> preview = PreviewRenderer(15)
+    >>> if preview.is_due():
+    ...     preview.submit(frame, points, box, angles, ear)  # detection loop
+    >>> delay = preview.render()  # App after loop
+
+    Functions:
+        is_due
+        submit
+        render
+        hide
+        get_stats
+    """
+
+    def __init__(self, rate=15, overlay=True, window="Frame", on_open=None):
+        self._period = 1 / rate
+        self._overlay = overlay
+        self._window = window
+        self._on_open = on_open
+        self.__frame = None
+        self.__points = None
+        self.__point_count = 0
+        self.__box = None
+        self.__angles = None
+        self.__ear = None
+        self.__is_pending = False
+        self.__is_open = False
+        self.__next_time = 0.0
+        self.__submitted = 0
+        self.__rendered = 0
+        self.__skipped = 0
+        self.__render_time = 0.0
+
+    def is_due(self, now=None):
+        """다음 미리보기 프레임을 받을 시점인지 확인한다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            bool: submit을 호출할 지 여부.
+        """
+        if now is None:
+            now = perf_counter()
+        return now >= self.__next_time
+
+    def submit(self, frame, points=None, box=None, angles=None, ear=None):
+        """미리보기로 그릴 프레임을 복사해 둔다.
+
+        탐지 과정의 버퍼는 다음 프레임에서 덮어쓰므로 미리 할당한 버퍼에 복사한다.
+
+        Args:
+            frame (ndarray): BGR 이미지.
+            points (ndarray): (N, 2) 랜드마크 픽셀 좌표.
+            box (tuple): 얼굴 주변 영역 (x0, y0, x1, y1).
+            angles (list): pitch, yaw, roll (degree).
+            ear (float): 두 눈의 EAR 평균.
+        """
+        self.__next_time = perf_counter() + self._period
+        if self.__frame is None or self.__frame.shape != frame.shape:
+            self.__frame = np.empty_like(frame)
+        np.copyto(self.__frame, frame)
+        if self.__is_pending:
+            self.__skipped += 1  # The renderer fell behind: drop the older one.
+        self.__is_pending = True
+        self.__submitted += 1
+
+        self.__point_count = 0
+        if self._overlay and points is not None:
+            if self.__points is None or len(self.__points) < len(points):
+                self.__points = np.empty((len(points), 2), dtype=np.int32)
+            self.__point_count = len(points)
+            self.__points[: self.__point_count] = points
+        self.__box = box
+        self.__angles = None if angles is None else tuple(angles)
+        self.__ear = ear
+
+    def render(self):
+        """복사해 둔 프레임이 있다면 창에 그린다. App의 after 반복에서 호출한다.
+
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms).
+        """
+        if self.__is_pending:
+            start = perf_counter()
+            frame = self.__frame
+            if self._overlay:
+                self._draw_overlay(frame)
+            cv2.imshow(self._window, frame)
+            if not self.__is_open:
+                # Window properties only need to be set when the window appears.
+                cv2.setWindowProperty(self._window, cv2.WND_PROP_TOPMOST, 1)
+                if self._on_open is not None:
+                    self._on_open(self._window)
+                self.__is_open = True
+            cv2.pollKey()
+            self.__is_pending = False
+            self.__rendered += 1
+            self.__render_time += perf_counter() - start
+        delay = self.__next_time - perf_counter()
+        return max(int(delay * 1000), 1)
+
+    def _draw_overlay(self, frame):
+        color = (0, 255, 0)
+        for x, y in self.__points[: self.__point_count].tolist():
+            cv2.circle(frame, (x, y), 2, color, -1)
+        if self.__box is not None:
+            x0, y0, x1, y1 = self.__box
+            cv2.rectangle(frame, (x0, y0), (x1, y1), color, 1)
+        lines = []
+        if self.__angles is not None:
+            lines.append(
+                "pitch {:+.0f} yaw {:+.0f} roll {:+.0f}".format(*self.__angles)
+            )
+        if self.__ear is not None:
+            lines.append(f"EAR {self.__ear:.2f}")
+        for i, line in enumerate(lines):
+            cv2.putText(
+                frame,
+                line,
+                (10, 20 + 20 * i),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                color,
+                1,
+                cv2.LINE_AA,
+            )
+
+    def hide(self):
+        """창을 닫고 남은 프레임을 버린다."""
+        if self.__is_open:
+            cv2.destroyWindow(self._window)
+            self.__is_open = False
+        self.__is_pending = False
+        self.__next_time = 0.0
+
+    def get_stats(self):
+        """미리보기 통계를 반환한다.
+
+        Returns:
+            dict: 받은 프레임, 그린 프레임, 건너뛴 프레임 수와 평균 그리기 시간(초).
+        """
+        rendered = self.__rendered
+        return {
+            "submitted": self.__submitted,
+            "rendered": rendered,
+            "skipped": self.__skipped,
+            "mean_render_time": self.__render_time / rendered if rendered else 0.0,
+        }
@@ -0,0 +1,181 @@
+"""프로세스 사이에서 카메라 프레임을 복사하지 않고 주고받는 공유 메모리 링 버퍼.
+
+프레임마다 1부터 증가하는 번호를 붙이며, 칸(slot)마다 기록 중인 프레임 번호를
+음수로 적어 두는 seqlock 방식으로 읽는 쪽이 덮어쓰인 프레임을 알아챈다.
+"""
+
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+_HEADER_ITEMS = 2  # Last written frame number and the number of slots.
+
+
+class FrameRing(object):
+    """multiprocessing.shared_memory 위의 고정 크기 프레임 링 버퍼.
+
+    쓰는 프로세스는 하나이며, 다음 칸을 begin_write로 받아 그 자리에 바로 디코딩한 뒤
+    end_write로 공개한다. 읽는 쪽은 read_latest로 가장 최근 프레임의 공유 메모리 view를
+    받아 사용하고, 사용한 뒤 is_valid로 그동안 덮어쓰이지 않았는지 확인한다.
+    가장 오래된 칸부터 덮어쓰므로 읽는 쪽에는 (slots - 1) 프레임 동안의 여유가 있다.
+
+    Args:
+        shape (tuple): 프레임 모양. (height, width, channels)
+        slots (int): 칸 수.
+        name (str): 붙을 공유 메모리 이름. None이면 새로 만든다.
+
+    Example:
+    >>> ring = FrameRing((480, 640, 3))  # owner
+    >>> view = ring.begin_write()
+    >>> capture.read(view)
+    >>> ring.end_write(perf_counter())
+
+    >>> ring = FrameRing((480, 640, 3), name=name)  # another process
+    >>> latest = ring.read_latest(last_id)
+    >>> if latest is not None:
+    ...     frame_id, frame, timestamp = latest
+    ...     result = detect(frame)
+    ...     is_fresh = ring.is_valid(frame_id)
+
+    Functions:
+        begin_write
+        end_write
+        write
+        read_latest
+        is_valid
+        get_written
+        close
+        unlink
+    """
+
+    def __init__(self, shape, slots=4, name=None):
+        self.shape = tuple(shape)
+        frame_bytes = int(np.prod(self.shape))
+        self._is_owner = name is None
+        if self._is_owner:
+            header_bytes = 8 * (_HEADER_ITEMS + 2 * slots)
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=header_bytes + slots * frame_bytes
+            )
+        else:
+            # Spawned workers share the owner's resource tracker, so attaching
+            # does not unlink the block when they exit.
+            self._shm = shared_memory.SharedMemory(name=name)
+        buffer = self._shm.buf
+        self._header = np.ndarray((_HEADER_ITEMS,), np.int64, buffer)
+        if self._is_owner:
+            self._header[:] = (0, slots)
+        self.slots = int(self._header[1])
+        offset = 8 * _HEADER_ITEMS
+        self._sequences = np.ndarray((self.slots,), np.int64, buffer, offset)
+        offset += 8 * self.slots
+        self._timestamps = np.ndarray((self.slots,), np.float64, buffer, offset)
+        offset += 8 * self.slots
+        self._frames = np.ndarray((self.slots,) + self.shape, np.uint8, buffer, offset)
+        if self._is_owner:
+            self._sequences[:] = 0
+        self.__writing = None
+
+    @property
+    def name(self):
+        """다른 프로세스가 붙을 때 사용할 공유 메모리 이름."""
+        return self._shm.name
+
+    def begin_write(self):
+        """다음 프레임을 기록할 칸을 받는다.
+
+        Returns:
+            ndarray: 칸의 view. end_write 전까지 이 자리에 프레임을 기록한다.
+        """
+        frame_id = int(self._header[0]) + 1
+        slot = (frame_id - 1) % self.slots
+        # Negative while being written, so readers see the slot as torn.
+        self._sequences[slot] = -frame_id
+        self.__writing = frame_id
+        return self._frames[slot]
+
+    def end_write(self, timestamp):
+        """begin_write로 받은 칸의 기록을 마치고 가장 최근 프레임으로 공개한다.
+
+        Args:
+            timestamp (float): 프레임 촬영 시각 (time.perf_counter 기준).
+
+        Returns:
+            int: 공개한 프레임 번호.
+        """
+        frame_id = self.__writing
+        slot = (frame_id - 1) % self.slots
+        self._timestamps[slot] = timestamp
+        self._sequences[slot] = frame_id
+        self._header[0] = frame_id
+        self.__writing = None
+        return frame_id
+
+    def write(self, frame, timestamp):
+        """프레임을 복사해 기록한다. 모양이 다르면 칸 크기에 맞춘다.
+
+        Args:
+            frame (ndarray): BGR 이미지.
+            timestamp (float): 프레임 촬영 시각 (time.perf_counter 기준).
+
+        Returns:
+            int: 공개한 프레임 번호.
+        """
+        view = self.begin_write()
+        if frame.shape == self.shape:
+            np.copyto(view, frame)
+        else:
+            cv2.resize(frame, (self.shape[1], self.shape[0]), dst=view)
+        return self.end_write(timestamp)
+
+    def read_latest(self, last_id=0):
+        """last_id보다 새로운 가장 최근 프레임을 복사하지 않고 가져온다.
+
+        Args:
+            last_id (int): 마지막으로 읽은 프레임 번호.
+
+        Returns:
+            tuple: (프레임 번호, 공유 메모리 view, 촬영 시각).
+            새 프레임이 없거나 기록 중이라면 None.
+        """
+        frame_id = int(self._header[0])
+        if frame_id <= last_id:
+            return None
+        slot = (frame_id - 1) % self.slots
+        timestamp = float(self._timestamps[slot])
+        if self._sequences[slot] != frame_id:
+            return None  # Overwritten since the header was read.
+        return frame_id, self._frames[slot], timestamp
+
+    def is_valid(self, frame_id):
+        """프레임이 아직 덮어쓰이지 않았는지 확인한다. view 사용을 마친 뒤 호출한다.
+
+        Args:
+            frame_id (int): read_latest가 반환한 프레임 번호.
+
+        Returns:
+            bool: 사용하는 동안 프레임이 바뀌지 않았는지 여부.
+        """
+        return self._sequences[(frame_id - 1) % self.slots] == frame_id
+
+    def get_written(self):
+        """지금까지 기록한 프레임 수를 반환한다.
+
+        Returns:
+            int: 마지막 프레임 번호.
+        """
+        return int(self._header[0])
+
+    def close(self):
+        """이 프로세스의 연결을 닫는다. view는 더 이상 사용할 수 없다."""
+        self._header = self._sequences = self._timestamps = self._frames = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # A caller still holds a view: the mapping goes with the process.
+
+    def unlink(self):
+        """공유 메모리를 지운다. 만든 프로세스가 모든 프로세스를 멈춘 뒤 호출한다."""
+        if self._is_owner:
+            self._shm.unlink()
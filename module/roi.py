@@ -0,0 +1,120 @@
+from time import perf_counter
+
+
+class FaceROI(object):
+    """얼굴 주변 영역(ROI)을 관리한다.
+
+    얼굴을 찾은 뒤에는 마지막 랜드마크 주변에 여백을 더한 영역만 처리하고,
+    얼굴을 놓치면 전체 프레임에서 다시 찾도록 영역을 비운다.
+    Face Mesh의 추적이 흔들리지 않도록, 얼굴이 영역 가장자리에 가까워질 때만 영역을 옮긴다.
+
+    Args:
+        frame_w (int): 프레임 너비.
+        frame_h (int): 프레임 높이.
+        padding (float): 얼굴 크기 대비 여백 비율.
+
+    Functions:
+        get_box
+        update
+        lose
+        add_processed
+        get_stats
+    """
+
+    def __init__(self, frame_w, frame_h, padding=0.5):
+        self._frame_w = frame_w
+        self._frame_h = frame_h
+        self._padding = padding
+        self.__box = None
+        self.__lost_time = None
+        self.__roi_frames = 0
+        self.__full_frames = 0
+        self.__processed_pixels = 0
+        self.__reacquire_count = 0
+        self.__reacquire_time = 0.0
+        self.__last_reacquire_time = None
+
+    def get_box(self):
+        """현재 처리할 영역을 반환한다.
+
+        Returns:
+            tuple: (x0, y0, x1, y1) 픽셀 좌표. 얼굴을 찾지 못한 상태라면 None.
+        """
+        return self.__box
+
+    def update(self, points):
+        """탐지된 랜드마크로 영역을 갱신한다.
+
+        Args:
+            points (ndarray): 프레임 기준 픽셀 좌표 (N, 2).
+        """
+        if self.__lost_time is not None:
+            elapsed = perf_counter() - self.__lost_time
+            self.__reacquire_count += 1
+            self.__reacquire_time += elapsed
+            self.__last_reacquire_time = elapsed
+            self.__lost_time = None
+
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0)
+        pad = self._padding * max(x1 - x0, y1 - y0)
+        if self.__box is not None:
+            bx0, by0, bx1, by1 = self.__box
+            margin = pad / 2
+            if (
+                x0 - bx0 >= margin
+                and y0 - by0 >= margin
+                and bx1 - x1 >= margin
+                and by1 - y1 >= margin
+            ):
+                # Keep the crop stable while the face stays well inside it.
+                return
+        self.__box = (
+            max(int(x0 - pad), 0),
+            max(int(y0 - pad), 0),
+            min(int(x1 + pad) + 1, self._frame_w),
+            min(int(y1 + pad) + 1, self._frame_h),
+        )
+
+    def lose(self):
+        """얼굴을 놓쳤음을 기록하고 전체 프레임 탐색으로 돌아간다."""
+        self.__box = None
+        if self.__lost_time is None:
+            self.__lost_time = perf_counter()
+
+    def add_processed(self, frame_shape, is_roi):
+        """Face Mesh에 전달한 이미지 크기를 기록한다.
+
+        Args:
+            frame_shape (tuple): 처리한 이미지의 shape.
+            is_roi (bool): 잘라낸 영역인지 여부.
+        """
+        self.__processed_pixels += frame_shape[0] * frame_shape[1]
+        if is_roi:
+            self.__roi_frames += 1
+        else:
+            self.__full_frames += 1
+
+    def get_stats(self):
+        """영역 처리 통계를 반환한다.
+
+        Returns:
+            dict: 영역/전체 프레임 처리 횟수, 전체 프레임 대비 절약한 픽셀 비율,
+            재탐지 횟수와 평균, 마지막 재탐지 시간(초).
+        """
+        processed = self.__roi_frames + self.__full_frames
+        full_pixels = processed * self._frame_w * self._frame_h
+        return {
+            "roi_frames": self.__roi_frames,
+            "full_frames": self.__full_frames,
+            "pixel_saving": (
+                1 - self.__processed_pixels / full_pixels if full_pixels else 0.0
+            ),
+            "reacquired": self.__reacquire_count,
+            "mean_reacquire_time": (
+                self.__reacquire_time / self.__reacquire_count
+                if self.__reacquire_count
+                else None
+            ),
+            "last_reacquire_time": self.__last_reacquire_time,
+        }
@@ -0,0 +1,117 @@
+from math import ceil
+from time import perf_counter
+
+
+class FrameScheduler(object):
+    """단조 시계(monotonic clock)를 기준으로 프레임 처리 시점(deadline)을 정한다.
+
+    입출력 전에 처리 시점이 되었는지 확인해, 처리하지 않을 프레임은 읽지 않도록 한다.
+    처리 시점보다 늦게 시작한 정도(jitter)와 놓친 처리 시점의 수를 기록한다.
+
+    Args:
+        rate (float): 목표 초당 처리 횟수.
+
+    Example:
+    >>> scheduler = FrameScheduler(30)
+    >>> if scheduler.is_due():
+    ...     frame = read()
+    ...     scheduler.begin()
+
+    Functions:
+        is_due
+        begin
+        get_delay_ms
+        set_rate
+        get_stats
+    """
+
+    def __init__(self, rate=60):
+        self._period = 1 / rate
+        self.__deadline = None
+        self.__ticks = 0
+        self.__missed = 0
+        self.__jitter_sum = 0.0
+        self.__max_jitter = 0.0
+        self.__last_jitter = None
+
+    def is_due(self, now=None):
+        """현재 시각이 다음 처리 시점을 지났는지 확인한다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            bool: 처리 시점 도달 여부.
+        """
+        if self.__deadline is None:
+            return True
+        if now is None:
+            now = perf_counter()
+        return now >= self.__deadline
+
+    def begin(self, now=None, ready=None):
+        """이번 처리를 시작했음을 기록하고 다음 처리 시점을 정한다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+            ready (float): 처리할 프레임이 준비된 시각. 처리 시점보다 늦게 준비된
+                프레임은 준비된 시각을 기준으로 jitter를 계산한다.
+        """
+        if now is None:
+            now = perf_counter()
+        self.__ticks += 1
+        if self.__deadline is None:
+            self.__deadline = now + self._period
+            return
+
+        # A frame that arrives after the deadline is the camera's delay,
+        # not the scheduler's.
+        start = self.__deadline if ready is None else max(self.__deadline, ready)
+        jitter = max(now - start, 0.0)
+        self.__last_jitter = jitter
+        self.__jitter_sum += jitter
+        self.__max_jitter = max(self.__max_jitter, jitter)
+        self.__missed += int(jitter // self._period)
+        if now - self.__deadline >= self._period:
+            # Restart from now instead of bursting to catch up.
+            self.__deadline = now + self._period
+        else:
+            self.__deadline += self._period
+
+    def get_delay_ms(self, now=None):
+        """다음 처리 시점까지 남은 시간을 반환한다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            int: 남은 시간(ms). 이미 지났다면 0.
+        """
+        if self.__deadline is None:
+            return 0
+        if now is None:
+            now = perf_counter()
+        return max(ceil((self.__deadline - now) * 1000), 0)
+
+    def set_rate(self, rate):
+        """목표 초당 처리 횟수를 바꾼다. 다음 처리 시점부터 적용된다.
+
+        Args:
+            rate (float): 목표 초당 처리 횟수.
+        """
+        self._period = 1 / rate
+
+    def get_stats(self):
+        """처리 시점 통계를 반환한다.
+
+        Returns:
+            dict: 처리 횟수, 놓친 처리 시점 수, 평균, 최대, 마지막 jitter(초).
+        """
+        jittered = max(self.__ticks - 1, 0)
+        return {
+            "ticks": self.__ticks,
+            "missed": self.__missed,
+            "mean_jitter": self.__jitter_sum / jittered if jittered else 0.0,
+            "max_jitter": self.__max_jitter,
+            "last_jitter": self.__last_jitter,
+        }
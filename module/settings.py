@@ -1,4 +1,6 @@
 import os
+from math import ceil, sqrt
+from time import perf_counter
 from tkinter import Tk, Toplevel, Scale, IntVar, Button, Label, messagebox
 from tkinter.font import Font
 from PIL import ImageTk, Image
@@ -7,11 +9,19 @@ import numpy as np
 import cv2
 
 try:
+    from camera import open_camera
+    from capture import FrameGrabber
+    from config import SettingsStore
     from function import Detector
-    from constant import CAM_ID, SETTING_FILE, DEFAULT_SETTINGS
+    from constant import CAM_ID, DEFAULT_SETTINGS
+    from stats import RobustStats
 except ImportError:
+    from module.camera import open_camera
+    from module.capture import FrameGrabber
+    from module.config import SettingsStore
     from module.function import Detector
-    from module.constant import CAM_ID, SETTING_FILE, DEFAULT_SETTINGS
+    from module.constant import CAM_ID, DEFAULT_SETTINGS
+    from module.stats import RobustStats
 
 _DIR = os.path.dirname(os.path.realpath(__file__))
 
@@ -38,18 +48,92 @@ class SettingError(Exception):
 class EARSetter(object):
     """직접 눈의 EAR을 측정해 임계값 설정.
 
-    Function: execute
+    눈을 뜬 상태(open)와 감은 상태(close)를 차례로 측정한다.
+    측정한 값은 저장하지 않고 평균, 분산과 사분위수만 갱신하며(module.stats 참고),
+    두 상태의 EAR이 충분히 구분되면 max_frame까지 기다리지 않고 측정을 마친다.
+    안내가 끝난 직후에는 아직 눈을 감거나 뜨는 중일 수 있으므로 settle_time 동안의 프레임은 버린다.
+    step은 기다리지 않고 한 단계씩만 진행하므로 Tk의 after로 반복 호출할 수 있다.
+
+    Args:
+        countdown (int): 상태별 측정 전 안내 시간(초).
+        min_frame (int): 상태별 최소 측정 프레임 수.
+        max_frame (int): 상태별 최대 측정 프레임 수.
+        separation (float): 측정을 마칠 두 상태의 차이.
+            평균의 차이를 두 상태의 표준편차(합산)로 나눈 값.
+        tolerance (float): 눈을 뜬 상태의 측정을 마칠 평균의 표준 오차.
+        settle_time (float): 안내가 끝난 뒤 측정하지 않고 버리는 시간(초).
+
+    Example:
+    >>> setter = EARSetter()
+    >>> setter.start(CAM_ID, root, on_done)  # on_done(threshold, elapsed)
+    >>> threshold = EARSetter().execute(CAM_ID)  # blocking
+
+    Functions:
+        start
+        step
+        execute
+        release
+        get_stats
     """
 
-    def __init__(self):
-        self._min_frame = 160
-        self._frame_ignore = 10
-        self.__frame_counter = 0
-        self.__cap = None
+    def __init__(
+        self,
+        countdown=10,
+        min_frame=30,
+        max_frame=160,
+        separation=3.0,
+        tolerance=0.002,
+        settle_time=0.5,
+    ):
+        self._states = ("open", "close")
+        self._countdown = countdown
+        self._min_frame = min_frame
+        self._max_frame = max_frame
+        self._separation = separation
+        self._tolerance = tolerance
+        self._settle_time = settle_time
+        self.__grabber = None
         self.__detector = None
+        self.__samples = {state: RobustStats() for state in self._states}
+        self.__state_index = 0
+        self.__countdown_end = None
+        self.__guide = None
+        self.__start_time = None
+        self.__end_time = None
+        self.__measure_time = 0.0
+        self.__measure_start = None
+        self.__threshold = None
+
+    def start(self, device_id, root, on_done, on_error=None):
+        """Tk의 after로 측정을 진행한다. 측정하는 동안 mainloop를 막지 않는다.
+
+        Args:
+            device_id: 사용할 카메라 정보.
+            root (Tk): after를 호출할 Tk 객체.
+            on_done (callable): 측정을 마친 뒤 EAR 임계값과 걸린 시간(초)을 받아 호출할 함수.
+            on_error (callable): 측정에 실패하면 예외를 받아 호출할 함수.
+        """
+
+        def repeat():
+            try:
+                delay = self.step()
+            except Exception as error:
+                self.release()
+                if on_error is None:
+                    raise
+                on_error(error)
+                return
+            if delay is None:
+                self.release()
+                on_done(self.__threshold, self.get_stats()["elapsed"])
+            else:
+                root.after(delay, repeat)
+
+        self._open(device_id)
+        root.after(0, repeat)
 
     def execute(self, device_id):
-        """직접 눈의 EAR을 측정해 임계값을 설정하는 과정을 실행한다.
+        """직접 눈의 EAR을 측정해 임계값을 설정하는 과정을 실행한다. 끝날 때까지 기다린다.
 
         Args:
             device_id: 사용할 카메라 정보.
@@ -57,72 +141,117 @@ class EARSetter(object):
         Returns:
             float: EAR 임계값.
         """
-        self.__cap = cv2.VideoCapture(device_id)
-        if self.__cap.isOpened():
-            sucess, frame = self.__cap.read()
-            if sucess:
-                self.__detector = Detector(frame)
-                threshold = self.__get_ear_threshold()
+        self._open(device_id)
+        try:
+            while True:
+                delay = self.step()
+                if delay is None:
+                    return self.__threshold
+                cv2.waitKey(delay)
+        finally:
+            self.release()
+
+    def _open(self, device_id):
+        cap, _ = open_camera(device_id)
+        if not cap.isOpened():
+            cap.release()
+            raise SettingError(f"Cannot open camera: {device_id}")
+        self.__grabber = FrameGrabber(cap)
+        self.__grabber.start()
+        self.__start_time = perf_counter()
+        self.__countdown_end = self.__start_time + self._countdown
+
+    def step(self):
+        """측정을 한 단계 진행한다. 기다리지 않는다.
 
-        cv2.destroyAllWindows()
-        self.__cap.release()
-        return threshold
-
-    def __get_ear_threshold(self):
-        ear_generator = (self.__get_ear_realtime(guide) for guide in ["open", "close"])
-        filtered_ears = (self._drop_outliers(data) for data in ear_generator)
-        threshold = self._get_ear_threshold(filtered_ears)
-        return threshold
-
-    def __get_ear_realtime(self, state):
-        ear_list = list()
-        while self.__cap.isOpened():
-            sucess, frame = self.__cap.read()
-            if sucess:
-                frame, rgb_frame = self.__detector.convert_frame(frame)
-                if self.__frame_counter < self._frame_ignore:
-                    cv2.imshow("Detecting", frame)
-                    cv2.moveWindow("Detecting", 100, 100)
-                    self._show_guideline(
-                        f"{state}-{self._frame_ignore - self.__frame_counter}"
-                    )
-                    cv2.waitKey(1000)
-                    self.__frame_counter += 1
-                else:
-                    is_detected = self.__detector.detect_landmark(rgb_frame)
-                    if is_detected:
-                        cv2.imshow("Detecting", frame)
-                        self._show_guideline(f"{state}-0")
-                        cv2.waitKey(1)
-                        ear = self.__detector.get_both_eyes_ear()
-                        ear_list.append(ear)
-                        if self.__frame_counter >= self._min_frame:
-                            self.__frame_counter = 0
-                            break
-                        self.__frame_counter += 1
-        return ear_list
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms). 측정을 마쳤다면 None.
+        """
+        state = self._states[self.__state_index]
+        now = perf_counter()
+        success, frame = self.__grabber.read()
+        if not success:
+            return self._get_frame_delay()
+        if self.__detector is None:
+            self.__detector = Detector(frame)
+        frame, rgb_frame = self.__detector.convert_frame(frame)
+
+        if now < self.__countdown_end:
+            cv2.imshow("Detecting", frame)
+            cv2.moveWindow("Detecting", 100, 100)
+            self._show_guideline(f"{state}-{ceil(self.__countdown_end - now)}")
+            return 30
+        if now < self.__countdown_end + self._settle_time:
+            # The eyes are often still closing or opening: not fed to the stats,
+            # where the first warm-up samples skip the outlier check.
+            cv2.imshow("Detecting", frame)
+            self._show_guideline(f"{state}-0")
+            return 5
+
+        if self.__measure_start is None:
+            self.__measure_start = now
+        if self.__detector.detect_landmark(rgb_frame):
+            cv2.imshow("Detecting", frame)
+            self._show_guideline(f"{state}-0")
+            self.__samples[state].add(self.__detector.get_both_eyes_ear())
+            if self._is_measured(state):
+                self.__measure_time += perf_counter() - self.__measure_start
+                self.__measure_start = None
+                return self._next_state()
+        return self._get_frame_delay()
+
+    def _get_frame_delay(self):
+        # Wait until the next camera frame is due instead of polling for it.
+        delay = self.__grabber.get_next_frame_delay()
+        return 5 if delay is None else max(ceil(delay * 1000), 2)
+
+    def _is_measured(self, state):
+        samples = self.__samples[state]
+        measured = samples.stats.count + samples.rejected
+        if measured >= self._max_frame:
+            return True
+        if samples.stats.count < self._min_frame:
+            return False
+        if state == "open":
+            return samples.stats.get_std_error() <= self._tolerance
+        return self._get_separation() >= self._separation
+
+    def _get_separation(self):
+        opened = self.__samples["open"].stats
+        closed = self.__samples["close"].stats
+        spread = sqrt(opened.variance + closed.variance)
+        return abs(opened.mean - closed.mean) / spread if spread else float("inf")
+
+    def _next_state(self):
+        self.__state_index += 1
+        if self.__state_index < len(self._states):
+            self.__countdown_end = perf_counter() + self._countdown
+            return 1
+        self.__end_time = perf_counter()
+        self.__threshold = self._get_ear_threshold(
+            [self._check_outliers(self.__samples[state]) for state in self._states]
+        )
+        return None
 
     def _show_guideline(self, img_name):
+        if img_name == self.__guide:
+            cv2.pollKey()
+            return
+        self.__guide = img_name
         img = os.path.join(_DIR, "src", "ear", f"{img_name}.png")
         cv2.imshow("Guide", cv2.imread(img))
         cv2.moveWindow("Guide", 400, 400)
         cv2.setWindowProperty("Guide", cv2.WND_PROP_TOPMOST, 1)
+        cv2.pollKey()
 
-    def _drop_outliers(self, data):
-        data = np.array(data, dtype=np.float64)
-        q3, q1 = np.percentile(data, [75, 25])
-        iqr = q3 - q1
-
-        def _not_outlier(x):
-            return (q3 + 1.5 * iqr > x) and (x > q1 - 1.5 * iqr)
-
-        normal_value = [value for value in data if _not_outlier(value)]
-        if len(normal_value) < self._min_frame * 0.6:
+    def _check_outliers(self, samples):
+        measured = samples.stats.count + samples.rejected
+        if samples.stats.count < measured * 0.6:
             raise SettingError("Too many abnormal EAR values are included.")
-        return normal_value
+        return samples.stats.mean
 
     def _get_ear_threshold(self, ears):
-        single_ear_1, single_ear_2 = [np.mean(data) for data in ears]
+        single_ear_1, single_ear_2 = ears
         if single_ear_1 < single_ear_2:
             closed = single_ear_1
             opened = single_ear_2
@@ -132,6 +261,37 @@ class EARSetter(object):
         threshold = closed * 0.4 + opened * 0.6
         return np.round(threshold, 2)
 
+    def release(self):
+        """카메라와 창을 해제한다."""
+        if self.__grabber is not None:
+            self.__grabber.release()
+            self.__grabber = None
+        cv2.destroyAllWindows()
+
+    def get_stats(self):
+        """측정 통계를 반환한다.
+
+        Returns:
+            dict: 상태별 측정 프레임 수, 제외한 프레임 수, 평균, 표준편차와
+            두 상태의 차이, 측정에 걸린 시간(measure_time), 안내를 포함한 전체 시간(elapsed).
+        """
+        result = {}
+        for state, samples in self.__samples.items():
+            result[state] = {
+                "frames": samples.stats.count,
+                "rejected": samples.rejected,
+                "mean": samples.stats.mean,
+                "std": sqrt(samples.stats.variance),
+            }
+        result["separation"] = self._get_separation()
+        result["measure_time"] = self.__measure_time
+        if self.__start_time is None:
+            result["elapsed"] = 0.0
+        else:
+            end_time = perf_counter() if self.__end_time is None else self.__end_time
+            result["elapsed"] = end_time - self.__start_time
+        return result
+
 
 class CustomSettingPage(Tk):
     """사용 설정 페이지.
@@ -147,8 +307,9 @@ class CustomSettingPage(Tk):
         # Tk.resizable(self, 0, 0)
         Tk.configure(self, bg="white")
 
-        self._SETTING_FILE = os.path.join(_DIR, SETTING_FILE)
+        self._settings = SettingsStore()
         self._DEFAULT = DEFAULT_SETTINGS
+        self.__ear_setter = None
 
         settings = self._get_current_setting()
         self.__blink = IntVar(value=int(settings[0]))
@@ -259,20 +420,30 @@ class CustomSettingPage(Tk):
         self.geometry(f"{width+8}x{height+8}+60+30")
 
     def _set_customed_ear(self):
-        CAM_ID = load_cam_id()
-        setter = EARSetter()
-        threshold = setter.execute(CAM_ID)
+        if self.__ear_setter is not None:
+            return  # Already measuring.
+        self.__ear_setter = EARSetter()
+        try:
+            self.__ear_setter.start(
+                load_cam_id(), self, self._on_ear_measured, self._on_ear_error
+            )
+        except SettingError as error:
+            self._on_ear_error(error)
+
+    def _on_ear_measured(self, threshold, elapsed):
+        self.__ear_setter = None
         self.__scale_ear.set(int(threshold * 100))
         messagebox.showinfo(
-            "Settings", f"EAR 값이 {int(threshold * 100)}로 설정되었습니다."
+            "Settings",
+            f"EAR 값이 {int(threshold * 100)}로 설정되었습니다. ({elapsed:.1f}초 소요)",
         )
 
+    def _on_ear_error(self, error):
+        self.__ear_setter = None
+        messagebox.showerror("Settings", f"EAR 값을 측정하지 못했습니다. ({error})")
+
     def _get_current_setting(self):
-        if os.path.exists(self._SETTING_FILE):
-            settings = np.load(self._SETTING_FILE)
-        else:
-            settings = self._DEFAULT
-        return settings
+        return self._settings.get().to_array()
 
     def _save_settings(self):
         variables = (
@@ -291,7 +462,8 @@ class CustomSettingPage(Tk):
         settings[4] = -settings[4]  # Down Threshold
         settings[7] = settings[7] * 100  # Scroll Sensitivity
         self._check_data_requirements(settings)
-        np.save(self._SETTING_FILE, np.array(settings, dtype=np.float64))
+        # Written atomically: a running Process picks it up between frames.
+        self._settings.save(settings)
         messagebox.showinfo("Settings", "설정이 정상적으로 완료되었습니다.")
 
     def _check_data_requirements(self, values):
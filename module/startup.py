@@ -0,0 +1,372 @@
+"""프로그램 시작 과정.
+
+사이드바(App)를 먼저 띄우고, 무거운 모듈(cv2, mediapipe)의 import, 카메라 열기,
+Face Mesh 생성과 예열(warm-up)은 별도 스레드에서 수행한다.
+이 모듈은 시작을 늦추지 않도록 표준 라이브러리만 import한다.
+"""
+
+import os
+import threading
+from time import perf_counter, sleep
+
+
+def load_process(
+    mark,
+    device=None,
+    backend=None,
+    profile_path=None,
+    mode=None,
+    max_frame_rate=60,
+    publisher=None,
+):
+    """Process를 만들고 카메라 읽기를 시작한다. 백그라운드 스레드에서 실행한다.
+
+    카메라를 여는 동안 Face Mesh를 만들고 빈 이미지로 예열한다.
+
+    Args:
+        mark (callable): 단계 이름을 받아 시각을 기록하는 함수.
+        device: 카메라 정보 또는 영상 파일 경로. None이면 설정된 카메라를 사용한다.
+        backend (InputBackend): 입력 장치. None이면 환경에 맞는 장치를 사용한다.
+        profile_path (str): 카메라 모드 파일 경로. None이면 기본 경로를 사용한다.
+        mode (dict): 저장된 모드 대신 요청할 카메라 모드. (width, height, fourcc, fps)
+        max_frame_rate (float): 목표 초당 처리 프레임 수.
+        publisher (EventServer): 얼굴 각도와 동작을 보낼 객체. Process 참고.
+
+    Returns:
+        Process: 실행 객체.
+    """
+    import cv2
+    import numpy as np
+
+    try:
+        from camera import get_mode, load_profile, open_camera, set_mode
+        from baseline import PoseBaseline
+        from capture import FrameGrabber
+        from config import SettingsStore
+        from function import Detector, Process
+        from settings import load_cam_id
+    except ImportError:
+        from module.camera import get_mode, load_profile, open_camera, set_mode
+        from module.baseline import PoseBaseline
+        from module.capture import FrameGrabber
+        from module.config import SettingsStore
+        from module.function import Detector, Process
+        from module.settings import load_cam_id
+    mark("imports")
+
+    if device is None:
+        device = load_cam_id()
+    path = {} if profile_path is None else {"path": profile_path}
+    opened = {}
+
+    def open_device():
+        opened["capture"], opened["profile"] = open_camera(device, **path)
+        if mode is not None and opened["profile"] is not None:
+            set_mode(opened["capture"], mode)
+            opened["profile"] = get_mode(opened["capture"])
+        mark("camera")
+
+    camera_thread = threading.Thread(target=open_device, daemon=True)
+    camera_thread.start()
+    profile = mode or load_profile(device, **path)
+    if profile is None:
+        # First run: the frame size is only known once the camera is probed.
+        camera_thread.join()
+        profile = opened["profile"] or {"width": 640, "height": 480}
+
+    settings = SettingsStore()
+    telemetry = _load_telemetry()
+    baseline = PoseBaseline()
+    detector = Detector(
+        np.zeros((profile["height"], profile["width"], 3), np.uint8),
+        settings=settings,
+        telemetry=telemetry,
+        baseline=baseline,
+    )
+    detector.warm_up()
+    mark("detector")
+
+    camera_thread.join()
+    capture = opened["capture"]
+    if not capture.isOpened():
+        raise RuntimeError(f"Cannot open camera: {device}")
+    grabber = FrameGrabber(capture)
+    grabber.start()
+    return Process(
+        grabber,
+        max_frame_rate=max_frame_rate,
+        backend=backend,
+        detector=detector,
+        settings=settings,
+        telemetry=telemetry,
+        baseline=baseline,
+        publisher=publisher,
+    )
+
+
+def load_pipeline(mark, device=None, backend=None, mode=None, max_frame_rate=60):
+    """카메라 읽기와 얼굴 탐지를 별도 프로세스에서 수행하는 PipelineProcess를 만든다.
+
+    Args:
+        load_process 참고.
+
+    Returns:
+        PipelineProcess: 실행 객체.
+    """
+    try:
+        from config import SettingsStore
+        from pipeline import PipelineProcess
+        from settings import load_cam_id
+    except ImportError:
+        from module.config import SettingsStore
+        from module.pipeline import PipelineProcess
+        from module.settings import load_cam_id
+    mark("imports")
+
+    if device is None:
+        device = load_cam_id()
+    process = PipelineProcess(
+        device,
+        max_frame_rate,
+        backend,
+        mode,
+        settings=SettingsStore(),
+        telemetry=_load_telemetry(),
+    )
+    mark("detector")
+    return process
+
+
+def _load_telemetry():
+    try:
+        from constant import TELEMETRY_FILE, TELEMETRY_PORT
+        from telemetry import Telemetry
+    except ImportError:
+        from module.constant import TELEMETRY_FILE, TELEMETRY_PORT
+        from module.telemetry import Telemetry
+
+    log_path = None
+    if TELEMETRY_FILE is not None:
+        log_path = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), TELEMETRY_FILE
+        )
+    telemetry = Telemetry(log_path)
+    if TELEMETRY_PORT is not None:
+        telemetry.serve(TELEMETRY_PORT)
+    return telemetry
+
+
+class Startup(object):
+    """Process 준비를 백그라운드에서 수행하고, 준비되기 전까지 App의 호출을 대신 받는다.
+
+    시작부터 각 단계까지 걸린 시간을 기록한다.
+
+    - window: 사이드바 표시
+    - imports, camera, detector: 백그라운드 준비 단계
+    - ready: Process 준비 완료
+    - first_frame: 첫 프레임 처리
+    - first_move: 얼굴 방향으로 커서를 처음 옮긴 시점
+
+    Args:
+        loader (callable): mark 함수를 받아 Process를 반환하는 함수. None이면 load_process.
+        start_time (float): 시작 시각(time.perf_counter 기준). None이면 객체를 만든 시각.
+
+    Example:
+    >>> startup = Startup(start_time=START_TIME)
+    >>> startup.start()
+    >>> app = App(
+    ...     startup.run, startup.suspend, startup.resume, startup.render_preview
+    ... )
+    >>> app.after(0, startup.mark, "window")
+
+    Functions:
+        start
+        mark
+        is_ready
+        run
+        render_preview
+        suspend
+        resume
+        release
+        get_marks
+    """
+
+    def __init__(self, loader=None, start_time=None):
+        self._loader = load_process if loader is None else loader
+        self._start_time = perf_counter() if start_time is None else start_time
+        self._poll_delay = 20
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__marks = {}
+        self.__process = None
+        self.__error = None
+        self.__is_paused = False
+        self.__is_released = False
+
+    def start(self):
+        """백그라운드 준비를 시작한다."""
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self._load, daemon=True)
+        self.__thread.start()
+
+    def _load(self):
+        try:
+            process = self._loader(self.mark)
+        except Exception as error:
+            self.__error = error
+            return
+        with self.__lock:
+            if self.__is_released:
+                process.release()
+                return
+            if self.__is_paused:
+                process.suspend()
+            self.__process = process
+        self.mark("ready")
+
+    def mark(self, name):
+        """단계에 도달한 시각을 기록한다. 처음 도달한 시각만 남긴다.
+
+        Args:
+            name (str): 단계 이름.
+        """
+        self.__marks.setdefault(name, perf_counter() - self._start_time)
+
+    def is_ready(self):
+        """Process 준비 여부를 반환한다.
+
+        Returns:
+            bool: 준비 완료 여부.
+        """
+        return self.__process is not None
+
+    def run(self, command, allow_showing_frame, allow_detecting_direction):
+        """준비된 Process를 실행한다. 준비 중이라면 아무것도 하지 않는다.
+
+        Args:
+            Process.run 참고.
+
+        Returns:
+            int: 다음 실행까지 기다릴 시간(ms).
+        """
+        process = self.__process
+        if process is None:
+            if self.__error is not None:
+                error, self.__error = self.__error, None
+                raise error
+            return self._poll_delay
+
+        delay = process.run(command, allow_showing_frame, allow_detecting_direction)
+        if "first_frame" not in self.__marks and process.get_frame_age() is not None:
+            self.mark("first_frame")
+        if "first_move" not in self.__marks and process.get_move_count():
+            self.mark("first_move")
+        return delay
+
+    def render_preview(self):
+        """준비된 Process의 미리보기 창을 그린다.
+
+        Returns:
+            int: 다음 호출까지 기다릴 시간(ms).
+        """
+        process = self.__process
+        if process is None:
+            return self._poll_delay
+        return process.render_preview()
+
+    def suspend(self):
+        """카메라 읽기와 얼굴 탐지를 멈춘다. 준비 중이라면 준비 후 멈춘다."""
+        with self.__lock:
+            self.__is_paused = True
+            process = self.__process
+        if process is not None:
+            process.suspend()
+
+    def resume(self):
+        """멈춘 카메라 읽기와 얼굴 탐지를 다시 시작한다."""
+        with self.__lock:
+            self.__is_paused = False
+            process = self.__process
+        if process is not None:
+            process.resume()
+
+    def release(self):
+        """Process를 해제한다. 준비 중이라면 준비가 끝나는 즉시 해제한다."""
+        with self.__lock:
+            self.__is_released = True
+            process, self.__process = self.__process, None
+        if process is not None:
+            process.release()
+
+    def get_marks(self):
+        """시작부터 각 단계까지 걸린 시간을 반환한다.
+
+        Returns:
+            dict: 단계 이름과 시간(초).
+        """
+        return dict(self.__marks)
+
+
+def measure_startup(device, legacy=False, timeout=10.0, profile_path=None):
+    """App을 띄우지 않고 시작 과정을 실행해 단계별 시간을 측정한다.
+
+    import 시간을 포함하려면 새 인터프리터에서 실행해야 한다.
+    (module.benchmark.run_startup_benchmark 참고)
+    사이드바 표시 시점(window)은 gui 모듈 import를 마친 시점으로 대신한다.
+
+    Args:
+        device: 카메라 정보 또는 영상 파일 경로.
+        legacy (bool): 모든 준비를 마친 뒤 사이드바를 띄우던 기존 순서로 측정할 지 여부.
+        timeout (float): 첫 커서 이동을 기다릴 최대 시간(초).
+        profile_path (str): 카메라 모드 파일 경로. load_process 참고.
+
+    Returns:
+        dict: 단계 이름과 시작부터 걸린 시간(초).
+    """
+    start_time = perf_counter()
+    if legacy:
+        # Everything was imported and built before the sidebar was created.
+        import cv2
+
+        try:
+            from backend import RecordingBackend
+            from capture import FrameGrabber
+            from function import Process
+            import gui  # noqa: F401
+        except ImportError:
+            from module.backend import RecordingBackend
+            from module.capture import FrameGrabber
+            from module.function import Process
+            import module.gui  # noqa: F401
+
+        grabber = FrameGrabber(cv2.VideoCapture(device))
+        grabber.start()
+        process = Process(grabber, backend=RecordingBackend())
+        startup = Startup(lambda mark: process, start_time)
+        startup._load()
+    else:
+        try:
+            import gui  # noqa: F401
+        except ImportError:
+            import module.gui  # noqa: F401
+
+        def loader(mark):
+            try:
+                from backend import RecordingBackend
+            except ImportError:
+                from module.backend import RecordingBackend
+            return load_process(mark, device, RecordingBackend(), profile_path)
+
+        startup = Startup(loader, start_time)
+        startup.start()
+    startup.mark("window")
+
+    end = perf_counter() + timeout
+    try:
+        while "first_move" not in startup.get_marks() and perf_counter() < end:
+            delay = startup.run(None, False, True)
+            sleep(delay / 1000)
+    finally:
+        startup.release()
+    return startup.get_marks()
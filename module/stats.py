@@ -0,0 +1,200 @@
+"""값을 저장하지 않고 한 번씩만 보며 통계를 계산한다. (streaming)"""
+
+from math import sqrt
+
+
+class RunningStats(object):
+    """Welford 방식으로 평균과 분산을 계산한다.
+
+    Example:
+    >>> stats = RunningStats()
+    >>> for x in (0.30, 0.32, 0.28):
+    ...     stats.add(x)
+    >>> round(stats.mean, 2)
+    0.3
+
+    Functions:
+        add
+        get_std_error
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.__m2 = 0.0
+
+    def add(self, x):
+        """값을 추가한다.
+
+        Args:
+            x (float): 추가할 값.
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.__m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self):
+        """표본 분산. 값이 두 개보다 적으면 0."""
+        return self.__m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def get_std_error(self):
+        """평균의 표준 오차를 반환한다.
+
+        Returns:
+            float: 표준 오차. 값이 두 개보다 적으면 inf.
+        """
+        if self.count < 2:
+            return float("inf")
+        return sqrt(self.variance / self.count)
+
+
+class P2Quantile(object):
+    """P² 알고리즘으로 분위수를 추정한다. 값의 개수와 관계없이 5개의 표식만 저장한다.
+
+    Jain, R. and Chlamtac, I. (1985), The P² algorithm for dynamic calculation
+    of quantiles and histograms without storing observations.
+
+    Args:
+        q (float): 0~1 사이의 분위.
+
+    Example:
+    >>> median = P2Quantile(0.5)
+    >>> for x in range(101):
+    ...     median.add(x)
+    >>> median.get()
+    50.0
+
+    Functions:
+        add
+        get
+    """
+
+    def __init__(self, q):
+        self._q = q
+        self._increments = (0.0, q / 2, q, (1 + q) / 2, 1.0)
+        self.__heights = []
+        self.__positions = [1, 2, 3, 4, 5]
+        self.__desired = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self.count = 0
+
+    def add(self, x):
+        """값을 추가한다.
+
+        Args:
+            x (float): 추가할 값.
+        """
+        self.count += 1
+        heights = self.__heights
+        if len(heights) < 5:
+            heights.append(x)
+            heights.sort()
+            return
+
+        if x < heights[0]:
+            heights[0] = x
+            cell = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            cell = 3
+        else:
+            cell = 0
+            while x >= heights[cell + 1]:
+                cell += 1
+
+        positions = self.__positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.__desired[i] += self._increments[i]
+
+        # Move the three middle markers toward their desired positions.
+        for i in (1, 2, 3):
+            d = self.__desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        h, n = self.__heights, self.__positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, step):
+        h, n = self.__heights, self.__positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def get(self):
+        """추정한 분위수를 반환한다.
+
+        Returns:
+            float: 분위수. 값이 없다면 None.
+        """
+        heights = self.__heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            # Too few values for the markers: use the sorted values directly.
+            return heights[min(int(self._q * len(heights)), len(heights) - 1)]
+        return heights[2]
+
+
+class RobustStats(object):
+    """사분위 범위(IQR)를 벗어난 값을 제외하며 평균과 분산을 계산한다.
+
+    모든 값으로 1, 3사분위수를 추정하고, warm_up개 이후의 값은
+    [Q1 - 1.5 IQR, Q3 + 1.5 IQR] 안에 있을 때만 평균과 분산에 반영한다.
+
+    Args:
+        warm_up (int): 이상치 검사 없이 받아들일 값의 개수.
+
+    Functions:
+        add
+        get_quartiles
+    """
+
+    def __init__(self, warm_up=10):
+        self._warm_up = warm_up
+        self.stats = RunningStats()
+        self.rejected = 0
+        self.__q1 = P2Quantile(0.25)
+        self.__q3 = P2Quantile(0.75)
+
+    def add(self, x):
+        """값을 추가한다.
+
+        Args:
+            x (float): 추가할 값.
+
+        Returns:
+            bool: 평균과 분산에 반영했는지 여부.
+        """
+        is_inlier = True
+        if self.__q1.count >= self._warm_up:
+            q1, q3 = self.get_quartiles()
+            iqr = q3 - q1
+            is_inlier = q1 - 1.5 * iqr < x < q3 + 1.5 * iqr
+        self.__q1.add(x)
+        self.__q3.add(x)
+        if is_inlier:
+            self.stats.add(x)
+        else:
+            self.rejected += 1
+        return is_inlier
+
+    def get_quartiles(self):
+        """추정한 1, 3사분위수를 반환한다.
+
+        Returns:
+            tuple: (Q1, Q3). 값이 없다면 (None, None).
+        """
+        return self.__q1.get(), self.__q3.get()
@@ -0,0 +1,416 @@
+"""실행 중 단계별 소요 시간과 횟수를 모아 로그 파일과 로컬 HTTP 주소로 제공한다.
+
+프레임마다 호출하는 count, observe는 고정된 크기의 자료구조만 갱신하므로
+메모리가 늘어나지 않는다. 파일 쓰기는 log_interval마다 한 번만 수행한다.
+"""
+
+import csv
+import json
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter, time
+
+# Upper bounds (seconds) of the latency buckets. The last bucket is unbounded.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.033,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Histogram(object):
+    """고정된 구간(bucket)으로 값의 분포를 센다.
+
+    Args:
+        bounds (tuple): 오름차순으로 정렬한 구간의 상한 값.
+
+    Example:
+    >>> histogram = Histogram()
+    >>> histogram.observe(0.004)
+    >>> histogram.get_quantile(0.5)
+    0.004
+
+    Functions:
+        observe
+        get_quantile
+        get_buckets
+        get_stats
+    """
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self._bounds = tuple(bounds)
+        self.__counts = [0] * (len(self._bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__min = float("inf")
+        self.__max = 0.0
+
+    def observe(self, value):
+        """값을 추가한다.
+
+        Args:
+            value (float): 추가할 값.
+        """
+        self.__counts[bisect_left(self._bounds, value)] += 1
+        self.__count += 1
+        self.__sum += value
+        if value > self.__max:
+            self.__max = value
+        if value < self.__min:
+            self.__min = value
+
+    def get_quantile(self, q):
+        """구간 안에서 선형 보간해 분위수를 추정한다. 관측한 최솟값과 최댓값을 넘지 않는다.
+
+        Args:
+            q (float): 0~1 사이의 분위.
+
+        Returns:
+            float: 추정한 분위수. 값이 없다면 None.
+        """
+        counts = list(self.__counts)
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self._bounds[index - 1] if index else 0.0
+                upper = self._bounds[index] if index < len(self._bounds) else self.__max
+                # Only the observed part of the bucket, so p95 never exceeds max.
+                lower = max(lower, self.__min)
+                upper = min(upper, self.__max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.__max
+
+    def get_buckets(self):
+        """구간별 누적 개수를 반환한다.
+
+        Returns:
+            list: (상한 값, 누적 개수) 목록. 마지막 상한 값은 inf.
+        """
+        buckets = []
+        total = 0
+        for bound, count in zip(self._bounds + (float("inf"),), list(self.__counts)):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def get_stats(self):
+        """분포 요약을 반환한다.
+
+        Returns:
+            dict: 개수, 합, 평균, 최대 값과 p50/p95/p99 추정 값.
+        """
+        count = self.__count
+        return {
+            "count": count,
+            "sum": self.__sum,
+            "mean": self.__sum / count if count else 0.0,
+            "max": self.__max,
+            "p50": self.get_quantile(0.5),
+            "p95": self.get_quantile(0.95),
+            "p99": self.get_quantile(0.99),
+        }
+
+
+class Telemetry(object):
+    """횟수(counter), 단계별 소요 시간(histogram)과 다른 객체의 통계를 모은다.
+
+    count와 observe는 탐지 스레드에서만 호출한다. 다른 스레드의 통계(입력 동작 큐 등)는
+    add_collector로 등록해 두고 snapshot을 만들 때 읽는다.
+
+    Args:
+        log_path (str): 통계를 주기적으로 기록할 파일 경로. 확장자가 .csv이면 CSV,
+            그 외에는 한 줄에 하나의 JSON으로 기록한다. None이면 기록하지 않는다.
+        log_interval (float): 통계를 기록하는 간격(초).
+        max_bytes (int): 로그 파일의 최대 크기. 넘으면 이전 파일을 '.1'로 옮긴다.
+        prefix (str): Prometheus 지표 이름의 접두어.
+
+    Example:
+    >>> telemetry = Telemetry("telemetry.jsonl")
+    >>> telemetry.serve(9464)  # http://127.0.0.1:9464/metrics
+    >>> start = perf_counter()
+    >>> telemetry.observe("facemesh", perf_counter() - start)
+    >>> telemetry.count("frames")
+    >>> telemetry.check()  # between frames
+
+    Functions:
+        count
+        observe
+        get_counter
+        add_collector
+        snapshot
+        check
+        write_log
+        to_prometheus
+        serve
+        release
+    """
+
+    def __init__(
+        self, log_path=None, log_interval=10.0, max_bytes=1 << 20, prefix="facemouse"
+    ):
+        self._log_path = log_path
+        self._log_interval = log_interval
+        self._max_bytes = max_bytes
+        self._prefix = prefix
+        self._is_csv = log_path is not None and log_path.endswith(".csv")
+        self.__counters = {}
+        self.__histograms = {}
+        self.__collectors = {}
+        self.__start_time = perf_counter()
+        self.__next_log = self.__start_time + log_interval
+        self.__server = None
+        self.__server_thread = None
+
+    def count(self, name, n=1):
+        """횟수를 더한다.
+
+        Args:
+            name (str): 지표 이름.
+            n (int): 더할 값.
+        """
+        counters = self.__counters
+        counters[name] = counters.get(name, 0) + n
+
+    def observe(self, name, seconds):
+        """단계의 소요 시간을 추가한다.
+
+        Args:
+            name (str): 단계 이름.
+            seconds (float): 소요 시간(초).
+        """
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    def get_counter(self, name):
+        """횟수를 반환한다.
+
+        Args:
+            name (str): 지표 이름.
+
+        Returns:
+            int: 지금까지 더한 값.
+        """
+        return self.__counters.get(name, 0)
+
+    def add_collector(self, name, function):
+        """snapshot을 만들 때 호출할 통계 함수를 등록한다.
+
+        Args:
+            name (str): 통계 이름.
+            function (callable): 값이 숫자인 dict를 반환하는 함수.
+        """
+        self.__collectors[name] = function
+
+    def snapshot(self):
+        """현재 통계를 반환한다. 어느 스레드에서든 호출할 수 있다.
+
+        Returns:
+            dict: 시각(time), 실행 시간(uptime), counters, stages(단계별 분포 요약),
+            그리고 등록한 통계 이름별 값.
+        """
+        # dict() copies without running Python code, so the detection thread
+        # cannot change the dicts halfway through.
+        result = {
+            "time": time(),
+            "uptime": perf_counter() - self.__start_time,
+            "counters": dict(self.__counters),
+            "stages": {
+                name: histogram.get_stats()
+                for name, histogram in dict(self.__histograms).items()
+            },
+        }
+        for name, function in dict(self.__collectors).items():
+            result[name] = function()
+        return result
+
+    def check(self, now=None):
+        """기록할 시점이 되었다면 통계를 로그 파일에 기록한다. 프레임 사이에 호출한다.
+
+        Args:
+            now (float): 현재 시각. None이면 time.perf_counter 값을 사용한다.
+
+        Returns:
+            bool: 기록 여부.
+        """
+        if self._log_path is None:
+            return False
+        if now is None:
+            now = perf_counter()
+        if now < self.__next_log:
+            return False
+        self.__next_log = now + self._log_interval
+        self.write_log()
+        return True
+
+    def write_log(self, snapshot=None):
+        """통계를 로그 파일에 한 줄 추가한다.
+
+        Args:
+            snapshot (dict): 기록할 통계. None이면 현재 통계를 기록한다.
+        """
+        if self._log_path is None:
+            return
+        if snapshot is None:
+            snapshot = self.snapshot()
+        self._rotate_log()
+        try:
+            if self._is_csv:
+                self._write_csv(_flatten(snapshot))
+            else:
+                with open(self._log_path, "a", encoding="utf-8") as file:
+                    file.write(json.dumps(snapshot) + "\n")
+        except OSError:
+            pass  # Telemetry must never stop the detection loop.
+
+    def _rotate_log(self):
+        try:
+            if os.path.getsize(self._log_path) < self._max_bytes:
+                return
+            os.replace(self._log_path, f"{self._log_path}.1")
+        except OSError:
+            pass
+
+    def _write_csv(self, row):
+        try:
+            with open(self._log_path, "r", encoding="utf-8", newline="") as file:
+                reader = csv.DictReader(file)
+                fields = reader.fieldnames
+                new_fields = [name for name in row if name not in (fields or ())]
+                rows = list(reader) if fields and new_fields else None
+        except OSError:
+            fields = rows = None
+        if rows is not None:
+            # A metric seen for the first time (e.g. the first blink) widens
+            # the header; earlier rows are rewritten with empty cells.
+            fields = fields + new_fields
+            self._rewrite_csv(fields, rows)
+        with open(self._log_path, "a", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fields or list(row))
+            if fields is None:
+                writer.writeheader()
+            writer.writerow(row)
+
+    def _rewrite_csv(self, fields, rows):
+        # At most max_bytes, and only when a new metric appears.
+        temp_path = f"{self._log_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fields)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(temp_path, self._log_path)
+
+    def to_prometheus(self):
+        """통계를 Prometheus 텍스트 형식으로 바꾼다.
+
+        Returns:
+            str: Prometheus 텍스트 형식의 지표.
+        """
+        prefix = self._prefix
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_uptime_seconds gauge",
+            f"{prefix}_uptime_seconds {snapshot['uptime']}",
+        ]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+
+        histograms = sorted(dict(self.__histograms).items())
+        if histograms:
+            metric = f"{prefix}_stage_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+        for name, histogram in histograms:
+            for bound, total in histogram.get_buckets():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{stage="{name}",le="{le}"}} {total}')
+            stats = histogram.get_stats()
+            lines.append(f'{metric}_sum{{stage="{name}"}} {stats["sum"]}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {stats["count"]}')
+
+        for key in snapshot:
+            if key in ("time", "uptime", "counters", "stages"):
+                continue
+            for name, value in sorted(_flatten(snapshot[key], key).items()):
+                lines.append(f"# TYPE {prefix}_{name} gauge")
+                lines.append(f"{prefix}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port, host="127.0.0.1"):
+        """'/metrics' 주소로 Prometheus 지표를 제공하는 HTTP 서버를 시작한다.
+
+        Args:
+            port (int): 포트 번호. 0이면 비어 있는 포트를 사용한다.
+            host (str): 주소. 기본 값은 이 컴퓨터에서만 접근할 수 있다.
+
+        Returns:
+            int: 서버의 포트 번호.
+        """
+        if self.__server is None:
+            self.__server = ThreadingHTTPServer((host, port), _make_handler(self))
+            self.__server.daemon_threads = True
+            self.__server_thread = threading.Thread(
+                target=self.__server.serve_forever, daemon=True
+            )
+            self.__server_thread.start()
+        return self.__server.server_address[1]
+
+    def release(self):
+        """HTTP 서버를 멈추고 마지막 통계를 기록한다."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server_thread.join(timeout=1)
+            self.__server = None
+            self.__server_thread = None
+        self.write_log()
+
+
+def _flatten(values, prefix=""):
+    # Nested stats become "stages_facemesh_p95" style names with numeric values.
+    result = {}
+    for key, value in values.items():
+        name = f"{prefix}_{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            result.update(_flatten(value, name))
+        elif isinstance(value, bool):
+            result[name] = int(value)
+        elif isinstance(value, (int, float)):
+            result[name] = value
+    return result
+
+
+def _make_handler(telemetry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = telemetry.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep scrapes out of the console.
+
+    return MetricsHandler
@@ -0,0 +1,48 @@
+"""카메라 모드 확인
+
+카메라가 지원하는 모드를 확인해 가장 가벼운 모드를 저장한다.
+V4L2 loopback 장치나 영상 파일로도 실행할 수 있다.
+
+Example:
+    python probe_camera.py 0
+    python probe_camera.py /dev/video10 --list
+    python probe_camera.py session.mp4 --no-save
+"""
+
+import argparse
+import json
+
+from module.camera import list_modes, open_camera, probe_camera
+from module.settings import load_cam_id
+
+parser = argparse.ArgumentParser(description="Probe and cache the camera mode.")
+parser.add_argument(
+    "device", nargs="?", default=None, help="camera index, device path or video file"
+)
+parser.add_argument("--list", action="store_true", help="print every accepted mode")
+parser.add_argument(
+    "--no-save", action="store_true", help="do not overwrite the cached profile"
+)
+args = parser.parse_args()
+
+device = args.device
+if device is None:
+    device = load_cam_id()
+elif device.isdigit():
+    device = int(device)
+
+if args.no_save:
+    import cv2
+
+    capture = cv2.VideoCapture(device)
+    profile = probe_camera(capture) if capture.isOpened() else None
+else:
+    capture, profile = open_camera(device, reprobe=True)
+if profile is None:
+    raise SystemExit(f"Cannot open camera: {device}")
+
+if args.list:
+    for mode in list_modes(capture):
+        print(json.dumps(mode))
+print(json.dumps(profile))
+capture.release()